@@ -0,0 +1,158 @@
+"""
+aspect_patterns.py
+Multi-body aspect patterns: grand trines, T-squares, grand crosses, yods
+and kites.
+
+`detect_aspects` output is turned into one adjacency bitset per body and
+aspect type (a Python int, bit j set when the body aspects body j). Each
+pattern is then grown from a seed aspect by intersecting the members'
+bitsets, so candidates that cannot complete the motif are never
+enumerated — no walk over every triple or quadruple of points.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from backend.astro_engine.aspects_detector import DEFAULT_ASPECT_DEFS
+from backend.astro_engine.models.chart_model import AspectLink, AspectPattern
+
+PATTERN_KINDS: Tuple[str, ...] = ("grand_cross", "kite", "grand_trine", "t_square", "yod")
+
+_BASE_ORBS: Dict[str, float] = {name: float(orb) for name, _, orb in DEFAULT_ASPECT_DEFS}
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indices of set bits, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class AspectGraph:
+    """Per-aspect-type adjacency bitsets over the points of one chart."""
+
+    def __init__(self, aspects: Iterable[AspectLink], names: Optional[Sequence[str]] = None):
+        aspects = list(aspects)
+        if names is None:
+            names = list(dict.fromkeys(n for a in aspects for n in (a.p1, a.p2)))
+        self.names: List[str] = list(names)
+        self.index: Dict[str, int] = {n: k for k, n in enumerate(self.names)}
+        self.adj: Dict[str, List[int]] = {}
+        self.links: Dict[Tuple[int, int, str], AspectLink] = {}
+        for a in aspects:
+            i, j = self.index.get(a.p1), self.index.get(a.p2)
+            if i is None or j is None:
+                continue
+            row = self.adj.setdefault(a.aspect, [0] * len(self.names))
+            row[i] |= 1 << j
+            row[j] |= 1 << i
+            self.links[(min(i, j), max(i, j), a.aspect)] = a
+
+    def mask(self, aspect: str, i: int) -> int:
+        row = self.adj.get(aspect)
+        return row[i] if row else 0
+
+    def link(self, i: int, j: int, aspect: str) -> AspectLink:
+        return self.links[(min(i, j), max(i, j), aspect)]
+
+    def edges(self, aspect: str) -> Iterator[Tuple[int, int]]:
+        """Each (i, j) with i < j once."""
+        row = self.adj.get(aspect)
+        if not row:
+            return
+        for i, m in enumerate(row):
+            for j in _bits(m >> (i + 1)):
+                yield i, i + 1 + j
+
+
+# ------------------------------------------------------------
+# Motif search
+# ------------------------------------------------------------
+def _grand_trines(g: AspectGraph) -> Iterator[Tuple[Tuple[int, ...], Optional[int], List[Tuple[int, int, str]]]]:
+    for i, j in g.edges("trine"):
+        # third vertex above j, so every triangle is produced once
+        for k in _bits(g.mask("trine", i) & g.mask("trine", j) & ~((1 << (j + 1)) - 1)):
+            yield (i, j, k), None, [(i, j, "trine"), (i, k, "trine"), (j, k, "trine")]
+
+
+def _t_squares(g: AspectGraph):
+    for i, j in g.edges("opposition"):
+        for apex in _bits(g.mask("square", i) & g.mask("square", j)):
+            yield (i, j, apex), apex, [(i, j, "opposition"), (i, apex, "square"), (j, apex, "square")]
+
+
+def _grand_crosses(g: AspectGraph):
+    for i, j in g.edges("opposition"):
+        both = g.mask("square", i) & g.mask("square", j)
+        for k in _bits(both):
+            # the opposite corner must also square i and j; k < l and i < min(k, l) keep one copy
+            for l in _bits(g.mask("opposition", k) & both & ~((1 << (k + 1)) - 1)):
+                if i < k:
+                    yield (i, j, k, l), None, [
+                        (i, j, "opposition"), (k, l, "opposition"),
+                        (i, k, "square"), (i, l, "square"), (j, k, "square"), (j, l, "square"),
+                    ]
+
+
+def _yods(g: AspectGraph):
+    for i, j in g.edges("sextile"):
+        for apex in _bits(g.mask("quincunx", i) & g.mask("quincunx", j)):
+            yield (i, j, apex), apex, [(i, j, "sextile"), (i, apex, "quincunx"), (j, apex, "quincunx")]
+
+
+def _kites(g: AspectGraph):
+    for (i, j, k), _, edges in _grand_trines(g):
+        for head, (a, b) in ((i, (j, k)), (j, (i, k)), (k, (i, j))):
+            for tail in _bits(g.mask("opposition", head) & g.mask("sextile", a) & g.mask("sextile", b)):
+                yield (i, j, k, tail), head, edges + [
+                    (head, tail, "opposition"), (a, tail, "sextile"), (b, tail, "sextile"),
+                ]
+
+
+_SEARCH = {
+    "grand_trine": _grand_trines,
+    "t_square": _t_squares,
+    "grand_cross": _grand_crosses,
+    "yod": _yods,
+    "kite": _kites,
+}
+
+
+def _strength(links: Sequence[AspectLink]) -> float:
+    """Mean tightness of the member aspects: 1 = exact, 0 = at the base orb."""
+    if not links:
+        return 0.0
+    tight = [max(0.0, 1.0 - l.orb / _BASE_ORBS.get(l.aspect, 8.0)) for l in links]
+    return round(sum(tight) / len(tight), 3)
+
+
+def detect_aspect_patterns(
+    aspects: Iterable[AspectLink],
+    names: Optional[Sequence[str]] = None,
+    kinds: Iterable[str] = PATTERN_KINDS,
+    graph: Optional[AspectGraph] = None,
+) -> List[AspectPattern]:
+    """
+    All patterns of the requested kinds, strongest first. T-squares and
+    grand trines that are part of a grand cross or kite are still reported
+    on their own; callers that want only the largest figure can filter on
+    `bodies`.
+    """
+    g = graph if graph is not None else AspectGraph(aspects, names)
+    out: List[AspectPattern] = []
+    for kind in kinds:
+        if kind not in _SEARCH:
+            raise ValueError(f"Unknown aspect pattern '{kind}'. Available: {list(PATTERN_KINDS)}")
+        for members, apex, edges in _SEARCH[kind](g):
+            links = [g.link(a, b, asp) for a, b, asp in edges]
+            out.append(AspectPattern(
+                kind=kind,
+                bodies=[g.names[m] for m in members],
+                apex=g.names[apex] if apex is not None else None,
+                links=links,
+                max_orb=max(l.orb for l in links),
+                strength=_strength(links),
+            ))
+    out.sort(key=lambda p: (-p.strength, PATTERN_KINDS.index(p.kind)))
+    return out
@@ -1,5 +1,10 @@
 # backend/astro_engine/aspects_detector.py
+from functools import lru_cache
 from typing import Dict, Iterable, List, Tuple, Optional
+
+import numpy as np
+
+from backend.astro_engine.astro_config import ASPECT_ORBS
 from backend.astro_engine.models.chart_model import AspectLink
 
 # (name, angle, base_orb)
@@ -17,6 +22,11 @@ def _angle_diff(a: float, b: float) -> float:
     d = abs((a - b + 180.0) % 360.0 - 180.0)
     return d
 
+@lru_cache(maxsize=64)
+def _unique_pairs(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Index arrays (i, j) of all pairs i < j, in the same order as a nested loop."""
+    return np.triu_indices(n, k=1)
+
 def detect_aspects(
     lon_map: Dict[str, float],
     aspect_defs: Iterable[Tuple[str, int, int]] = DEFAULT_ASPECT_DEFS,
@@ -27,37 +37,75 @@ def detect_aspects(
     Detect aspects among bodies in lon_map.
     lon_map: {'Sun': 56.1, 'Moon': 320.5, ...}
     include_pairs: optional explicit pairs to check; if None, all unique pairs.
+
+    All pairs × aspect types are tested as one (pairs, aspects) array, so
+    the cost stays flat as the body set grows.
     """
     names = list(lon_map.keys())
-    pairs: List[Tuple[str, str]]
+    index = {n: k for k, n in enumerate(names)}
     if include_pairs:
         pairs = list(include_pairs)
+        i = np.array([index[a] for a, _ in pairs], dtype=np.intp)
+        j = np.array([index[b] for _, b in pairs], dtype=np.intp)
     else:
-        pairs = []
-        for i in range(len(names)):
-            for j in range(i + 1, len(names)):
-                pairs.append((names[i], names[j]))
-
-    results: List[AspectLink] = []
-    for p1, p2 in pairs:
-        a1 = lon_map[p1]
-        a2 = lon_map[p2]
-        sep = _angle_diff(a1, a2)
-        for name, angle, base_orb in aspect_defs:
-            orb = base_orb
-            if p1 == "Moon" or p2 == "Moon":
-                orb = max(orb, base_orb + moon_extra_orb)
-            delta = abs(sep - angle)
-            if delta <= orb:
-                results.append(
-                    AspectLink(
-                        p1=p1,
-                        p2=p2,
-                        aspect=name,
-                        angle=round(sep, 3),
-                        orb=round(delta, 3),
-                    )
-                )
+        i, j = _unique_pairs(len(names))
+    defs = list(aspect_defs)
+    if not len(i) or not defs:
+        return []
+
+    lons = np.array([lon_map[n] for n in names], dtype=np.float64)
+    sep = np.abs((lons[i] - lons[j] + 180.0) % 360.0 - 180.0)            # (pairs,)
+    angles = np.array([d[1] for d in defs], dtype=np.float64)
+    orbs = np.array([d[2] for d in defs], dtype=np.float64)
+    moon = index.get("Moon", -1)
+    has_moon = ((i == moon) | (j == moon))[:, None]
+    allowed = np.where(has_moon, np.maximum(orbs, orbs + moon_extra_orb), orbs)  # (pairs, aspects)
+    delta = np.abs(sep[:, None] - angles)
+    hit_pair, hit_def = np.nonzero(delta <= allowed)                      # pair-major order
+
+    results: List[AspectLink] = [
+        AspectLink(
+            p1=names[i[p]],
+            p2=names[j[p]],
+            aspect=defs[d][0],
+            angle=round(float(sep[p]), 3),
+            orb=round(float(delta[p, d]), 3),
+        )
+        for p, d in zip(hit_pair.tolist(), hit_def.tolist())
+    ]
     # sort by tightness (smaller orb first)
     results.sort(key=lambda x: (x.orb, abs(x.angle - 180.0)))
     return results
+
+
+def detect_parallels(
+    decl_map: Dict[str, float],
+    orb: float = ASPECT_ORBS["parallel"],
+) -> List[AspectLink]:
+    """
+    Parallels (same declination, same hemisphere) and contra-parallels
+    (equal declination, opposite hemispheres), with the same pair arrays
+    as `detect_aspects`. `angle` is the declination difference (parallel)
+    or sum (contra-parallel) — the quantity compared with the orb.
+    """
+    names = list(decl_map.keys())
+    i, j = _unique_pairs(len(names))
+    if not len(i):
+        return []
+    dec = np.array([decl_map[n] for n in names], dtype=np.float64)
+    same_side = np.sign(dec[i]) == np.sign(dec[j])
+    delta = np.where(same_side, np.abs(dec[i] - dec[j]), np.abs(dec[i] + dec[j]))
+    hits = np.nonzero(delta <= orb)[0]
+
+    results = [
+        AspectLink(
+            p1=names[i[p]],
+            p2=names[j[p]],
+            aspect="parallel" if same_side[p] else "contraparallel",
+            angle=round(float(delta[p]), 3),
+            orb=round(float(delta[p]), 3),
+        )
+        for p in hits.tolist()
+    ]
+    results.sort(key=lambda x: x.orb)
+    return results
@@ -73,3 +73,96 @@ CONTEXT_RULES = {
     "speed_fast_bonus": 1.10,
     "speed_slow_penalty": 0.90,
 }
+
+# Sun-distance bands (degrees): cazimi / combust / under the beams
+SUN_PROXIMITY_ORBS = (0.3, 8.5, 17.0)
+
+# Mean geocentric daily motion in longitude (degrees/day) for speed ratios;
+# the lunar nodes move backwards on average
+MEAN_DAILY_MOTION = {
+    "Sun": 0.9856, "Moon": 13.1764, "Mercury": 0.9856, "Venus": 0.9856,
+    "Mars": 0.5240, "Jupiter": 0.0831, "Saturn": 0.0335, "Uranus": 0.0117,
+    "Neptune": 0.0060, "Pluto": 0.0040,
+    "North Node": -0.0530, "South Node": -0.0530, "Lilith": 0.1114, "Chiron": 0.0195,
+}
+HOUSE_TYPES = ("angular", "succedent", "cadent")   # houses 1/4/7/10, 2/5/8/11, 3/6/9/12
+
+# ==========================================================
+# Astrocartography
+# ==========================================================
+ACG_ANGLES = ("ASC", "DSC", "MC", "IC")
+ACG_MAX_LATITUDE = 85.0       # map projections break down beyond this
+ACG_INFLUENCE_ORB = 3.0       # degrees (ground distance / altitude) → 1σ of the falloff
+
+# ==========================================================
+# House systems (name → Swiss Ephemeris code)
+# ==========================================================
+HOUSE_SYSTEMS = {
+    "placidus": "P",
+    "koch": "K",
+    "equal": "E",
+    "whole_sign": "W",
+    "regiomontanus": "R",
+    "porphyry": "O",
+}
+DEFAULT_HOUSE_SYSTEM = "placidus"
+HOUSE_CUSP_CACHE_SIZE = 4096
+
+# ==========================================================
+# Zodiac modes (name → Swiss Ephemeris SIDM_* constant; None = tropical)
+# ==========================================================
+ZODIAC_MODES = {
+    "tropical": None,
+    "lahiri": 1,          # swe.SIDM_LAHIRI
+    "raman": 3,           # swe.SIDM_RAMAN
+    "krishnamurti": 5,    # swe.SIDM_KRISHNAMURTI
+}
+DEFAULT_ZODIAC = "tropical"
+AYANAMSA_TABLE_YEARS = (1800, 2200)
+AYANAMSA_TABLE_STEP_DAYS = 5.0     # linear interpolation error < 0.25"
+
+# ==========================================================
+# Fixed stars
+# ==========================================================
+FIXED_STAR_ORB = 1.0                   # degrees of longitude
+GENERAL_PRECESSION_ARCSEC = (5029.0966, 1.11113)   # p_A = a·T + b·T² (T in Julian centuries)
+
+# ==========================================================
+# Midpoints (cosmobiology)
+# ==========================================================
+MIDPOINT_DIALS = (360, 90, 45)
+MIDPOINT_ORB = 1.5                     # degrees on the dial
+
+# ==========================================================
+# Harmonics
+# ==========================================================
+HARMONIC_MAX = 32
+HARMONIC_ORB = 6.0                     # degrees in the harmonic chart
+
+# ==========================================================
+# Birth-time uncertainty (Monte Carlo)
+# ==========================================================
+UNCERTAINTY_MAX_MINUTES = 720          # ±12 h
+UNCERTAINTY_MAX_SAMPLES = 5000
+
+# ==========================================================
+# Birth-time rectification
+# ==========================================================
+RECTIFICATION_MAX_WINDOW_HOURS = 72
+RECTIFICATION_MAX_CANDIDATES = 20_000  # 72 h at a 15 s step
+RECTIFICATION_MAX_TOP_K = 100
+
+# ==========================================================
+# Relocation
+# ==========================================================
+RELOCATION_MAX_LOCATIONS = 10_000      # one vectorized batch per request
+
+# ==========================================================
+# Relationship charts (composite / Davison)
+# ==========================================================
+RELATIONSHIP_MAX_PEOPLE = 50           # 1,225 pairs
+
+# ==========================================================
+# Stored charts
+# ==========================================================
+CHART_ENGINE_VERSION = 2               # bump when chart output changes; stored charts are recomputed
@@ -0,0 +1,179 @@
+"""
+astrocartography.py
+Planetary angle lines (ASC / DSC / MC / IC) for one birth instant, and a
+per-cell influence raster over the world.
+
+Both come straight from each body's right ascension and declination:
+  MC / IC   — the geographic longitude where local sidereal time equals
+              RA (or RA + 180°): a meridian, no iteration needed.
+  ASC / DSC — for every longitude the hour angle H is known, and the body
+              is on the horizon at latitude φ = atan(−cos H / tan δ);
+              rising where sin H < 0, setting where sin H > 0.
+Longitudes are evaluated as one NumPy array per body, so a full map costs
+ten ephemeris calls instead of one house computation per grid point.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from backend.astro_engine.astro_config import ACG_ANGLES, ACG_MAX_LATITUDE, ACG_INFLUENCE_ORB
+from backend.astro_engine.ephemeris_loader import FLAGS, PLANETS, ecliptic_to_equatorial
+from backend.astro_engine.house_batch import nutation_frame, sidereal_degrees
+from backend.astro_engine.time_utils import resolve_tz, local_to_utc, to_julian_day
+from backend.astro_engine.zodiac_utils import wrap180
+
+
+def planet_equatorial(jd_ut: float, bodies: Optional[Iterable[str]] = None) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """(names, RA[P], Dec[P]) in degrees, apparent of date."""
+    names = list(bodies or PLANETS.keys())
+    ecl = np.array([swe.calc_ut(jd_ut, PLANETS[n], flags=FLAGS)[0][:2] for n in names])
+    eps, _ = nutation_frame(jd_ut)
+    ra, dec = ecliptic_to_equatorial(ecl[:, 0], ecl[:, 1], eps)
+    return names, ra, dec
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """[start, stop) index ranges of consecutive True values."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return list(zip(np.nonzero(edges == 1)[0], np.nonzero(edges == -1)[0]))
+
+
+def _feature(body: str, angle: str, lines: List[List[List[float]]]) -> Dict[str, object]:
+    return {
+        "type": "Feature",
+        "properties": {"body": body, "angle": angle},
+        "geometry": {"type": "MultiLineString", "coordinates": lines},
+    }
+
+
+# ------------------------------------------------------------
+# Lines
+# ------------------------------------------------------------
+def astrocartography_lines(
+    jd_ut: float,
+    step_deg: float = 0.5,
+    max_lat: float = ACG_MAX_LATITUDE,
+    bodies: Optional[Iterable[str]] = None,
+) -> Dict[str, object]:
+    """
+    GeoJSON FeatureCollection with one MultiLineString per (body, angle).
+    Coordinates are [lon, lat]; horizon lines are sampled every `step_deg`
+    of longitude and split at the map edge and at ±max_lat.
+    """
+    names, ra, dec = planet_equatorial(jd_ut, bodies)
+    _, eq_eq = nutation_frame(jd_ut)
+    gast = float(sidereal_degrees(jd_ut, eq_eq))
+
+    geo_lon = np.arange(-180.0, 180.0 + step_deg / 2, step_deg)
+    H = np.radians(gast + geo_lon[None, :] - ra[:, None])            # (P, L)
+    with np.errstate(divide="ignore"):
+        phi = np.degrees(np.arctan(-np.cos(H) / np.tan(np.radians(dec))[:, None]))
+    on_map = np.abs(phi) <= max_lat
+    rising = np.sin(H) < 0
+    mc_lon = wrap180(ra - gast)
+
+    features: List[Dict[str, object]] = []
+    for k, body in enumerate(names):
+        for angle, lon0 in (("MC", mc_lon[k]), ("IC", wrap180(mc_lon[k] + 180.0))):
+            features.append(_feature(body, angle, [[[round(float(lon0), 4), -max_lat], [round(float(lon0), 4), max_lat]]]))
+        for angle, side in (("ASC", rising[k]), ("DSC", ~rising[k])):
+            coords = np.round(np.stack([geo_lon, phi[k]], axis=-1), 4)
+            segments = [coords[a:b].tolist() for a, b in _runs(side & on_map[k]) if b - a > 1]
+            features.append(_feature(body, angle, segments))
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+# ------------------------------------------------------------
+# Influence raster
+# ------------------------------------------------------------
+def influence_raster(
+    jd_ut: float,
+    resolution_deg: float = 1.0,
+    orb_deg: float = ACG_INFLUENCE_ORB,
+    weights: Optional[Dict[str, float]] = None,
+    angles: Sequence[str] = ACG_ANGLES,
+    bodies: Optional[Iterable[str]] = None,
+) -> Dict[str, object]:
+    """
+    Gaussian closeness to every selected (body, angle) line, per grid cell.
+    Horizon closeness uses the body's altitude, meridian closeness the
+    hour-angle distance scaled by cos(latitude) — both in degrees, so one
+    `orb_deg` applies to all four angles.
+
+    Returns cell-centre `lats` / `lons`, the summed `values` (lat × lon,
+    float32) and the index into `bodies` of the strongest body per cell.
+    """
+    unknown = set(angles) - set(ACG_ANGLES)
+    if unknown:
+        raise ValueError(f"Unknown angles {sorted(unknown)}. Available: {list(ACG_ANGLES)}")
+    names, ra, dec = planet_equatorial(jd_ut, bodies)
+    _, eq_eq = nutation_frame(jd_ut)
+    gast = float(sidereal_degrees(jd_ut, eq_eq))
+
+    lats = np.arange(-90.0 + resolution_deg / 2, 90.0, resolution_deg)
+    lons = np.arange(-180.0 + resolution_deg / 2, 180.0, resolution_deg)
+    sin_phi = np.sin(np.radians(lats))[:, None]
+    cos_phi = np.cos(np.radians(lats))[:, None]
+    inv_two_sigma2 = 0.5 / (orb_deg * orb_deg)
+
+    total = np.zeros((len(lats), len(lons)), dtype=np.float32)
+    best = np.zeros_like(total)
+    dominant = np.zeros(total.shape, dtype=np.int8)
+    for k, body in enumerate(names):
+        w = (weights or {}).get(body, 1.0)
+        if w == 0:
+            continue
+        h_deg = wrap180(gast + lons - ra[k])[None, :]                # (1, L)
+        h = np.radians(h_deg)
+        layer = np.zeros(total.shape)
+        if "ASC" in angles or "DSC" in angles:
+            d = np.radians(dec[k])
+            alt = np.degrees(np.arcsin(np.clip(sin_phi * np.sin(d) + cos_phi * np.cos(d) * np.cos(h), -1.0, 1.0)))
+            horizon = np.exp(-inv_two_sigma2 * alt * alt)
+            side = np.sin(h) < 0
+            layer += horizon * (("ASC" in angles) * side + ("DSC" in angles) * ~side)
+        if "MC" in angles:
+            layer += np.exp(-inv_two_sigma2 * (h_deg * cos_phi) ** 2)
+        if "IC" in angles:
+            layer += np.exp(-inv_two_sigma2 * ((180.0 - np.abs(h_deg)) * cos_phi) ** 2)
+        layer = (w * layer).astype(np.float32)
+        total += layer
+        stronger = layer > best
+        best = np.where(stronger, layer, best)
+        dominant[stronger] = k
+
+    return {
+        "bodies": names,
+        "resolution_deg": resolution_deg,
+        "lats": lats,
+        "lons": lons,
+        "values": total,
+        "dominant": dominant,
+    }
+
+
+def build_astrocartography(
+    dt_local: datetime,
+    lat: float,
+    lon: float,
+    tz_name: Optional[str] = None,
+    line_step_deg: float = 0.5,
+    resolution_deg: Optional[float] = None,
+    orb_deg: float = ACG_INFLUENCE_ORB,
+) -> Dict[str, object]:
+    """Lines (and optionally the raster) for a local birth time and place."""
+    tz = tz_name or resolve_tz(lat, lon)
+    dt_utc = local_to_utc(dt_local, tz)
+    jd_ut = to_julian_day(dt_utc)
+    result: Dict[str, object] = {
+        "meta": {"tz_name": tz, "dt_utc": dt_utc.isoformat(), "jd_ut": f"{jd_ut:.6f}"},
+        "lines": astrocartography_lines(jd_ut, step_deg=line_step_deg),
+    }
+    if resolution_deg:
+        result["raster"] = influence_raster(jd_ut, resolution_deg=resolution_deg, orb_deg=orb_deg)
+    return result
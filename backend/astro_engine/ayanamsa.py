@@ -0,0 +1,82 @@
+"""
+ayanamsa.py
+Precomputed ayanamsa tables for the sidereal zodiac modes.
+
+Each mode's true ayanamsa (precession + nutation, as used by Swiss
+Ephemeris sidereal positions) is tabulated once over the supported date
+range and linearly interpolated afterwards, so charts never touch the
+global `swe.set_sid_mode` state on the request path.
+"""
+
+from __future__ import annotations
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+import swisseph as swe
+
+from backend.astro_engine.astro_config import (
+    ZODIAC_MODES, DEFAULT_ZODIAC, AYANAMSA_TABLE_YEARS, AYANAMSA_TABLE_STEP_DAYS,
+)
+from backend.astro_engine.time_utils import to_julian_day
+
+# swe.set_sid_mode is process-global; only table builds change it
+_SID_MODE_LOCK = threading.Lock()
+
+
+def resolve_zodiac(zodiac: str) -> str:
+    """Validate a zodiac mode name."""
+    if zodiac not in ZODIAC_MODES:
+        raise ValueError(f"Unknown zodiac '{zodiac}'. Available: {sorted(ZODIAC_MODES)}")
+    return zodiac
+
+
+def _direct(jd_ut: float, mode: int) -> float:
+    with _SID_MODE_LOCK:
+        swe.set_sid_mode(mode)
+        try:
+            return swe.get_ayanamsa_ex_ut(jd_ut, 0)[1]
+        finally:
+            swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)
+
+
+@lru_cache(maxsize=None)
+def ayanamsa_table(zodiac: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(jds, ayanamsa degrees) sampled every AYANAMSA_TABLE_STEP_DAYS."""
+    mode = ZODIAC_MODES[resolve_zodiac(zodiac)]
+    y0, y1 = AYANAMSA_TABLE_YEARS
+    jds = np.arange(to_julian_day(datetime(y0, 1, 1)),
+                    to_julian_day(datetime(y1 + 1, 1, 1)) + AYANAMSA_TABLE_STEP_DAYS,
+                    AYANAMSA_TABLE_STEP_DAYS)
+    values = np.empty(len(jds))
+    with _SID_MODE_LOCK:
+        swe.set_sid_mode(mode)
+        try:
+            for i, jd in enumerate(jds):
+                values[i] = swe.get_ayanamsa_ex_ut(float(jd), 0)[1]
+        finally:
+            swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)
+    jds.flags.writeable = False
+    values.flags.writeable = False
+    return jds, values
+
+
+def ayanamsa(jd_ut, zodiac: str = DEFAULT_ZODIAC):
+    """
+    Ayanamsa in degrees for a Julian Day (scalar or array); 0 for tropical.
+    Instants outside the table fall back to a direct Swiss Ephemeris call.
+    """
+    if ZODIAC_MODES[resolve_zodiac(zodiac)] is None:
+        return np.zeros_like(jd_ut, dtype=np.float64) if np.ndim(jd_ut) else 0.0
+    jds, values = ayanamsa_table(zodiac)
+    if np.ndim(jd_ut) == 0:
+        if not jds[0] <= jd_ut <= jds[-1]:
+            return _direct(float(jd_ut), ZODIAC_MODES[zodiac])
+        return float(np.interp(jd_ut, jds, values))
+    out = np.interp(jd_ut, jds, values)
+    outside = (jd_ut < jds[0]) | (jd_ut > jds[-1])
+    for i in np.nonzero(outside)[0]:
+        out[i] = _direct(float(jd_ut[i]), ZODIAC_MODES[zodiac])
+    return out
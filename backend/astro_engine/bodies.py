@@ -0,0 +1,130 @@
+"""
+bodies.py
+Registry of chartable bodies and named body sets.
+
+Positions for a whole body set are written into one preallocated
+(bodies × 6) array — lon, lat, dist, lon speed, lat speed, dist speed —
+so adding bodies costs one Swiss Ephemeris call each and no per-body
+dict construction. Given the obliquity, right ascension and declination
+are appended as two more columns from the same ecliptic values. Bodies derived from another one (the South Node) are
+filled in from their source row without an extra call.
+
+Chiron and the asteroids need the `seas_*.se1` / `se*.se1` files in
+`data/ephemeris`; when a file is missing that body's row is NaN and
+callers report it instead of failing the whole chart.
+"""
+
+from __future__ import annotations
+import re
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import swisseph as swe
+
+from backend.astro_engine.ephemeris_loader import FLAGS, PLANETS, ecliptic_to_equatorial
+
+# --------------------------------------------------------------------
+# 🪐 Registry
+# --------------------------------------------------------------------
+BODIES: Dict[str, int] = {
+    **PLANETS,
+    "North Node": swe.TRUE_NODE,
+    "Lilith": swe.MEAN_APOG,       # Black Moon Lilith (mean lunar apogee)
+    "Chiron": swe.CHIRON,
+    "Ceres": swe.CERES,
+    "Pallas": swe.PALLAS,
+    "Juno": swe.JUNO,
+    "Vesta": swe.VESTA,
+}
+
+# name → (source body, longitude offset)
+DERIVED_BODIES: Dict[str, Tuple[str, float]] = {
+    "South Node": ("North Node", 180.0),
+}
+
+BODY_SETS: Dict[str, Tuple[str, ...]] = {
+    "classic": tuple(PLANETS),
+    "traditional": ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn",
+                    "North Node", "South Node"),
+    "extended": (*PLANETS, "North Node", "South Node", "Lilith",
+                 "Chiron", "Ceres", "Pallas", "Juno", "Vesta"),
+}
+DEFAULT_BODY_SET = "classic"
+
+# User-selected minor planets by catalogue number, e.g. "Asteroid 433"
+ASTEROID_NAME = re.compile(r"^Asteroid (\d+)$")
+
+# Column layout of position arrays
+LON, LAT, DIST, SPEED = 0, 1, 2, 3
+RA, DEC = 6, 7              # present when compute_bodies is given `eps`
+
+
+def body_id(name: str) -> int:
+    """Swiss Ephemeris id for a registered body or an "Asteroid <n>" name."""
+    if name in BODIES:
+        return BODIES[name]
+    m = ASTEROID_NAME.match(name)
+    if m:
+        return swe.AST_OFFSET + int(m.group(1))
+    raise ValueError(f"Unknown body '{name}'.")
+
+
+def resolve_bodies(body_set: Union[str, Sequence[str]] = DEFAULT_BODY_SET,
+                   extra: Iterable[str] = ()) -> Tuple[str, ...]:
+    """Body names for a set name or explicit list, plus extras, without duplicates."""
+    if isinstance(body_set, str):
+        if body_set not in BODY_SETS:
+            raise ValueError(f"Unknown body set '{body_set}'. Available: {sorted(BODY_SETS)}")
+        names = list(BODY_SETS[body_set])
+    else:
+        names = list(body_set)
+    for name in extra:
+        if name not in names:
+            names.append(name)
+    for name in names:
+        if name not in DERIVED_BODIES:
+            body_id(name)  # validates
+    return tuple(names)
+
+
+# --------------------------------------------------------------------
+# 🧮 Positions
+# --------------------------------------------------------------------
+def compute_bodies(jd_ut: float, names: Sequence[str], out: np.ndarray = None,
+                   eps: Optional[float] = None) -> np.ndarray:
+    """
+    (len(names), 6) positions at one instant; rows of unavailable bodies
+    are NaN. With the true obliquity `eps` the array is (len(names), 8),
+    RA / Dec in the last two columns. Pass `out` to write into an existing
+    array.
+    """
+    if out is None:
+        out = np.empty((len(names), 6 if eps is None else 8), dtype=np.float64)
+    index = {name: i for i, name in enumerate(names)}
+    for i, name in enumerate(names):
+        if name in DERIVED_BODIES:
+            continue
+        try:
+            out[i, :6] = swe.calc_ut(jd_ut, body_id(name), FLAGS)[0]
+        except swe.Error:
+            out[i] = np.nan
+    for name, (source, offset) in DERIVED_BODIES.items():
+        i = index.get(name)
+        if i is None:
+            continue
+        src = out[index[source], :6] if source in index else compute_bodies(jd_ut, (source,))[0]
+        out[i, :6] = src
+        out[i, LON] = (src[LON] + offset) % 360.0
+        out[i, LAT] = -src[LAT]
+        out[i, 4] = -src[4]
+    if eps is not None:
+        out[:, RA], out[:, DEC] = ecliptic_to_equatorial(out[:, LON], out[:, LAT], eps)
+    return out
+
+
+def compute_bodies_multi(jds: Sequence[float], names: Sequence[str]) -> np.ndarray:
+    """(len(jds), len(names), 6) positions for many instants in one array."""
+    out = np.empty((len(jds), len(names), 6), dtype=np.float64)
+    for t, jd in enumerate(jds):
+        compute_bodies(float(jd), names, out=out[t])
+    return out
@@ -1,13 +1,24 @@
 # backend/astro_engine/chart_generator.py
 from __future__ import annotations
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+
+import numpy as np
+
+from typing import List, Dict, Optional, Sequence, Tuple
 from datetime import datetime
 from backend.astro_engine.time_utils import resolve_tz, local_to_utc, to_julian_day
-from backend.astro_engine.ephemeris_loader import compute_planet_lon_lat
-from backend.astro_engine.house_calculator import compute_placidus_cusps, assign_house
-from backend.astro_engine.zodiac_utils import deg_to_sign, normalize_lon, element_and_modality_counts
-from backend.astro_engine.models.chart_model import ChartModel, PlanetPlacement, HouseCusp
-from backend.astro_engine.aspects_detector import detect_aspects
+from backend.astro_engine.bodies import DEFAULT_BODY_SET, LON, RA, DEC, compute_bodies, resolve_bodies
+from backend.astro_engine.ephemeris_loader import ecliptic_to_equatorial
+from backend.astro_engine.house_batch import nutation_frame
+from backend.astro_engine.house_calculator import compute_house_cusps, HouseIndex
+from backend.astro_engine.zodiac_utils import deg_to_sign, normalize_lon, to_zodiac, element_and_modality_counts
+from backend.astro_engine.astro_config import DEFAULT_HOUSE_SYSTEM, DEFAULT_ZODIAC
+from backend.astro_engine.ayanamsa import ayanamsa, resolve_zodiac
+from backend.astro_engine.fixed_stars import find_star_conjunctions
+from backend.astro_engine.lots import default_lot_catalog, lot_longitudes, sect_from_house
+from backend.astro_engine.models.chart_model import ChartModel, PlanetPlacement, HouseCusp, HouseSystemView, FixedStarContact
+from backend.astro_engine.aspects_detector import detect_aspects, detect_parallels
+from backend.astro_engine.aspect_patterns import detect_aspect_patterns
 
 def _houses_lons_from_struct(houses_struct: List[Dict]) -> List[float]:
     """Extract raw cusp longitudes (1→12) from computed house dicts."""
@@ -34,45 +45,77 @@ def build_natal_chart(
     lon: float,
     tz_name: Optional[str] = None,
     include_angles_in_aspects: bool = False,
+    house_system: str = DEFAULT_HOUSE_SYSTEM,
+    extra_house_systems: Sequence[str] = (),
+    zodiac: str = DEFAULT_ZODIAC,
+    body_set: str = DEFAULT_BODY_SET,
+    extra_bodies: Sequence[str] = (),
+    include_fixed_stars: bool = False,
 ) -> ChartModel:
     """
-    End-to-end natal chart generator (tropical, Placidus).
+    End-to-end natal chart generator (tropical or sidereal).
     - dt_local: naive local datetime of birth
     - lat/lon: birthplace coordinates (lon East positive per SE)
     - tz_name: optional override; if None, resolved from coords
+    - house_system: system used for planet houses (see astro_config.HOUSE_SYSTEMS)
+    - extra_house_systems: further systems to show side by side
+    - zodiac: "tropical" or a sidereal mode (see astro_config.ZODIAC_MODES);
+      every longitude in the chart is expressed in that zodiac
+    - body_set / extra_bodies: bodies to place (see bodies.BODY_SETS);
+      bodies whose ephemeris files are missing are listed in meta
+    - include_fixed_stars: add fixed-star conjunctions to bodies and angles
     """
     # --- Resolve timezone & UTC / JD
     tz = tz_name or resolve_tz(lat, lon)
     dt_utc = local_to_utc(dt_local, tz)
     jd_ut = to_julian_day(dt_utc)
 
-    # --- Planetary positions
-    planets_raw = compute_planet_lon_lat(dt_utc)  # {'Sun': {'lon', 'lat', 'dist'}, ...}
+    # --- Body positions: one (bodies × 8) array with RA / Dec, shifted into the requested zodiac
+    ay = ayanamsa(jd_ut, resolve_zodiac(zodiac))
+    eps, _ = nutation_frame(jd_ut)
+    requested = resolve_bodies(body_set, extra_bodies)
+    positions = compute_bodies(jd_ut, requested, eps=eps)
+    available = ~np.isnan(positions[:, LON])
+    names = [n for n, ok in zip(requested, available) if ok]
+    positions = positions[available]
+    positions[:, LON] = to_zodiac(positions[:, LON], ay)
 
-    # --- Houses + Asc/MC (Placidus)
-    houses_struct, asc_lon, mc_lon = compute_placidus_cusps(jd_ut, lat, lon)
+    # --- Houses + Asc/MC (all requested systems in one pass)
+    systems = [house_system] + [s for s in extra_house_systems if s != house_system]
+    cusp_sets = compute_house_cusps(jd_ut, lat, lon, systems, zodiac=zodiac)
+    houses_struct, asc_lon, mc_lon = cusp_sets[house_system]
     cusps_lons = _houses_lons_from_struct(houses_struct)
 
-    # --- Planet placements (sign + house)
+    # --- Planet placements (sign + house, all bodies in one lookup)
+    body_lons = positions[:, LON]
+    house_numbers, _ = HouseIndex(cusps_lons).locate(body_lons)
     planets: List[PlanetPlacement] = []
-    for name, data in planets_raw.items():
-        sign, deg = deg_to_sign(data["lon"])
-        h = assign_house(data["lon"], cusps_lons)
+    for name, (b_lon, b_lat, b_dist, b_speed), b_ra, b_dec, h in zip(
+        names, positions[:, :4].tolist(), positions[:, RA].tolist(), positions[:, DEC].tolist(), house_numbers.tolist()
+    ):
+        sign, deg = deg_to_sign(b_lon)
         planets.append(
             PlanetPlacement(
                 name=name,
-                lon=normalize_lon(data["lon"]),
+                lon=b_lon,
                 sign=sign,
                 deg_in_sign=deg,
-                lat=float(data["lat"]) if data.get("lat") is not None else None,
-                dist=float(data["dist"]) if data.get("dist") is not None else None,
+                lat=b_lat,
+                dist=b_dist,
+                speed=b_speed,
                 house=h,
+                ra=b_ra,
+                decl=b_dec,
+                out_of_bounds=abs(b_dec) > eps,
             )
         )
 
-    # --- Angle points
+    # --- Angle points (on the ecliptic; declination from the tropical longitude)
     asc_pp = _build_angle_point("Ascendant", asc_lon)
     mc_pp = _build_angle_point("MC", mc_lon)
+    angle_ra, angle_dec = ecliptic_to_equatorial(np.array([asc_lon, mc_lon]) + ay, 0.0, eps)
+    for pp, a_ra, a_dec in zip((asc_pp, mc_pp), angle_ra.tolist(), angle_dec.tolist()):
+        pp.ra, pp.decl = a_ra, a_dec
 
     # --- Aspects (natal): planets only by default; optionally include angles
     lon_map: Dict[str, float] = {p.name: p.lon for p in planets}
@@ -80,6 +123,30 @@ def build_natal_chart(
         lon_map["Ascendant"] = asc_pp.lon
         lon_map["MC"] = mc_pp.lon
     aspects = detect_aspects(lon_map)
+    patterns = detect_aspect_patterns(aspects, names=list(lon_map))
+    decl_map: Dict[str, float] = {p.name: p.decl for p in planets}
+    if include_angles_in_aspects:
+        decl_map["Ascendant"] = asc_pp.decl
+        decl_map["MC"] = mc_pp.decl
+    parallels = detect_parallels(decl_map)
+
+    # --- Sect (from the Sun's house) + lots, placed in the primary house system
+    sect = sect_from_house(next((p.house for p in planets if p.name == "Sun"), None))
+    points = {p.name: p.lon for p in planets}
+    points.update({"Ascendant": asc_pp.lon, "MC": mc_pp.lon})
+    catalog = default_lot_catalog()
+    lots: List[PlanetPlacement] = []
+    if all(p in points for p in catalog.points):
+        lot_lons = lot_longitudes([points[p] for p in catalog.points], sect == "day", catalog)
+        lot_houses, _ = HouseIndex(cusps_lons).locate(lot_lons)
+        for name, l_lon, h in zip(catalog.names, lot_lons.tolist(), lot_houses.tolist()):
+            sign, deg = deg_to_sign(l_lon)
+            lots.append(PlanetPlacement(name=name, lon=l_lon, sign=sign, deg_in_sign=deg, house=h))
+
+    # --- Fixed-star conjunctions (bodies + angles)
+    fixed_stars: List[FixedStarContact] = []
+    if include_fixed_stars:
+        fixed_stars = [FixedStarContact(**h) for h in find_star_conjunctions(jd_ut, points, ayanamsa=ay)]
 
     # --- Elements / Modalities
     elem_counts, mod_counts = element_and_modality_counts([p.model_dump() for p in planets])
@@ -101,13 +168,29 @@ def build_natal_chart(
         for h in houses_struct
     ]
 
+    alt_house_systems: Dict[str, HouseSystemView] = {}
+    for system in systems[1:]:
+        alt_struct = cusp_sets[system][0]
+        alt_numbers, _ = HouseIndex(_houses_lons_from_struct(alt_struct)).locate(body_lons)
+        alt_house_systems[system] = HouseSystemView(
+            system=system,
+            houses=[HouseCusp(**h) for h in alt_struct],
+            planet_houses={name: int(h) for name, h in zip(names, alt_numbers)},
+        )
+
     # --- Meta block
     meta = {
         "tz_name": tz,
         "dt_local": dt_local.isoformat(),
         "dt_utc": dt_utc.isoformat(),
         "jd_ut": f"{jd_ut:.6f}",
+        "zodiac": zodiac,
+        "ayanamsa": f"{ay:.6f}",
+        "body_set": body_set,
     }
+    missing = [n for n, ok in zip(requested, available) if not ok]
+    if missing:
+        meta["unavailable_bodies"] = ", ".join(missing)
 
     # --- Build ChartModel
     chart = ChartModel(
@@ -116,10 +199,54 @@ def build_natal_chart(
         mc=mc_pp,
         planets=planets,
         houses=houses_model,
+        house_system=house_system,
+        zodiac=zodiac,
+        sect=sect,
+        alt_house_systems=alt_house_systems,
         aspects=aspects,
+        parallels=parallels,
+        patterns=patterns,
+        fixed_stars=fixed_stars,
+        lots=lots,
         elements=elem_counts,
         modalities=mod_counts,
         dominant_elements=dominant_elems,
         dominant_modalities=dominant_mods,
     )
     return chart
+
+
+NATAL_CHART_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=NATAL_CHART_CACHE_SIZE)
+def _cached_natal_chart(dt_local, lat, lon, tz_name, include_angles_in_aspects,
+                        house_system, extra_house_systems, zodiac, body_set, extra_bodies,
+                        include_fixed_stars) -> ChartModel:
+    return build_natal_chart(dt_local, lat, lon, tz_name, include_angles_in_aspects,
+                             house_system=house_system, extra_house_systems=extra_house_systems,
+                             zodiac=zodiac, body_set=body_set, extra_bodies=extra_bodies,
+                             include_fixed_stars=include_fixed_stars)
+
+
+def get_natal_chart(
+    dt_local: datetime,
+    lat: float,
+    lon: float,
+    tz_name: Optional[str] = None,
+    include_angles_in_aspects: bool = False,
+    house_system: str = DEFAULT_HOUSE_SYSTEM,
+    extra_house_systems: Sequence[str] = (),
+    zodiac: str = DEFAULT_ZODIAC,
+    body_set: str = DEFAULT_BODY_SET,
+    extra_bodies: Sequence[str] = (),
+    include_fixed_stars: bool = False,
+) -> ChartModel:
+    """
+    Cached `build_natal_chart`. The key covers every input that changes the
+    chart, zodiac included; callers get their own copy to mutate freely.
+    """
+    chart = _cached_natal_chart(dt_local, lat, lon, tz_name, include_angles_in_aspects,
+                                house_system, tuple(extra_house_systems), zodiac,
+                                body_set, tuple(extra_bodies), include_fixed_stars)
+    return chart.model_copy(deep=True)
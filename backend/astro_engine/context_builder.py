@@ -0,0 +1,79 @@
+"""
+context_builder.py
+Per-planet context flags for `apply_contextual_weights`, derived from
+data the chart already carries — longitudes, daily speeds and houses —
+in one vectorized pass with no further ephemeris calls:
+
+  is_retrograde — moving against the body's usual direction
+  speed_ratio   — |speed| / mean daily motion (1.0 when unknown)
+  house_type    — angular / succedent / cadent
+  sun_distance  — separation from the Sun in degrees (combust, cazimi,
+                  under the beams); omitted for the Sun itself
+"""
+
+from __future__ import annotations
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from backend.astro_engine.astro_config import HOUSE_TYPES, MEAN_DAILY_MOTION
+
+
+def house_type(house: Optional[int]) -> str:
+    """angular / succedent / cadent for a house number (cadent when unknown)."""
+    return HOUSE_TYPES[(house - 1) % 3] if house else "cadent"
+
+
+def retrograde_mask(names: Sequence[str], speeds) -> np.ndarray:
+    """True where a body moves against its usual direction (NaN speed → False)."""
+    speeds = np.asarray(speeds, dtype=np.float64)
+    mean = np.array([MEAN_DAILY_MOTION.get(n, 1.0) for n in names], dtype=np.float64)
+    return ~np.isnan(speeds) & (speeds * np.sign(mean) < 0)
+
+
+def motion_context(names: Sequence[str], lons, speeds, houses, sun_lon: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    Context columns for P bodies: `lons`, `speeds` (NaN when unknown) and
+    `houses` (0 when unknown) are length-P arrays.
+    """
+    lons = np.asarray(lons, dtype=np.float64)
+    speeds = np.asarray(speeds, dtype=np.float64)
+    houses = np.asarray(houses, dtype=np.int64)
+    mean = np.array([MEAN_DAILY_MOTION.get(n, np.nan) for n in names], dtype=np.float64)
+
+    known_speed = ~np.isnan(speeds)
+    has_mean = ~np.isnan(mean)
+    mean = np.where(has_mean, mean, 1.0)
+    retro = retrograde_mask(names, speeds)
+    ratio = np.where(known_speed & has_mean, np.abs(speeds) / np.abs(mean), 1.0)
+    types = np.array(HOUSE_TYPES + ("cadent",))[np.where(houses > 0, (houses - 1) % 3, 3)]
+    if sun_lon is None:
+        sun_distance = np.full(len(names), np.nan)
+    else:
+        sun_distance = np.abs((lons - sun_lon + 180.0) % 360.0 - 180.0)
+    return {"is_retrograde": retro, "speed_ratio": ratio, "house_type": types, "sun_distance": sun_distance}
+
+
+def build_motion_contexts(placements) -> Dict[str, Dict[str, object]]:
+    """Context dict per placement (objects with name / lon / speed / house)."""
+    placements = list(placements)
+    names = [p.name for p in placements]
+    sun = next((p.lon for p in placements if p.name == "Sun"), None)
+    cols = motion_context(
+        names,
+        [p.lon for p in placements],
+        [np.nan if p.speed is None else p.speed for p in placements],
+        [p.house or 0 for p in placements],
+        sun_lon=sun,
+    )
+    out: Dict[str, Dict[str, object]] = {}
+    for k, name in enumerate(names):
+        ctx: Dict[str, object] = {
+            "is_retrograde": bool(cols["is_retrograde"][k]),
+            "speed_ratio": round(float(cols["speed_ratio"][k]), 4),
+            "house_type": str(cols["house_type"][k]),
+        }
+        if name != "Sun" and not np.isnan(cols["sun_distance"][k]):
+            ctx["sun_distance"] = round(float(cols["sun_distance"][k]), 4)
+        out[name] = ctx
+    return out
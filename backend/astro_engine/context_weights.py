@@ -3,7 +3,7 @@ context_weights.py — Phase 9.6 Contextual Weighting Engine
 Applies localized, rule-based adjustments to PlanetPrecision metrics.
 """
 
-from backend.astro_engine.astro_config import CONTEXT_RULES
+from backend.astro_engine.astro_config import CONTEXT_RULES, SUN_PROXIMITY_ORBS
 from backend.models.horoscope_profile import PlanetPrecision
 
 
@@ -46,12 +46,13 @@ def apply_contextual_weights(planet: str, metrics: PlanetPrecision, ctx: dict) -
 
     # --- Sun proximity effects ---
     sun_distance = ctx.get("sun_distance", 999)
-    if sun_distance < 0.3:
+    cazimi, combust, under_beams = SUN_PROXIMITY_ORBS
+    if sun_distance < cazimi:
         m.essential *= CONTEXT_RULES["cazimi_bonus"]
         m.accidental *= CONTEXT_RULES["cazimi_bonus"]
-    elif sun_distance < 8.5:
+    elif sun_distance < combust:
         m.accidental *= CONTEXT_RULES["combust_penalty"]
-    elif sun_distance < 17:
+    elif sun_distance < under_beams:
         m.accidental *= CONTEXT_RULES["under_beams_penalty"]
 
     # --- Sect / Reception ---
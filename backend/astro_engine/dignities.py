@@ -3,7 +3,14 @@ dignities.py
 Compute essential dignity score for a planet given its sign.
 """
 
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
 from backend.astro_engine.astro_config import DIGNITY_SCORES
+from backend.astro_engine.dispositor_chain import RULERS
+from backend.astro_engine.zodiac_utils import SIGNS, ELEMENT_BY_SIGN
 
 # rulerships and exaltations (partial; full mapping later)
 RULERSHIP = {
@@ -42,3 +49,153 @@ def essential_dignity(planet: str, sign: str) -> float:
     else:
         score += DIGNITY_SCORES["peregrine"]
     return round(score, 3)
+
+
+# ==========================================================
+# Traditional dignity engine (precomputed 360° tables)
+# ==========================================================
+# Every (planet, degree) cell holds a bit set of the dignities the planet
+# has there; scores are the bit set dotted with DIGNITY_SCORES. Tables are
+# built once per (terms, triplicity, sect) and a whole chart is scored by
+# one gather: table[planet_rows, floor(longitude)].
+
+DIGNITY_PLANETS: Tuple[str, ...] = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn")
+
+# Bit order of the flag tables
+DIGNITY_KINDS: Tuple[str, ...] = ("rulership", "exaltation", "triplicity", "term", "face", "detriment", "fall", "peregrine")
+_POSITIVE_KINDS = ("rulership", "exaltation", "triplicity", "term", "face")
+
+TRADITIONAL_EXALTATION = {
+    "Sun": "Aries", "Moon": "Taurus", "Mercury": "Virgo", "Venus": "Pisces",
+    "Mars": "Capricorn", "Jupiter": "Cancer", "Saturn": "Libra",
+}
+
+# element → (day ruler, night ruler)
+TRIPLICITY_TABLES: Dict[str, Dict[str, Tuple[str, str]]] = {
+    "dorothean": {
+        "Fire": ("Sun", "Jupiter"), "Earth": ("Venus", "Moon"),
+        "Air": ("Saturn", "Mercury"), "Water": ("Venus", "Mars"),
+    },
+    # Lilly / Ptolemy: Mars rules the water triplicity by day and night
+    "lilly": {
+        "Fire": ("Sun", "Jupiter"), "Earth": ("Venus", "Moon"),
+        "Air": ("Saturn", "Mercury"), "Water": ("Mars", "Mars"),
+    },
+}
+
+# sign → ((ruler, end degree), ...)
+TERM_TABLES: Dict[str, Dict[str, Tuple[Tuple[str, int], ...]]] = {
+    "egyptian": {
+        "Aries": (("Jupiter", 6), ("Venus", 12), ("Mercury", 20), ("Mars", 25), ("Saturn", 30)),
+        "Taurus": (("Venus", 8), ("Mercury", 14), ("Jupiter", 22), ("Saturn", 27), ("Mars", 30)),
+        "Gemini": (("Mercury", 6), ("Jupiter", 12), ("Venus", 17), ("Mars", 24), ("Saturn", 30)),
+        "Cancer": (("Mars", 7), ("Venus", 13), ("Mercury", 19), ("Jupiter", 26), ("Saturn", 30)),
+        "Leo": (("Jupiter", 6), ("Venus", 11), ("Saturn", 18), ("Mercury", 24), ("Mars", 30)),
+        "Virgo": (("Mercury", 7), ("Venus", 17), ("Jupiter", 21), ("Mars", 28), ("Saturn", 30)),
+        "Libra": (("Saturn", 6), ("Mercury", 14), ("Jupiter", 21), ("Venus", 28), ("Mars", 30)),
+        "Scorpio": (("Mars", 7), ("Venus", 11), ("Mercury", 19), ("Jupiter", 24), ("Saturn", 30)),
+        "Sagittarius": (("Jupiter", 12), ("Venus", 17), ("Mercury", 21), ("Saturn", 26), ("Mars", 30)),
+        "Capricorn": (("Mercury", 7), ("Jupiter", 14), ("Venus", 22), ("Saturn", 26), ("Mars", 30)),
+        "Aquarius": (("Mercury", 7), ("Venus", 13), ("Jupiter", 20), ("Mars", 25), ("Saturn", 30)),
+        "Pisces": (("Venus", 12), ("Jupiter", 16), ("Mercury", 19), ("Mars", 28), ("Saturn", 30)),
+    },
+    "ptolemaic": {
+        "Aries": (("Jupiter", 6), ("Venus", 14), ("Mercury", 21), ("Mars", 26), ("Saturn", 30)),
+        "Taurus": (("Venus", 8), ("Mercury", 15), ("Jupiter", 22), ("Saturn", 26), ("Mars", 30)),
+        "Gemini": (("Mercury", 7), ("Jupiter", 14), ("Venus", 21), ("Saturn", 25), ("Mars", 30)),
+        "Cancer": (("Mars", 6), ("Jupiter", 13), ("Mercury", 20), ("Venus", 27), ("Saturn", 30)),
+        "Leo": (("Saturn", 6), ("Mercury", 13), ("Venus", 19), ("Jupiter", 25), ("Mars", 30)),
+        "Virgo": (("Mercury", 7), ("Venus", 13), ("Jupiter", 18), ("Saturn", 24), ("Mars", 30)),
+        "Libra": (("Saturn", 6), ("Venus", 11), ("Jupiter", 19), ("Mercury", 24), ("Mars", 30)),
+        "Scorpio": (("Mars", 6), ("Jupiter", 14), ("Venus", 21), ("Mercury", 27), ("Saturn", 30)),
+        "Sagittarius": (("Jupiter", 8), ("Venus", 14), ("Mercury", 19), ("Saturn", 25), ("Mars", 30)),
+        "Capricorn": (("Venus", 6), ("Mercury", 12), ("Jupiter", 19), ("Mars", 25), ("Saturn", 30)),
+        "Aquarius": (("Saturn", 6), ("Mercury", 12), ("Venus", 20), ("Jupiter", 25), ("Mars", 30)),
+        "Pisces": (("Venus", 8), ("Jupiter", 14), ("Mercury", 20), ("Mars", 26), ("Saturn", 30)),
+    },
+}
+
+# Decans follow the Chaldean order starting with Mars at 0° Aries
+CHALDEAN_ORDER: Tuple[str, ...] = ("Mars", "Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter")
+
+
+@lru_cache(maxsize=16)
+def dignity_flags(terms: str = "egyptian", triplicity: str = "dorothean", diurnal: bool = True) -> np.ndarray:
+    """(len(DIGNITY_PLANETS), 360) uint8 bit sets, bit k = DIGNITY_KINDS[k]."""
+    if terms not in TERM_TABLES:
+        raise ValueError(f"Unknown terms '{terms}'. Available: {sorted(TERM_TABLES)}")
+    if triplicity not in TRIPLICITY_TABLES:
+        raise ValueError(f"Unknown triplicity '{triplicity}'. Available: {sorted(TRIPLICITY_TABLES)}")
+    bit = {k: 1 << i for i, k in enumerate(DIGNITY_KINDS)}
+    row = {p: i for i, p in enumerate(DIGNITY_PLANETS)}
+    flags = np.zeros((len(DIGNITY_PLANETS), 360), dtype=np.uint8)
+
+    for s, sign in enumerate(SIGNS):
+        span = slice(30 * s, 30 * s + 30)
+        opposite = SIGNS[(s + 6) % 12]
+        flags[row[RULERS[sign]], span] |= bit["rulership"]
+        flags[row[RULERS[opposite]], span] |= bit["detriment"]
+        for planet, ex_sign in TRADITIONAL_EXALTATION.items():
+            if ex_sign == sign:
+                flags[row[planet], span] |= bit["exaltation"]
+            elif ex_sign == opposite:
+                flags[row[planet], span] |= bit["fall"]
+        day, night = TRIPLICITY_TABLES[triplicity][ELEMENT_BY_SIGN[sign]]
+        flags[row[day if diurnal else night], span] |= bit["triplicity"]
+        start = 0
+        for ruler, end in TERM_TABLES[terms][sign]:
+            flags[row[ruler], 30 * s + start:30 * s + end] |= bit["term"]
+            start = end
+        for d in range(3):
+            face_ruler = CHALDEAN_ORDER[(3 * s + d) % 7]
+            flags[row[face_ruler], 30 * s + 10 * d:30 * s + 10 * d + 10] |= bit["face"]
+
+    positive = sum(bit[k] for k in _POSITIVE_KINDS)
+    flags[(flags & positive) == 0] |= bit["peregrine"]
+    flags.flags.writeable = False
+    return flags
+
+
+@lru_cache(maxsize=16)
+def dignity_table(terms: str = "egyptian", triplicity: str = "dorothean", diurnal: bool = True) -> np.ndarray:
+    """
+    (len(DIGNITY_PLANETS) + 1, 360) total scores; the last row is all zeros
+    and is used for bodies without traditional dignities.
+    """
+    flags = dignity_flags(terms, triplicity, diurnal)
+    weights = np.array([DIGNITY_SCORES[k] for k in DIGNITY_KINDS])
+    bits = (flags[..., None] >> np.arange(len(DIGNITY_KINDS), dtype=np.uint8)) & 1
+    table = np.zeros((len(DIGNITY_PLANETS) + 1, 360))
+    table[:-1] = bits @ weights
+    table.flags.writeable = False
+    return table
+
+
+def _rows(names: Sequence[str]) -> np.ndarray:
+    return np.array([DIGNITY_PLANETS.index(n) if n in DIGNITY_PLANETS else len(DIGNITY_PLANETS) for n in names])
+
+
+def dignity_scores(
+    names: Sequence[str],
+    lons,
+    terms: str = "egyptian",
+    triplicity: str = "dorothean",
+    diurnal: bool = True,
+) -> np.ndarray:
+    """Essential dignity score per body in one gather; lons may be (P,) or (N, P)."""
+    degrees = (np.asarray(lons, dtype=np.float64) % 360.0).astype(np.intp) % 360
+    return dignity_table(terms, triplicity, diurnal)[_rows(names), degrees]
+
+
+def dignity_labels(planet: str, lon: float, terms: str = "egyptian",
+                   triplicity: str = "dorothean", diurnal: bool = True) -> list[str]:
+    """Names of the dignities a planet holds at a longitude."""
+    if planet not in DIGNITY_PLANETS:
+        return []
+    f = int(dignity_flags(terms, triplicity, diurnal)[DIGNITY_PLANETS.index(planet), int(lon % 360.0) % 360])
+    return [k for i, k in enumerate(DIGNITY_KINDS) if f >> i & 1]
+
+
+def is_diurnal(sun_lon: float, asc_lon: float) -> bool:
+    """Day chart when the Sun is above the horizon (houses 7–12)."""
+    return (sun_lon - asc_lon) % 360.0 > 180.0
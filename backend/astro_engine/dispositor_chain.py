@@ -1,6 +1,19 @@
 # backend/astro_engine/dispositor_chain.py
+"""
+Dispositor graph: every planet points to the ruler of the sign it occupies.
+
+Each node has exactly one outgoing edge, so the graph is functional: every
+walk ends in a cycle (or leaves the chart at a ruler that isn't placed).
+Cycles, final dispositors and mutual receptions come out of one linear
+pass, and chain weights are memoized per node so shared suffixes are
+walked once.
+"""
 from __future__ import annotations
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.astro_engine.zodiac_utils import SIGNS
 
 # Simplified sign rulerships (traditional)
 RULERS = {
@@ -9,19 +22,179 @@ RULERS = {
     "Sagittarius": "Jupiter", "Capricorn": "Saturn", "Aquarius": "Saturn", "Pisces": "Jupiter"
 }
 
+# Weight passed on at each further step down a chain
+CHAIN_DECAY = 0.5
+
+
+class DispositorGraph:
+    """Functional dispositor graph for one chart."""
+
+    def __init__(self, planet_positions: Dict[str, str]):
+        self.positions = dict(planet_positions)
+        # planet → ruler of its sign (None for unknown signs)
+        self.successor: Dict[str, Optional[str]] = {p: RULERS.get(s) for p, s in self.positions.items()}
+        self.cycles: List[List[str]] = []
+        self._cycle_of: Dict[str, int] = {}
+        self._find_cycles()
+        self._walks: Dict[str, Dict[str, float]] = {}
+
+    def _next(self, node: str) -> Optional[str]:
+        return self.successor.get(node)
+
+    def _find_cycles(self) -> None:
+        """Colour walk: each node is entered once, so the pass is O(n)."""
+        state: Dict[str, int] = {}  # 1 = on current path, 2 = finished
+        for start in self.positions:
+            path: List[str] = []
+            node: Optional[str] = start
+            while node is not None and node in self.positions and node not in state:
+                state[node] = 1
+                path.append(node)
+                node = self._next(node)
+            if node is not None and state.get(node) == 1:
+                cycle = path[path.index(node):]
+                for member in cycle:
+                    self._cycle_of[member] = len(self.cycles)
+                self.cycles.append(cycle)
+            for member in path:
+                state[member] = 2
+
+    # ------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------
+    @property
+    def final_dispositors(self) -> List[str]:
+        """Planets in their own domicile (cycles of length one)."""
+        return [c[0] for c in self.cycles if len(c) == 1]
+
+    @property
+    def sole_final_dispositor(self) -> Optional[str]:
+        """The single planet every chain ends at, if the chart has one."""
+        if len(self.cycles) != 1 or len(self.cycles[0]) != 1:
+            return None
+        final = self.cycles[0][0]
+        return final if all(self.terminal(p) == final for p in self.positions) else None
+
+    @property
+    def mutual_receptions(self) -> List[Tuple[str, str]]:
+        """Pairs in each other's domicile (cycles of length two)."""
+        return [(c[0], c[1]) for c in self.cycles if len(c) == 2]
+
+    def in_mutual_reception(self) -> Dict[str, bool]:
+        flagged = {p for pair in self.mutual_receptions for p in pair}
+        return {p: p in flagged for p in self.positions}
+
+    def terminal(self, planet: str) -> Optional[str]:
+        """Self-ruling planet the chain from `planet` ends at, if any."""
+        node: Optional[str] = planet
+        while node is not None and node in self.positions and node not in self._cycle_of:
+            node = self._next(node)
+        if node in self._cycle_of and len(self.cycles[self._cycle_of[node]]) == 1:
+            return node
+        return None
+
+    # ------------------------------------------------------------
+    # Dominance
+    # ------------------------------------------------------------
+    def walk(self, node: str) -> Dict[str, float]:
+        """
+        Nodes visited from `node` (inclusive) until a repeat, weighted
+        1, ½, ¼ … Memoized: a node off every cycle reuses its successor's
+        walk, scaled by CHAIN_DECAY.
+        """
+        cached = self._walks.get(node)
+        if cached is not None:
+            return cached
+        # Iterative, so long tails don't recurse: collect the tail first
+        tail: List[str] = []
+        cur: Optional[str] = node
+        while cur is not None and cur not in self._walks and cur not in self._cycle_of and cur in self.positions:
+            tail.append(cur)
+            cur = self._next(cur)
+        if cur is None:
+            base: Dict[str, float] = {}
+        elif cur in self._walks:
+            base = self._walks[cur]
+        elif cur in self._cycle_of:
+            base = self._cycle_walk(cur)
+        else:  # a ruler that isn't placed in this chart ends the chain
+            base = {cur: 1.0}
+            self._walks[cur] = base
+        for member in reversed(tail):
+            walk = {member: 1.0}
+            for k, w in base.items():
+                walk[k] = walk.get(k, 0.0) + CHAIN_DECAY * w
+            self._walks[member] = walk
+            base = walk
+        return self._walks.get(node, base)
+
+    def _cycle_walk(self, node: str) -> Dict[str, float]:
+        cycle = self.cycles[self._cycle_of[node]]
+        i = cycle.index(node)
+        walk = {m: CHAIN_DECAY ** k for k, m in enumerate(cycle[i:] + cycle[:i])}
+        self._walks[node] = walk
+        return walk
+
+    def dominance(self) -> Dict[str, float]:
+        """Sum over planets of the weighted chain starting at each planet's ruler."""
+        dominance = {p: 0.0 for p in self.positions}
+        for planet, ruler in self.successor.items():
+            if ruler is None:
+                continue
+            for node, w in self.walk(ruler).items():
+                dominance[node] = dominance.get(node, 0.0) + w
+        return dominance
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "cycles": self.cycles,
+            "final_dispositors": self.final_dispositors,
+            "sole_final_dispositor": self.sole_final_dispositor,
+            "mutual_receptions": [list(p) for p in self.mutual_receptions],
+            "dominance": self.dominance(),
+        }
+
+
 def build_dispositor_chain(planet_positions: Dict[str, str]) -> Dict[str, float]:
     """
     planet_positions: {planet: sign}
     Returns dominance map with 1.0 for self-rulership, diminishing recursively (0.5, 0.25…)
     """
-    dominance = {p: 0.0 for p in planet_positions}
-    for planet, sign in planet_positions.items():
-        ruler = RULERS.get(sign)
-        weight = 1.0
-        visited = set()
-        while ruler and ruler not in visited:
-            visited.add(ruler)
-            dominance[ruler] = dominance.get(ruler, 0) + weight
-            ruler = RULERS.get(planet_positions.get(ruler, ""), None)
-            weight *= 0.5
+    return DispositorGraph(planet_positions).dominance()
+
+
+# ------------------------------------------------------------
+# Batch mode
+# ------------------------------------------------------------
+def dominance_batch(names: Sequence[str], sign_idx) -> np.ndarray:
+    """
+    Dominance for many charts at once. `sign_idx` is (N, P) sign numbers
+    (0 = Aries) for the bodies in `names`; rulers not among `names` end a
+    chain. Returns (N, P) weights matching `build_dispositor_chain`.
+    """
+    sign_idx = np.asarray(sign_idx, dtype=np.intp)
+    n, p = sign_idx.shape
+    col = {name: k for k, name in enumerate(names)}
+    ruler_col = np.array([col.get(RULERS[s], -1) for s in SIGNS], dtype=np.intp)
+    # successor[c, q] = column of the ruler of body q in chart c (-1 = off-chart)
+    successor = ruler_col[sign_idx]
+    rows = np.arange(n)[:, None]
+
+    dominance = np.zeros((n, p))
+    cur = successor.copy()                        # chain position for each (chart, start planet)
+    weight = 1.0
+    visited = np.zeros((n, p, p), dtype=bool)
+    starts = np.broadcast_to(np.arange(p), (n, p))
+    active = cur >= 0
+    for _ in range(p):
+        if not active.any():
+            break
+        safe = np.where(active, cur, 0)
+        active &= ~visited[rows, starts, safe]
+        c_idx, s_idx = np.nonzero(active)
+        visited[c_idx, s_idx, cur[c_idx, s_idx]] = True
+        np.add.at(dominance, (c_idx, cur[c_idx, s_idx]), weight)
+        cur = np.where(active, successor[rows, np.where(active, cur, 0)], -1)
+        active &= cur >= 0
+        weight *= CHAIN_DECAY
     return dominance
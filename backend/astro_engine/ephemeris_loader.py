@@ -1,5 +1,6 @@
 # backend/astro_engine/ephemeris_loader.py
 import swisseph as swe
+import numpy as np
 from datetime import datetime
 from backend.astro_engine.time_utils import to_julian_day
 import os
@@ -37,16 +38,84 @@ PLANETS = {
 # --------------------------------------------------------------------
 def compute_planet_lon_lat(dt_utc: datetime) -> dict:
     """
-    Compute ecliptic longitudes/latitudes/distances for main planets.
-    Returns a dict like:
-      {'Sun': {'lon': 56.18, 'lat': 0.00, 'dist': 1.011}, ...}
+    Compute ecliptic longitudes/latitudes/distances and daily speed in
+    longitude for main planets. Returns a dict like:
+      {'Sun': {'lon': 56.18, 'lat': 0.00, 'dist': 1.011, 'speed': 0.957}, ...}
     """
     jd_ut = to_julian_day(dt_utc)
     results = {}
 
     for name, pid in PLANETS.items():
         planet_data, ret_flag = swe.calc_ut(jd_ut, pid, flags=FLAGS)
-        lon, lat, dist = planet_data[:3]
-        results[name] = {"lon": lon, "lat": lat, "dist": dist}
+        lon, lat, dist, speed = planet_data[:4]
+        results[name] = {"lon": lon, "lat": lat, "dist": dist, "speed": speed}
 
     return results
+
+
+# --------------------------------------------------------------------
+# 📈 Longitude / speed sampling (event search & indexes)
+# --------------------------------------------------------------------
+def compute_lon_speed(jd_ut: float, pid: int) -> tuple[float, float]:
+    """Return (ecliptic longitude, daily speed in longitude) for one body."""
+    data, _ = swe.calc_ut(jd_ut, pid, flags=FLAGS)
+    return data[0], data[3]
+
+
+def sample_lon_speed(pid: int, jds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sample longitude and speed of one body over an array of Julian Days.
+    Returns two float64 arrays aligned with `jds`.
+    """
+    lons = np.empty(len(jds), dtype=np.float64)
+    speeds = np.empty(len(jds), dtype=np.float64)
+    for i, jd in enumerate(jds):
+        data, _ = swe.calc_ut(float(jd), pid, flags=FLAGS)
+        lons[i] = data[0]
+        speeds[i] = data[3]
+    return lons, speeds
+
+
+# Bodies fast enough to need per-instant positions inside a window of a few
+# hours; the rest barely move (Jupiter < 0.01° in a few hours).
+FAST_BODIES = ("Sun", "Moon", "Mercury", "Venus", "Mars")
+FAST_SAMPLE_MINUTES = 30.0
+
+
+def interpolated_planet_matrix(jds: np.ndarray) -> tuple[list[str], np.ndarray]:
+    """
+    (N, P) longitudes for a dense array of nearby instants: slow planets are
+    computed once at the window midpoint, fast ones sampled on a coarse grid
+    and linearly interpolated.
+    """
+    mid = float(jds[len(jds) // 2])
+    step = FAST_SAMPLE_MINUTES / 1440.0
+    grid = np.arange(jds.min(), jds.max() + step, step)
+    if len(grid) < 2:
+        grid = np.array([jds.min(), jds.min() + step])
+    names = list(PLANETS.keys())
+    lons = np.empty((len(jds), len(names)))
+    for k, name in enumerate(names):
+        if name in FAST_BODIES:
+            sampled, _ = sample_lon_speed(PLANETS[name], grid)
+            lons[:, k] = np.interp(jds, grid, np.unwrap(sampled, period=360.0)) % 360.0
+        else:
+            lons[:, k] = compute_lon_speed(mid, PLANETS[name])[0]
+    return names, lons
+
+
+# --------------------------------------------------------------------
+# 🧭 Ecliptic → equatorial (vectorized)
+# --------------------------------------------------------------------
+def ecliptic_to_equatorial(lon, lat, eps) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Right ascension and declination (degrees) from ecliptic longitude /
+    latitude and obliquity. Accepts scalars or arrays; with true-of-date
+    inputs and the true obliquity this gives apparent RA / Dec.
+    """
+    lam = np.radians(np.asarray(lon, dtype=np.float64))
+    beta = np.radians(np.asarray(lat, dtype=np.float64))
+    e = np.radians(eps)
+    ra = np.arctan2(np.sin(lam) * np.cos(e) - np.tan(beta) * np.sin(e), np.cos(lam))
+    dec = np.arcsin(np.sin(beta) * np.cos(e) + np.cos(beta) * np.sin(e) * np.sin(lam))
+    return np.degrees(ra) % 360.0, np.degrees(dec)
@@ -0,0 +1,74 @@
+"""
+event_search.py
+Root finding for ephemeris events (stations, ingresses, exact aspects).
+
+Events are located in two steps: a coarse scan over a sampled grid finds
+the brackets where a signed function changes sign, then `find_root`
+refines each bracket with a handful of ephemeris calls.
+"""
+
+from __future__ import annotations
+from typing import Callable, Optional
+
+import numpy as np
+
+# ~0.1 s of time; well below anything the UI displays
+ROOT_TOLERANCE_DAYS = 1e-6
+
+
+def find_root(
+    func: Callable[[float], float],
+    t0: float,
+    t1: float,
+    f0: Optional[float] = None,
+    f1: Optional[float] = None,
+    tol: float = ROOT_TOLERANCE_DAYS,
+    max_iter: int = 60,
+) -> float:
+    """
+    Locate a sign change of `func` inside [t0, t1] (Illinois / regula falsi).
+    Ephemeris functions are smooth, so this converges in a few calls.
+    """
+    if f0 is None:
+        f0 = func(t0)
+    if f1 is None:
+        f1 = func(t1)
+    if f0 == 0.0:
+        return t0
+    if f1 == 0.0:
+        return t1
+
+    side = 0
+    t = t0
+    for _ in range(max_iter):
+        t = (t0 * f1 - t1 * f0) / (f1 - f0)
+        ft = func(t)
+        if ft == 0.0 or abs(t1 - t0) < tol:
+            break
+        if (ft > 0) == (f1 > 0):
+            t1, f1 = t, ft
+            if side == -1:
+                f0 *= 0.5
+            side = -1
+        else:
+            t0, f0 = t, ft
+            if side == 1:
+                f1 *= 0.5
+            side = 1
+        if abs(t1 - t0) < tol:
+            break
+    return t
+
+
+def sign_change_brackets(values: np.ndarray, max_jump: Optional[float] = None) -> np.ndarray:
+    """
+    Indexes i where values[i] and values[i + 1] have opposite signs.
+    `max_jump` drops brackets where the function jumps (e.g. an angle
+    wrapping from +180 to -180) instead of crossing zero.
+    """
+    a = values[:-1]
+    b = values[1:]
+    mask = (a < 0) != (b < 0)
+    if max_jump is not None:
+        mask &= np.abs(b - a) < max_jump
+    return np.nonzero(mask)[0]
@@ -0,0 +1,177 @@
+"""
+fixed_stars.py
+Fixed-star catalog, precession to the chart epoch and conjunctions.
+
+The catalog is converted once into J2000 ecliptic arrays (brightest
+first, optionally capped by `settings.FIXED_STAR_MAX_COUNT`). Per chart, all stars
+are precessed in one vectorized step and every star is matched against
+the chart's sorted point longitudes with `searchsorted`, so no per-star
+Swiss Ephemeris lookup (and no catalog-file parsing) happens on the
+request path.
+
+Precession is the general precession in longitude; proper motion and
+nutation are ignored (well under an arcminute for natal dates), which is
+ample for 1° conjunction orbs.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.astro_engine.astro_config import FIXED_STAR_ORB, GENERAL_PRECESSION_ARCSEC
+from backend.astro_engine.house_batch import J2000
+from backend.astro_engine.zodiac_utils import to_zodiac, wrap180
+from backend.core.config import settings
+
+# J2000 mean obliquity (IAU 1976)
+OBLIQUITY_J2000 = 23.4392911
+
+# (name, RA J2000 "h m s", Dec J2000 "±d m s", visual magnitude)
+STAR_CATALOG: Tuple[Tuple[str, str, str, float], ...] = (
+    ("Sirius", "06 45 08.9", "-16 42 58", -1.46),
+    ("Canopus", "06 23 57.1", "-52 41 45", -0.74),
+    ("Arcturus", "14 15 39.7", "+19 10 57", -0.05),
+    ("Vega", "18 36 56.3", "+38 47 01", 0.03),
+    ("Capella", "05 16 41.4", "+45 59 53", 0.08),
+    ("Rigel", "05 14 32.3", "-08 12 06", 0.13),
+    ("Procyon", "07 39 18.1", "+05 13 30", 0.34),
+    ("Betelgeuse", "05 55 10.3", "+07 24 25", 0.42),
+    ("Achernar", "01 37 42.8", "-57 14 12", 0.46),
+    ("Hadar", "14 03 49.4", "-60 22 23", 0.61),
+    ("Altair", "19 50 47.0", "+08 52 06", 0.76),
+    ("Acrux", "12 26 35.9", "-63 05 57", 0.76),
+    ("Aldebaran", "04 35 55.2", "+16 30 33", 0.86),
+    ("Antares", "16 29 24.4", "-26 25 55", 0.96),
+    ("Spica", "13 25 11.6", "-11 09 41", 0.97),
+    ("Pollux", "07 45 18.9", "+28 01 34", 1.14),
+    ("Fomalhaut", "22 57 39.0", "-29 37 20", 1.16),
+    ("Deneb", "20 41 25.9", "+45 16 49", 1.25),
+    ("Mimosa", "12 47 43.3", "-59 41 19", 1.25),
+    ("Regulus", "10 08 22.3", "+11 58 02", 1.35),
+    ("Adhara", "06 58 37.5", "-28 58 20", 1.50),
+    ("Castor", "07 34 36.0", "+31 53 18", 1.58),
+    ("Shaula", "17 33 36.5", "-37 06 14", 1.62),
+    ("Bellatrix", "05 25 07.9", "+06 20 59", 1.64),
+    ("Elnath", "05 26 17.5", "+28 36 27", 1.65),
+    ("Alnilam", "05 36 12.8", "-01 12 07", 1.69),
+    ("Alnair", "22 08 14.0", "-46 57 40", 1.74),
+    ("Alioth", "12 54 01.7", "+55 57 35", 1.77),
+    ("Dubhe", "11 03 43.7", "+61 45 03", 1.79),
+    ("Mirfak", "03 24 19.4", "+49 51 40", 1.79),
+    ("Wezen", "07 08 23.5", "-26 23 36", 1.84),
+    ("Kaus Australis", "18 24 10.3", "-34 23 05", 1.85),
+    ("Alkaid", "13 47 32.4", "+49 18 48", 1.86),
+    ("Polaris", "02 31 49.1", "+89 15 51", 1.98),
+    ("Alphard", "09 27 35.2", "-08 39 31", 1.98),
+    ("Hamal", "02 07 10.4", "+23 27 45", 2.00),
+    ("Nunki", "18 55 15.9", "-26 17 48", 2.05),
+    ("Mirach", "01 09 43.9", "+35 37 14", 2.05),
+    ("Alpheratz", "00 08 23.3", "+29 05 26", 2.06),
+    ("Rasalhague", "17 34 56.1", "+12 33 36", 2.08),
+    ("Algol", "03 08 10.1", "+40 57 20", 2.12),
+    ("Denebola", "11 49 03.6", "+14 34 19", 2.14),
+    ("Alphecca", "15 34 41.3", "+26 42 53", 2.23),
+    ("Scheat", "23 03 46.5", "+28 04 58", 2.42),
+    ("Markab", "23 04 45.7", "+15 12 19", 2.49),
+    ("Menkar", "03 02 16.8", "+04 05 23", 2.54),
+    ("Zosma", "11 14 06.5", "+20 31 25", 2.56),
+    ("Zuben Eschamali", "15 17 00.4", "-09 22 59", 2.61),
+    ("Unukalhai", "15 44 16.1", "+06 25 32", 2.63),
+    ("Sheratan", "01 54 38.4", "+20 48 29", 2.64),
+    ("Zuben Elgenubi", "14 50 52.7", "-16 02 30", 2.75),
+    ("Deneb Algedi", "21 47 02.4", "-16 07 38", 2.81),
+    ("Vindemiatrix", "13 02 10.6", "+10 57 33", 2.83),
+    ("Alcyone", "03 47 29.1", "+24 06 18", 2.87),
+    ("Sadalmelik", "22 05 47.0", "-00 19 11", 2.95),
+    ("Praesepe", "08 40 24.0", "+19 40 00", 3.70),
+    ("Acubens", "08 58 29.2", "+11 51 28", 4.25),
+)
+
+
+def _sexagesimal(text: str) -> float:
+    sign = -1.0 if text.strip().startswith("-") else 1.0
+    d, m, s = (abs(float(x)) for x in text.replace("+", "").replace("-", "").split())
+    return sign * (d + m / 60.0 + s / 3600.0)
+
+
+class StarTable:
+    """Catalog as parallel arrays (brightest first)."""
+
+    def __init__(self, names: List[str], lon: np.ndarray, lat: np.ndarray, mag: np.ndarray):
+        self.names = names
+        self.lon = lon      # J2000 ecliptic longitude
+        self.lat = lat      # ecliptic latitude
+        self.mag = mag
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def load_star_table(max_count: Optional[int] = None) -> StarTable:
+    """Brightest `max_count` stars (default: settings.FIXED_STAR_MAX_COUNT)."""
+    cap = settings.FIXED_STAR_MAX_COUNT if max_count is None else max_count
+    return _star_table(len(STAR_CATALOG) if cap is None else max(0, min(cap, len(STAR_CATALOG))))
+
+
+@lru_cache(maxsize=8)
+def _star_table(count: int) -> StarTable:
+    """Convert the catalog to J2000 ecliptic arrays once per cap."""
+    rows = sorted(STAR_CATALOG, key=lambda r: r[3])[:count]
+    ra = np.radians([_sexagesimal(r[1]) * 15.0 for r in rows])
+    dec = np.radians([_sexagesimal(r[2]) for r in rows])
+    e = np.radians(OBLIQUITY_J2000)
+    lon = np.degrees(np.arctan2(np.sin(ra) * np.cos(e) + np.tan(dec) * np.sin(e), np.cos(ra))) % 360.0
+    lat = np.degrees(np.arcsin(np.sin(dec) * np.cos(e) - np.cos(dec) * np.sin(e) * np.sin(ra)))
+    return StarTable([r[0] for r in rows], lon, lat, np.array([r[3] for r in rows]))
+
+
+def precessed_longitudes(jd_ut: float, table: Optional[StarTable] = None) -> np.ndarray:
+    """Tropical ecliptic longitudes of date for every star in one step."""
+    table = load_star_table() if table is None else table
+    T = (jd_ut - J2000) / 36525.0
+    a, b = GENERAL_PRECESSION_ARCSEC
+    return (table.lon + (a * T + b * T * T) / 3600.0) % 360.0
+
+
+def find_star_conjunctions(
+    jd_ut: float,
+    points: Dict[str, float],
+    orb: float = FIXED_STAR_ORB,
+    ayanamsa: float = 0.0,
+    table: Optional[StarTable] = None,
+) -> List[Dict[str, object]]:
+    """
+    Stars within `orb` of any chart point (planets / angles), tightest first.
+    `points` longitudes must be in the chart's zodiac; `ayanamsa` shifts the
+    precessed star positions into the same frame.
+    """
+    table = load_star_table() if table is None else table
+    if not len(table) or not points:
+        return []
+    star_lon = to_zodiac(precessed_longitudes(jd_ut, table), ayanamsa)
+
+    names = list(points)
+    lons = np.array([points[n] for n in names], dtype=np.float64) % 360.0
+    order = np.argsort(lons)
+    # Sorted ring with one copy on each side so windows never wrap
+    ring = np.concatenate([lons[order] - 360.0, lons[order], lons[order] + 360.0])
+    ring_idx = np.tile(order, 3)
+    lo = np.searchsorted(ring, star_lon - orb, side="left")
+    hi = np.searchsorted(ring, star_lon + orb, side="right")
+
+    hits: List[Dict[str, object]] = []
+    for s in np.nonzero(hi > lo)[0]:
+        for k in ring_idx[lo[s]:hi[s]]:
+            sep = float(wrap180(lons[k] - star_lon[s]))
+            hits.append({
+                "star": table.names[s],
+                "point": names[k],
+                "orb": round(abs(sep), 3),
+                "star_lon": round(float(star_lon[s]), 4),
+                "star_lat": round(float(table.lat[s]), 3),
+                "magnitude": float(table.mag[s]),
+            })
+    hits.sort(key=lambda h: (h["orb"], h["magnitude"]))
+    return hits
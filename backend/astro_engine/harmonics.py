@@ -0,0 +1,107 @@
+"""
+harmonics.py
+Harmonic charts and harmonic strength spectra.
+
+The H-th harmonic chart multiplies every longitude by H (mod 360°); a
+conjunction there is an aspect of 360°/H·k in the natal chart. For a set
+of harmonics the whole (H × bodies) longitude matrix is one broadcast
+product, and conjunctions for every harmonic and pair come from one
+(H × pairs) separation array compared with the orb — no per-harmonic
+call to `detect_aspects`.
+
+The orb is fixed in the harmonic chart, so under uniformly random
+longitudes every harmonic has the same expected score and spectra can be
+compared across H.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from backend.astro_engine.astro_config import HARMONIC_MAX, HARMONIC_ORB
+
+
+def _harmonics(harmonics: Optional[Iterable[int]]) -> np.ndarray:
+    h = np.arange(1, HARMONIC_MAX + 1) if harmonics is None else np.asarray(list(harmonics), dtype=np.int64)
+    if h.size == 0 or np.any(h < 1):
+        raise ValueError("Harmonics must be positive integers.")
+    return h
+
+
+def harmonic_longitudes(lons, harmonics: Optional[Iterable[int]] = None) -> np.ndarray:
+    """(..., P) longitudes → (..., H, P) harmonic longitudes."""
+    lons = np.asarray(lons, dtype=np.float64)
+    h = _harmonics(harmonics).astype(np.float64)
+    return (lons[..., None, :] * h[:, None]) % 360.0
+
+
+def harmonic_separations(lons, harmonics: Optional[Iterable[int]] = None) -> np.ndarray:
+    """(..., P) → (..., H, M) pair separations (0..180) in each harmonic chart."""
+    hl = harmonic_longitudes(lons, harmonics)
+    a, b = np.triu_indices(hl.shape[-1], k=1)
+    return np.abs((hl[..., a] - hl[..., b] + 180.0) % 360.0 - 180.0)
+
+
+def harmonic_spectrum(
+    lons,
+    harmonics: Optional[Iterable[int]] = None,
+    orb: float = HARMONIC_ORB,
+) -> np.ndarray:
+    """
+    Strength per harmonic: sum over pairs of the conjunction tightness
+    max(0, 1 − sep / orb). (P,) → (H,), (N, P) → (N, H).
+    """
+    sep = harmonic_separations(lons, harmonics)
+    return np.clip(1.0 - sep / orb, 0.0, None).sum(axis=-1)
+
+
+def harmonic_spectrum_batch(
+    lons,
+    harmonics: Optional[Iterable[int]] = None,
+    orb: float = HARMONIC_ORB,
+    chunk_size: int = 2048,
+) -> np.ndarray:
+    """(N, P) → (N, H) spectra, in chunks so the (N, H, pairs) array stays bounded."""
+    lons = np.atleast_2d(np.asarray(lons, dtype=np.float64))
+    h = _harmonics(harmonics)
+    out = np.empty((lons.shape[0], h.size), dtype=np.float64)
+    for start in range(0, lons.shape[0], chunk_size):
+        out[start:start + chunk_size] = harmonic_spectrum(lons[start:start + chunk_size], h, orb)
+    return out
+
+
+def harmonic_conjunctions(
+    names: Sequence[str],
+    lons: Sequence[float],
+    harmonic: int,
+    orb: float = HARMONIC_ORB,
+) -> List[Dict[str, object]]:
+    """Conjunctions in one harmonic chart, tightest first."""
+    sep = harmonic_separations(lons, [harmonic])[0]
+    a, b = np.triu_indices(len(names), k=1)
+    hits = np.nonzero(sep <= orb)[0]
+    out = [{"p1": names[a[k]], "p2": names[b[k]], "orb": round(float(sep[k]), 3)} for k in hits]
+    out.sort(key=lambda c: c["orb"])
+    return out
+
+
+def harmonic_profile(
+    names: Sequence[str],
+    lons: Sequence[float],
+    harmonics: Optional[Iterable[int]] = None,
+    orb: float = HARMONIC_ORB,
+    top: int = 3,
+) -> Dict[str, object]:
+    """Spectrum for one chart plus the conjunctions of its strongest harmonics."""
+    h = _harmonics(harmonics)
+    spectrum = harmonic_spectrum(np.asarray(lons, dtype=np.float64), h, orb)
+    strongest = h[np.argsort(-spectrum, kind="stable")[:top]]
+    return {
+        "harmonics": h.tolist(),
+        "spectrum": np.round(spectrum, 4).tolist(),
+        "strongest": [
+            {"harmonic": int(k), "conjunctions": harmonic_conjunctions(names, lons, int(k), orb)}
+            for k in strongest
+        ],
+    }
@@ -0,0 +1,180 @@
+"""
+house_batch.py
+Vectorized sidereal time, angle and house-cusp kernels.
+
+Every function takes NumPy arrays (anything broadcastable) so thousands of
+candidate instants or locations are handled in a single call instead of
+one `swe.houses_ex` per chart. Results agree with Swiss Ephemeris to a
+few thousandths of a degree.
+"""
+
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+import swisseph as swe
+
+from backend.astro_engine.astro_config import HOUSE_SYSTEMS
+
+J2000 = 2451545.0
+
+# Semi-arc iteration stops when declinations move less than this (radians);
+# convergence slows near the polar circles, hence the generous cap.
+PLACIDUS_TOLERANCE = 1e-10
+PLACIDUS_MAX_ITERATIONS = 50
+
+
+def nutation_frame(jd_ut: float) -> Tuple[float, float]:
+    """(true obliquity, equation of the equinoxes in degrees) at one instant."""
+    nut, _ = swe.calc_ut(jd_ut, swe.ECL_NUT, 0)
+    eps_true, dpsi = nut[0], nut[2]
+    return eps_true, dpsi * np.cos(np.radians(eps_true))
+
+
+def sidereal_degrees(jds, eq_equinox: float = 0.0) -> np.ndarray:
+    """
+    Greenwich apparent sidereal time in degrees (IAU 1982 GMST + equation
+    of the equinoxes). Nutation varies over weeks, so callers pass the
+    value for the middle of their time window.
+    """
+    jds = np.asarray(jds, dtype=np.float64)
+    d = jds - J2000
+    T = d / 36525.0
+    gmst = 280.46061837 + 360.98564736629 * d + 0.000387933 * T * T - T ** 3 / 38710000.0
+    return (gmst + eq_equinox) % 360.0
+
+
+def angles_batch(armc, lat, eps) -> Tuple[np.ndarray, np.ndarray]:
+    """Ascendant and MC longitudes for arrays of ARMC / geographic latitude."""
+    ramc = np.radians(armc)
+    phi = np.radians(lat)
+    e = np.radians(eps)
+    mc = np.degrees(np.arctan2(np.sin(ramc), np.cos(ramc) * np.cos(e))) % 360.0
+    asc = np.degrees(np.arctan2(np.cos(ramc), -(np.sin(ramc) * np.cos(e) + np.tan(phi) * np.sin(e)))) % 360.0
+    return asc, mc
+
+
+def porphyry_batch(asc, mc) -> np.ndarray:
+    """Porphyry cusps (…, 12): each quadrant trisected along the ecliptic."""
+    asc = np.asarray(asc, dtype=np.float64)
+    mc = np.asarray(mc, dtype=np.float64)
+    ic = (mc + 180.0) % 360.0
+    q1 = (asc - mc) % 360.0   # MC → ASC
+    q2 = (ic - asc) % 360.0   # ASC → IC
+    c = np.empty(np.broadcast(asc, mc).shape + (12,), dtype=np.float64)
+    c[..., 0] = asc
+    c[..., 1] = asc + q2 / 3.0
+    c[..., 2] = asc + 2.0 * q2 / 3.0
+    c[..., 3] = ic
+    c[..., 9] = mc
+    c[..., 10] = mc + q1 / 3.0
+    c[..., 11] = mc + 2.0 * q1 / 3.0
+    c[..., 4:9] = c[..., [10, 11, 0, 1, 2]] + 180.0
+    return c % 360.0
+
+
+def _placidus_cusp(ramc, phi, e, fraction: float, offset: float, diurnal: bool):
+    """One intermediate Placidus cusp by semi-arc iteration; NaN where undefined."""
+    tan_phi = np.tan(phi)
+    delta = np.zeros(np.broadcast(ramc, phi).shape)
+    with np.errstate(invalid="ignore"):
+        for _ in range(PLACIDUS_MAX_ITERATIONS):
+            ad = np.arcsin(tan_phi * np.tan(delta))  # ascensional difference
+            semi_arc = np.pi / 2 + ad if diurnal else np.pi / 2 - ad
+            alpha = ramc + offset + (fraction if diurnal else -fraction) * semi_arc
+            lam = np.arctan2(np.sin(alpha), np.cos(alpha) * np.cos(e))
+            new_delta = np.arcsin(np.sin(e) * np.sin(lam))
+            step = np.abs(new_delta - delta)
+            delta = new_delta
+            if not np.any(step > PLACIDUS_TOLERANCE):  # NaN rows are left to the caller
+                break
+    return np.degrees(lam) % 360.0
+
+
+def placidus_batch(armc, lat, eps) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Placidus cusps for arrays of ARMC / latitude.
+    Returns (cusps[..., 12], asc, mc). Where Placidus is undefined
+    (circumpolar ecliptic degrees) the row falls back to Porphyry.
+    """
+    ramc = np.radians(np.asarray(armc, dtype=np.float64))
+    phi = np.radians(np.asarray(lat, dtype=np.float64))
+    e = np.radians(eps)
+    asc, mc = angles_batch(armc, lat, eps)
+
+    c11 = _placidus_cusp(ramc, phi, e, 1.0 / 3.0, 0.0, diurnal=True)
+    c12 = _placidus_cusp(ramc, phi, e, 2.0 / 3.0, 0.0, diurnal=True)
+    c2 = _placidus_cusp(ramc, phi, e, 2.0 / 3.0, np.pi, diurnal=False)
+    c3 = _placidus_cusp(ramc, phi, e, 1.0 / 3.0, np.pi, diurnal=False)
+
+    cusps = np.empty(asc.shape + (12,), dtype=np.float64)
+    cusps[..., 0] = asc
+    cusps[..., 1] = c2
+    cusps[..., 2] = c3
+    cusps[..., 3] = (mc + 180.0) % 360.0
+    cusps[..., 9] = mc
+    cusps[..., 10] = c11
+    cusps[..., 11] = c12
+    cusps[..., 4:9] = (cusps[..., [10, 11, 0, 1, 2]] + 180.0) % 360.0
+
+    bad = np.isnan(cusps).any(axis=-1)
+    if np.any(bad):
+        cusps[bad] = porphyry_batch(asc[bad], mc[bad])
+    return cusps, asc, mc
+
+
+def cusps_batch(system: str, armc, lat, eps, ayanamsa=0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (cusps[..., 12], asc, mc) for any supported house system, as tropical
+    longitudes. Placidus, Porphyry, Equal and Whole Sign are vectorized; the
+    others fall back to one `swe.houses_armc` per row. `eps` is a scalar or
+    one obliquity per row. `ayanamsa` only matters for Whole Sign, whose
+    houses follow the sidereal sign of the ASC.
+    """
+    if system == "placidus":
+        return placidus_batch(armc, lat, eps)
+    armc, lat = np.broadcast_arrays(np.asarray(armc, dtype=np.float64), np.asarray(lat, dtype=np.float64))
+    asc, mc = angles_batch(armc, lat, eps)
+    if system == "porphyry":
+        return porphyry_batch(asc, mc), asc, mc
+    if system in ("equal", "whole_sign"):
+        start = asc if system == "equal" else ((asc - ayanamsa) % 360.0 // 30.0) * 30.0 + ayanamsa
+        return (start[..., None] + 30.0 * np.arange(12)) % 360.0, asc, mc
+    code = HOUSE_SYSTEMS.get(system)
+    if code is None:
+        raise ValueError(f"Unknown house system '{system}'. Available: {sorted(HOUSE_SYSTEMS)}")
+    eps = np.broadcast_to(np.asarray(eps, dtype=np.float64), armc.shape)
+    cusps = np.empty(armc.shape + (12,), dtype=np.float64)
+    for idx in np.ndindex(armc.shape):
+        try:
+            cusps[idx] = swe.houses_armc(float(armc[idx]), float(lat[idx]), float(eps[idx]), code.encode())[0][:12]
+        except swe.Error:
+            # undefined inside the polar circles (Koch): Porphyry, as for Placidus
+            cusps[idx] = porphyry_batch(asc[idx], mc[idx])
+    return cusps, asc, mc
+
+
+def locate_houses_batch(lons, cusps) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (houses 1–12, offset past the cusp) for longitudes (N, P) against
+    per-row cusps (N, 12). Rows are rotated so cusp 1 sits at 0°, then
+    shifted by 360° × row, which makes all rows one sorted array and the
+    whole batch a single `searchsorted`.
+    """
+    lons = np.asarray(lons, dtype=np.float64)
+    cusps = np.asarray(cusps, dtype=np.float64)
+    n = cusps.shape[0]
+    rot_cusps = (cusps - cusps[:, :1]) % 360.0
+    rot_lons = (lons - cusps[:, :1]) % 360.0
+    rot_lons = np.where(rot_lons >= 360.0, 0.0, rot_lons)
+    shift = 360.0 * np.arange(n)[:, None]
+    flat = np.searchsorted((rot_cusps + shift).ravel(), (rot_lons + shift).ravel(), side="right") - 1
+    flat = flat.reshape(rot_lons.shape)
+    houses = flat - 12 * np.arange(n)[:, None]
+    offsets = rot_lons - np.take_along_axis(rot_cusps, houses, axis=1)
+    return (houses + 1).astype(np.int8), offsets
+
+
+def assign_houses_batch(lons, cusps) -> np.ndarray:
+    """House numbers (1–12) for longitudes (N, P) against per-row cusps (N, 12)."""
+    return locate_houses_batch(lons, cusps)[0]
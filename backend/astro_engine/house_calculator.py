@@ -1,13 +1,31 @@
 # backend/astro_engine/house_calculator.py
+import threading
+from collections import OrderedDict
+
+import numpy as np
 import swisseph as swe
-from backend.astro_engine.zodiac_utils import deg_to_sign, normalize_lon
+from backend.astro_engine.astro_config import HOUSE_SYSTEMS, DEFAULT_HOUSE_SYSTEM, HOUSE_CUSP_CACHE_SIZE, DEFAULT_ZODIAC
+from backend.astro_engine.ayanamsa import ayanamsa
+from backend.astro_engine.house_blending import blend_nearby_houses
+from backend.astro_engine.zodiac_utils import deg_to_sign, normalize_lon, to_zodiac, whole_sign_cusps
 
-def compute_placidus_cusps(jd_ut: float, lat: float, lon: float):
-    """
-    Compute Placidus house cusps (1–12), Ascendant, MC.
-    Returns: (houses, asc, mc)
-    """
-    cusps, ascmc = swe.houses_ex(jd_ut, lat, lon, b'P')
+# --------------------------------------------------------------------
+# 🏠 Cusps for one or more house systems (shared ARMC / obliquity)
+# --------------------------------------------------------------------
+# (jd_ut, lat, lon, system, zodiac) → (cusps[12], asc, mc); least recently used evicted
+_CUSP_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_CUSP_CACHE_LOCK = threading.Lock()
+
+
+def resolve_house_system(system: str) -> str:
+    """Validate a house-system name and return its Swiss Ephemeris code."""
+    code = HOUSE_SYSTEMS.get(system)
+    if code is None:
+        raise ValueError(f"Unknown house system '{system}'. Available: {sorted(HOUSE_SYSTEMS)}")
+    return code
+
+
+def _house_struct(cusps) -> list[dict]:
     houses = []
     for i, cusp_lon in enumerate(cusps, start=1):
         sign, deg_in_sign = deg_to_sign(cusp_lon)
@@ -17,23 +35,103 @@ def compute_placidus_cusps(jd_ut: float, lat: float, lon: float):
             "sign": sign,
             "deg_in_sign": deg_in_sign
         })
-    asc = ascmc[0]
-    mc = ascmc[1]
-    return houses, asc, mc
+    return houses
+
+
+def compute_house_cusps(jd_ut: float, lat: float, lon: float, systems=(DEFAULT_HOUSE_SYSTEM,),
+                        zodiac: str = DEFAULT_ZODIAC) -> dict:
+    """
+    Cusps (1–12), Ascendant and MC for every requested system, as
+    longitudes in the requested zodiac.
+    Sidereal time and obliquity are computed once and shared; each
+    (jd_ut, lat, lon, system, zodiac) result is cached, so asking for
+    another system of the same chart later is a dictionary lookup.
+    Returns: {system: (houses, asc, mc)}
+    """
+    codes = {name: resolve_house_system(name) for name in systems}
+    raw = {}
+    frame = None
+    for name, code in codes.items():
+        key = (jd_ut, lat, lon, name, zodiac)
+        with _CUSP_CACHE_LOCK:
+            hit = _CUSP_CACHE.get(key)
+            if hit is not None:
+                _CUSP_CACHE.move_to_end(key)
+        if hit is None:
+            if frame is None:
+                eps = swe.calc_ut(jd_ut, swe.ECL_NUT, 0)[0][0]
+                armc = normalize_lon(swe.sidtime(jd_ut) * 15.0 + lon)
+                frame = (armc, eps)
+            try:
+                cusps, ascmc = swe.houses_armc(frame[0], lat, frame[1], code.encode())
+            except swe.Error:
+                # undefined inside the polar circles (Placidus, Koch): Porphyry, as in house_batch
+                cusps, ascmc = swe.houses_armc(frame[0], lat, frame[1], b"O")
+            ay = ayanamsa(jd_ut, zodiac)
+            asc = to_zodiac(ascmc[0], ay)
+            if code == "W":
+                # Whole sign follows the Ascendant's sign in the chosen zodiac
+                cusps = whole_sign_cusps(asc)
+            else:
+                cusps = [to_zodiac(c, ay) for c in cusps]
+            hit = (tuple(cusps), asc, to_zodiac(ascmc[1], ay))
+            with _CUSP_CACHE_LOCK:
+                _CUSP_CACHE[key] = hit
+                if len(_CUSP_CACHE) > HOUSE_CUSP_CACHE_SIZE:
+                    _CUSP_CACHE.popitem(last=False)
+        raw[name] = hit
+    return {name: (_house_struct(cusps), asc, mc) for name, (cusps, asc, mc) in raw.items()}
+
+
+def compute_placidus_cusps(jd_ut: float, lat: float, lon: float):
+    """
+    Compute Placidus house cusps (1–12), Ascendant, MC.
+    Returns: (houses, asc, mc)
+    """
+    return compute_house_cusps(jd_ut, lat, lon, ("placidus",))["placidus"]
+
+
+def _rotate(lons, origin) -> np.ndarray:
+    """Longitudes measured from `origin` into [0, 360); guards the 360.0 rounding edge."""
+    rot = (np.asarray(lons, dtype=np.float64) - origin) % 360.0
+    return np.where(rot >= 360.0, 0.0, rot)
+
+
+class HouseIndex:
+    """
+    House lookup for one chart. Cusps are normalized and rotated once so that
+    cusp 1 sits at 0°; after that every lookup is a `searchsorted` over an
+    array of longitudes, with no wrap-around special case.
+    """
+
+    def __init__(self, cusps: list[float]):
+        cusps = np.asarray(cusps, dtype=np.float64) % 360.0
+        if cusps.shape != (12,):
+            raise ValueError("HouseIndex needs exactly 12 cusps.")
+        self.origin = float(cusps[0])
+        self.rotated = _rotate(cusps, self.origin)
+
+    def locate(self, lons) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (houses 1–12, offsets) for any array of longitudes; offset is the
+        distance in degrees past the cusp of the house it falls in.
+        """
+        rot = _rotate(lons, self.origin)
+        idx = np.searchsorted(self.rotated, rot, side="right") - 1
+        return (idx + 1).astype(np.int8), rot - self.rotated[idx]
+
+    def house_of(self, lon: float) -> int:
+        return int(self.locate(lon)[0])
+
+    def blend(self, lons) -> list[dict[int, float]]:
+        """`blend_nearby_houses` weights for each longitude, fed from one lookup."""
+        houses, offsets = self.locate(np.atleast_1d(lons))
+        return [blend_nearby_houses(int(h), float(o)) for h, o in zip(houses, offsets)]
+
 
 def assign_house(lon: float, cusps: list[float]) -> int:
     """
     Determine which house a longitude belongs to (Placidus).
+    For many longitudes against the same cusps, build a HouseIndex once.
     """
-    lon = normalize_lon(lon)
-    for i in range(12):
-        start = normalize_lon(cusps[i])
-        end = normalize_lon(cusps[(i+1) % 12])
-        if start < end:
-            if start <= lon < end:
-                return i+1
-        else:
-            # Wrap-around (e.g. House 12 crossing 360°)
-            if lon >= start or lon < end:
-                return i+1
-    return 12
+    return HouseIndex(cusps).house_of(lon)
@@ -0,0 +1,137 @@
+"""
+lots.py
+Arabic parts / Hellenistic lots and chart sect.
+
+Every lot is base + A − B (mod 360°), with A and B swapped in night
+charts for lots that reverse. Lots may refer to other lots (Eros uses
+Spirit, Necessity uses Fortune), and since each formula is linear the
+catalog is compiled once into two coefficient matrices (day, night) over
+a fixed point vector: ASC, MC and the seven classical planets. A chart's
+lots are then one matrix-vector product, and a batch of charts one
+matrix product.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.astro_engine.zodiac_utils import wrap180
+
+# Point vector the formulas are written over
+LOT_POINTS: Tuple[str, ...] = ("Ascendant", "MC", "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn")
+
+# (name, base, plus, minus, reverse at night) — day formula: base + plus − minus
+LOT_CATALOG: Tuple[Tuple[str, str, str, str, bool], ...] = (
+    # Hermetic lots (Paulus Alexandrinus)
+    ("Fortune", "Ascendant", "Moon", "Sun", True),
+    ("Spirit", "Ascendant", "Sun", "Moon", True),
+    ("Eros", "Ascendant", "Venus", "Spirit", True),
+    ("Necessity", "Ascendant", "Fortune", "Mercury", True),
+    ("Courage", "Ascendant", "Fortune", "Mars", True),
+    ("Victory", "Ascendant", "Jupiter", "Spirit", True),
+    ("Nemesis", "Ascendant", "Fortune", "Saturn", True),
+    # Dorotheus / Valens
+    ("Father", "Ascendant", "Saturn", "Sun", True),
+    ("Mother", "Ascendant", "Moon", "Venus", True),
+    ("Siblings", "Ascendant", "Jupiter", "Saturn", True),
+    ("Children", "Ascendant", "Saturn", "Jupiter", True),
+    ("Marriage", "Ascendant", "Venus", "Saturn", True),
+    ("Illness", "Ascendant", "Mars", "Saturn", True),
+)
+
+# Sect membership; Mercury follows the Sun when it rises before it
+SECT_PLANETS: Dict[str, Tuple[str, ...]] = {
+    "day": ("Sun", "Jupiter", "Saturn"),
+    "night": ("Moon", "Venus", "Mars"),
+}
+
+
+# ------------------------------------------------------------
+# Sect
+# ------------------------------------------------------------
+def sect_from_house(sun_house: Optional[int]) -> str:
+    """Day chart when the Sun is above the horizon (houses 7–12)."""
+    return "day" if sun_house is not None and sun_house >= 7 else "night"
+
+
+def planet_sect(name: str, lons: Dict[str, float]) -> Optional[str]:
+    """Sect a planet belongs to (None for bodies outside the scheme)."""
+    if name == "Mercury" and "Sun" in lons:
+        # morning star (rises before the Sun) → diurnal
+        return "day" if wrap180(lons["Mercury"] - lons["Sun"]) < 0 else "night"
+    for sect, members in SECT_PLANETS.items():
+        if name in members:
+            return sect
+    return None
+
+
+def sect_matches(sect: str, lons: Dict[str, float]) -> Dict[str, bool]:
+    """{planet: True} for planets of the chart's sect."""
+    return {name: planet_sect(name, lons) == sect for name in lons}
+
+
+# ------------------------------------------------------------
+# Catalog compilation
+# ------------------------------------------------------------
+class LotCatalog:
+    """Day and night coefficient matrices (lots × LOT_POINTS)."""
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str, str, bool]] = LOT_CATALOG,
+                 points: Sequence[str] = LOT_POINTS):
+        self.points: Tuple[str, ...] = tuple(points)
+        col = {p: k for k, p in enumerate(self.points)}
+        rows: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        def term(name: str, night: bool) -> np.ndarray:
+            if name in col:
+                v = np.zeros(len(self.points))
+                v[col[name]] = 1.0
+                return v
+            if name in rows:
+                return rows[name][int(night)]
+            raise ValueError(f"Lot formula refers to unknown point or later lot '{name}'.")
+
+        for name, base, plus, minus, reverse in entries:
+            day = term(base, False) + term(plus, False) - term(minus, False)
+            if reverse:
+                night = term(base, True) + term(minus, True) - term(plus, True)
+            else:
+                night = term(base, True) + term(plus, True) - term(minus, True)
+            rows[name] = (day, night)
+
+        self.names: List[str] = list(rows)
+        self.day = np.array([rows[n][0] for n in self.names]).reshape(-1, len(self.points))
+        self.night = np.array([rows[n][1] for n in self.names]).reshape(-1, len(self.points))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@lru_cache(maxsize=1)
+def default_lot_catalog() -> LotCatalog:
+    return LotCatalog()
+
+
+def point_vector(points: Dict[str, float], catalog: Optional[LotCatalog] = None) -> np.ndarray:
+    catalog = default_lot_catalog() if catalog is None else catalog
+    missing = [p for p in catalog.points if p not in points]
+    if missing:
+        raise ValueError(f"Missing points for lots: {missing}")
+    return np.array([points[p] for p in catalog.points], dtype=np.float64)
+
+
+def lot_longitudes(point_lons, diurnal, catalog: Optional[LotCatalog] = None) -> np.ndarray:
+    """
+    (K,) or (N, K) longitudes over `catalog.points` → (L,) or (N, L) lot
+    longitudes. `diurnal` is a bool or one bool per chart.
+    """
+    catalog = default_lot_catalog() if catalog is None else catalog
+    x = np.asarray(point_lons, dtype=np.float64)
+    day = x @ catalog.day.T
+    night = x @ catalog.night.T
+    diurnal = np.asarray(diurnal, dtype=bool)
+    if x.ndim == 2:
+        diurnal = diurnal.reshape(-1, 1)
+    return np.where(diurnal, day, night) % 360.0
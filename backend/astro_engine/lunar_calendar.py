@@ -0,0 +1,165 @@
+"""
+lunar_calendar.py
+Yearly Moon calendar: principal phases, sign ingresses and void-of-course
+windows.
+
+Everything comes from one sampled pass over the year: the Moon and every
+other body are sampled on a fixed grid, sign changes of the relevant
+angle functions give brackets, and only the brackets that matter are
+refined with `find_root`. For void-of-course periods that means only the
+last aspect before each ingress is ever refined.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.astro_engine.ephemeris_loader import PLANETS, compute_lon_speed, sample_lon_speed
+from backend.astro_engine.event_search import find_root, sign_change_brackets
+from backend.astro_engine.time_utils import to_julian_day, from_julian_day
+from backend.astro_engine.zodiac_utils import SIGNS, normalize_lon, wrap180
+
+# Bump when the calendar output changes shape or content (used for HTTP ETags)
+LUNAR_CALENDAR_VERSION = 1
+
+# Moon–Sun elongation of each principal phase
+LUNAR_PHASES: Tuple[Tuple[float, str], ...] = (
+    (0.0, "new_moon"),
+    (90.0, "first_quarter"),
+    (180.0, "full_moon"),
+    (270.0, "last_quarter"),
+)
+
+# Ptolemaic aspects as Moon-minus-body elongations (both sides of the circle)
+VOC_ASPECTS: Tuple[Tuple[float, str], ...] = (
+    (0.0, "conjunction"),
+    (60.0, "sextile"), (300.0, "sextile"),
+    (90.0, "square"), (270.0, "square"),
+    (120.0, "trine"), (240.0, "trine"),
+    (180.0, "opposition"),
+)
+
+# The Moon gains at most ~15.5°/day on any body: 0.5 day steps keep every
+# bracket far from the ±180° wrap of the angle functions.
+SCAN_STEP_DAYS = 0.5
+# Padding so the first void-of-course window of the year is complete
+SCAN_PAD_DAYS = 4.0
+
+
+def _event(jd: float, **fields) -> Dict[str, object]:
+    return {"jd": round(jd, 6), "utc": from_julian_day(jd).isoformat(), **fields}
+
+
+def _moon_minus(pid: int, target: float):
+    """Signed function wrap180(Moon − body − target) of time."""
+    moon = PLANETS["Moon"]
+    return lambda t: wrap180(compute_lon_speed(t, moon)[0] - compute_lon_speed(t, pid)[0] - target)
+
+
+def _refine(pid: int, target: float, jds: np.ndarray, rel: np.ndarray, i: int) -> float:
+    return find_root(_moon_minus(pid, target), float(jds[i]), float(jds[i + 1]), float(rel[i]), float(rel[i + 1]))
+
+
+def _last_aspect_before(
+    brackets: List[Tuple[int, str, float, str]],
+    bracket_idx: np.ndarray,
+    rel: Dict[Tuple[str, float], np.ndarray],
+    jds: np.ndarray,
+    lo_jd: float,
+    hi_jd: float,
+) -> Optional[Tuple[float, str, str]]:
+    """
+    Latest exact aspect in (lo_jd, hi_jd). `brackets` is sorted by sample
+    index, so we walk backwards from the ingress and stop as soon as no
+    remaining bracket can end later than the best root found.
+    """
+    hi_i = int(np.searchsorted(jds, hi_jd))
+    pos = int(np.searchsorted(bracket_idx, hi_i))
+    best: Optional[Tuple[float, str, str]] = None
+    for i, body, target, aspect in reversed(brackets[:pos]):
+        if best is not None and jds[i + 1] < best[0]:
+            break
+        if jds[i + 1] <= lo_jd:
+            break
+        t = _refine(PLANETS[body], target, jds, rel[(body, target)], i)
+        if lo_jd < t < hi_jd and (best is None or t > best[0]):
+            best = (t, body, aspect)
+    return best
+
+
+def build_lunar_calendar(jd_start: float, jd_end: float) -> Dict[str, List[Dict[str, object]]]:
+    """Phases, ingresses and void-of-course windows intersecting [jd_start, jd_end)."""
+    moon_id = PLANETS["Moon"]
+    jds = np.arange(jd_start - SCAN_PAD_DAYS, jd_end + SCAN_PAD_DAYS, SCAN_STEP_DAYS, dtype=np.float64)
+
+    # --- Single sampling pass
+    lon = {name: sample_lon_speed(pid, jds)[0] for name, pid in PLANETS.items()}
+    moon = lon["Moon"]
+
+    # --- Phases (Moon–Sun elongation)
+    phases: List[Dict[str, object]] = []
+    for target, name in LUNAR_PHASES:
+        rel = wrap180(moon - lon["Sun"] - target)
+        for i in sign_change_brackets(rel, max_jump=180.0):
+            t = _refine(PLANETS["Sun"], target, jds, rel, int(i))
+            if jd_start <= t < jd_end:
+                phases.append(_event(t, phase=name))
+    phases.sort(key=lambda e: e["jd"])
+
+    # --- Ingresses (Moon always moves forward)
+    sign_idx = (normalize_lon(moon) // 30.0).astype(np.int8)
+    ingress_jd: List[float] = []
+    ingress_sign: List[int] = []
+    for i in np.nonzero(sign_idx[1:] != sign_idx[:-1])[0]:
+        boundary = float(sign_idx[i + 1]) * 30.0
+        func = lambda t, b=boundary: wrap180(compute_lon_speed(t, moon_id)[0] - b)
+        ingress_jd.append(find_root(func, float(jds[i]), float(jds[i + 1]),
+                                    float(wrap180(moon[i] - boundary)), float(wrap180(moon[i + 1] - boundary))))
+        ingress_sign.append(int(sign_idx[i + 1]))
+
+    # --- Aspect brackets for every body / aspect (vectorized, unrefined)
+    rel_map: Dict[Tuple[str, float], np.ndarray] = {}
+    brackets: List[Tuple[int, str, float, str]] = []
+    for body, body_lon in lon.items():
+        if body == "Moon":
+            continue
+        for target, aspect in VOC_ASPECTS:
+            rel = wrap180(moon - body_lon - target)
+            rel_map[(body, target)] = rel
+            brackets.extend((int(i), body, target, aspect) for i in sign_change_brackets(rel, max_jump=180.0))
+    brackets.sort(key=lambda b: b[0])
+    bracket_idx = np.fromiter((b[0] for b in brackets), dtype=np.int64, count=len(brackets))
+
+    # --- Void of course: last exact aspect in a sign → ingress into the next
+    ingresses: List[Dict[str, object]] = []
+    void: List[Dict[str, object]] = []
+    for k in range(1, len(ingress_jd)):
+        prev_jd, jd_in = ingress_jd[k - 1], ingress_jd[k]
+        if jd_start <= jd_in < jd_end:
+            ingresses.append(_event(jd_in, sign=SIGNS[ingress_sign[k]]))
+        if jd_in < jd_start:
+            continue
+        last = _last_aspect_before(brackets, bracket_idx, rel_map, jds, prev_jd, jd_in)
+        start = last[0] if last else prev_jd
+        if start >= jd_end:
+            continue
+        void.append({
+            "start": _event(start),
+            "end": _event(jd_in),
+            "sign": SIGNS[ingress_sign[k - 1]],
+            "duration_hours": round((jd_in - start) * 24.0, 2),
+            "last_aspect": {"body": last[1], "aspect": last[2]} if last else None,
+        })
+
+    return {"phases": phases, "ingresses": ingresses, "void_of_course": void}
+
+
+@lru_cache(maxsize=16)
+def lunar_calendar(year: int) -> Dict[str, object]:
+    """Cached calendar for one UTC calendar year."""
+    jd0 = to_julian_day(datetime(year, 1, 1))
+    jd1 = to_julian_day(datetime(year + 1, 1, 1))
+    return {"year": year, "version": LUNAR_CALENDAR_VERSION, **build_lunar_calendar(jd0, jd1)}
@@ -0,0 +1,120 @@
+"""
+midpoints.py
+Midpoint trees on the 360°, 90° or 45° dial.
+
+All P·(P−1)/2 midpoints come from one vectorized expression. Midpoints and
+points are folded onto the dial (longitude mod dial size), the midpoints
+are sorted once, and every point is matched against them with
+`searchsorted` on a ring that repeats the dial on each side, so a window
+never wraps. Batches of charts are shifted row by row into one sorted
+array and matched with a single `searchsorted` as well.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from backend.astro_engine.astro_config import MIDPOINT_DIALS, MIDPOINT_ORB
+
+
+@lru_cache(maxsize=64)
+def midpoint_pairs(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Index arrays (a, b) of all pairs a < b."""
+    return np.triu_indices(n, k=1)
+
+
+def compute_midpoints(lons) -> np.ndarray:
+    """
+    Nearer midpoint of every pair along the last axis: (..., P) → (..., M),
+    in `midpoint_pairs(P)` order.
+    """
+    lons = np.asarray(lons, dtype=np.float64)
+    a, b = midpoint_pairs(lons.shape[-1])
+    la, lb = lons[..., a], lons[..., b]
+    return (la + ((lb - la + 180.0) % 360.0 - 180.0) / 2.0) % 360.0
+
+
+def _check_dial(dial: float) -> float:
+    if dial not in MIDPOINT_DIALS:
+        raise ValueError(f"Unknown dial {dial}. Available: {list(MIDPOINT_DIALS)}")
+    return float(dial)
+
+
+def _sweep(points: np.ndarray, mids: np.ndarray, dial: float, orb: float) -> Tuple[np.ndarray, ...]:
+    """
+    Matches for (N, P) dial points against (N, M) dial midpoints.
+    Returns flat (chart, point, midpoint, signed orb) arrays.
+    """
+    n, m = mids.shape
+    order = np.argsort(mids, axis=1)
+    sorted_mids = np.take_along_axis(mids, order, axis=1)
+    # ring per row: [-dial, 2·dial), rows 4·dial apart → one sorted array
+    ring = np.concatenate([sorted_mids - dial, sorted_mids, sorted_mids + dial], axis=1)
+    shift = 4.0 * dial * np.arange(n)[:, None]
+    flat_ring = (ring + shift).ravel()
+    lo = np.searchsorted(flat_ring, (points - orb + shift).ravel(), side="left")
+    hi = np.searchsorted(flat_ring, (points + orb + shift).ravel(), side="right")
+
+    counts = hi - lo
+    total = int(counts.sum())
+    point_flat = np.repeat(np.arange(points.size), counts)
+    pos = np.repeat(lo, counts) + (np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts))
+    chart = point_flat // points.shape[1]
+    point = point_flat % points.shape[1]
+    col = pos - chart * 3 * m
+    mid = order[chart, col % m]
+    delta = points[chart, point] - ring[chart, col]
+    return chart, point, mid, delta
+
+
+def midpoint_hits_batch(lons, dial: float = 90, orb: float = MIDPOINT_ORB) -> Dict[str, np.ndarray]:
+    """
+    Point-on-midpoint contacts for many charts. `lons` is (N, P) for the
+    same ordered body list; midpoints that contain the point itself are
+    dropped. Returns flat arrays: chart, point, pair_a, pair_b, orb
+    (signed, point minus midpoint on the dial).
+    """
+    dial = _check_dial(dial)
+    lons = np.atleast_2d(np.asarray(lons, dtype=np.float64)) % 360.0
+    a, b = midpoint_pairs(lons.shape[1])
+    mids = compute_midpoints(lons) % dial
+    chart, point, mid, delta = _sweep(lons % dial, mids, dial, orb)
+    keep = (a[mid] != point) & (b[mid] != point)
+    return {
+        "chart": chart[keep],
+        "point": point[keep],
+        "pair_a": a[mid][keep],
+        "pair_b": b[mid][keep],
+        "orb": delta[keep],
+    }
+
+
+def midpoint_tree(
+    names: Sequence[str],
+    lons: Sequence[float],
+    dial: float = 90,
+    orb: float = MIDPOINT_ORB,
+) -> Dict[str, List[Dict[str, object]]]:
+    """
+    {point: [{"midpoint": "Sun/Moon", "lon": 123.4, "orb": 0.31}, ...]}
+    for one chart, tightest first. `lon` is the midpoint's zodiac position
+    and `orb` the signed distance on the dial.
+    """
+    names = list(names)
+    lons = np.asarray(lons, dtype=np.float64)
+    hits = midpoint_hits_batch(lons[None, :], dial=dial, orb=orb)
+    mid_lons = compute_midpoints(lons)
+    index = {(int(a), int(b)): k for k, (a, b) in enumerate(zip(*midpoint_pairs(len(names))))}
+
+    tree: Dict[str, List[Dict[str, object]]] = {n: [] for n in names}
+    for p, a, b, d in zip(hits["point"].tolist(), hits["pair_a"].tolist(), hits["pair_b"].tolist(), hits["orb"].tolist()):
+        tree[names[p]].append({
+            "midpoint": f"{names[a]}/{names[b]}",
+            "lon": round(float(mid_lons[index[(a, b)]]), 4),
+            "orb": round(d, 3),
+        })
+    for entries in tree.values():
+        entries.sort(key=lambda e: abs(e["orb"]))
+    return tree
@@ -2,6 +2,8 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 
+from backend.astro_engine.astro_config import DEFAULT_HOUSE_SYSTEM, DEFAULT_ZODIAC
+
 class PlanetPlacement(BaseModel):
     name: str
     lon: float
@@ -9,7 +11,11 @@ class PlanetPlacement(BaseModel):
     deg_in_sign: float
     lat: Optional[float] = None
     dist: Optional[float] = None
+    speed: Optional[float] = None   # degrees/day in longitude (< 0 = retrograde)
     house: Optional[int] = None
+    ra: Optional[float] = None      # right ascension (degrees, of date)
+    decl: Optional[float] = None    # declination (degrees)
+    out_of_bounds: Optional[bool] = None   # |decl| beyond the obliquity
 
 class HouseCusp(BaseModel):
     house: int
@@ -17,6 +23,12 @@ class HouseCusp(BaseModel):
     sign: str
     deg_in_sign: float
 
+class HouseSystemView(BaseModel):
+    """Cusps and planet houses of one additional house system."""
+    system: str
+    houses: List[HouseCusp]
+    planet_houses: Dict[str, int]
+
 class AspectLink(BaseModel):
     p1: str
     p2: str
@@ -24,13 +36,38 @@ class AspectLink(BaseModel):
     angle: float
     orb: float
 
+class AspectPattern(BaseModel):
+    """Multi-body figure (grand trine, T-square, yod, ...) built from aspects."""
+    kind: str
+    bodies: List[str]
+    apex: Optional[str] = None      # focal point (T-square / yod apex, kite head)
+    links: List[AspectLink]
+    max_orb: float
+    strength: float                 # 0..1, mean tightness of the member aspects
+
+class FixedStarContact(BaseModel):
+    star: str
+    point: str
+    orb: float
+    star_lon: float
+    star_lat: float
+    magnitude: float
+
 class ChartModel(BaseModel):
     meta: Dict[str, str]
     asc: Optional[PlanetPlacement] = None
     mc: Optional[PlanetPlacement] = None
     planets: List[PlanetPlacement]
     houses: List[HouseCusp]
+    house_system: str = DEFAULT_HOUSE_SYSTEM
+    zodiac: str = DEFAULT_ZODIAC
+    sect: Optional[str] = None      # "day" / "night", from the Sun's house
+    alt_house_systems: Dict[str, HouseSystemView] = Field(default_factory=dict)
     aspects: List[AspectLink]
+    parallels: List[AspectLink] = Field(default_factory=list)
+    patterns: List[AspectPattern] = Field(default_factory=list)
+    fixed_stars: List[FixedStarContact] = Field(default_factory=list)
+    lots: List[PlanetPlacement] = Field(default_factory=list)
     elements: Dict[str, int]
     modalities: Dict[str, int]
     dominant_elements: List[str]
@@ -0,0 +1,155 @@
+"""
+packed_chart.py
+Compact binary layout for storing natal charts.
+
+One chart is one little-endian record of a numpy structured dtype:
+
+  header   magic "AC", format, flags (bit 0 = day sect, bit 1 = sect
+           known), engine version, house system / zodiac codes, body
+           count, jd_ut (f8), asc, mc (f4), 12 cusps (f4)
+  bodies   per body: id (index into PACKED_BODIES), house (0 = none),
+           flags (bit 0 = retrograde as in context_builder, so the
+           nodes only when direct; bit 1 = out of bounds), then lon,
+           lat, speed, decl as f4
+
+A ten-body chart is 264 bytes. float32 keeps longitudes to ~0.1″. Records
+with the same body count share a dtype, so a list of blobs decodes with
+one `np.frombuffer` per record size and no per-row parsing.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backend.astro_engine.astro_config import CHART_ENGINE_VERSION, HOUSE_SYSTEMS, ZODIAC_MODES
+from backend.astro_engine.bodies import BODIES, DERIVED_BODIES
+from backend.astro_engine.context_builder import retrograde_mask
+from backend.astro_engine.models.chart_model import ChartModel
+
+PACK_MAGIC = b"AC"
+PACK_FORMAT = 1
+PACKED_BODIES = (*BODIES, *DERIVED_BODIES)
+HOUSE_SYSTEM_CODES = tuple(HOUSE_SYSTEMS)
+ZODIAC_CODES = tuple(ZODIAC_MODES)
+
+SECT_DAY, SECT_KNOWN = 1, 2
+RETROGRADE, OUT_OF_BOUNDS = 1, 2
+
+_HEADER = [
+    ("magic", "S2"), ("format", "u1"), ("flags", "u1"), ("engine", "<u2"),
+    ("house_system", "u1"), ("zodiac", "u1"), ("n_bodies", "u1"), ("reserved", "u1"),
+    ("jd_ut", "<f8"), ("asc", "<f4"), ("mc", "<f4"), ("cusps", "<f4", (12,)),
+]
+_N_BODIES_AT = np.dtype(_HEADER).fields["n_bodies"][1]
+
+
+@lru_cache(maxsize=64)
+def record_dtype(n_bodies: int) -> np.dtype:
+    """Structured dtype of a packed chart with `n_bodies` bodies."""
+    n = (n_bodies,)
+    return np.dtype(_HEADER + [
+        ("body", "u1", n), ("house", "u1", n), ("body_flags", "u1", n),
+        ("lon", "<f4", n), ("lat", "<f4", n), ("speed", "<f4", n), ("decl", "<f4", n),
+    ])
+
+
+def pack_chart(chart: ChartModel, engine_version: int = CHART_ENGINE_VERSION) -> bytes:
+    """ChartModel → packed bytes (bodies must be in PACKED_BODIES)."""
+    planets = chart.planets
+    rec = np.zeros((), dtype=record_dtype(len(planets)))
+    rec["magic"] = PACK_MAGIC
+    rec["format"] = PACK_FORMAT
+    rec["engine"] = engine_version
+    rec["flags"] = (SECT_KNOWN if chart.sect else 0) | (SECT_DAY if chart.sect == "day" else 0)
+    rec["house_system"] = HOUSE_SYSTEM_CODES.index(chart.house_system)
+    rec["zodiac"] = ZODIAC_CODES.index(chart.zodiac)
+    rec["n_bodies"] = len(planets)
+    rec["jd_ut"] = float(chart.meta["jd_ut"])
+    rec["asc"] = chart.asc.lon if chart.asc else np.nan
+    rec["mc"] = chart.mc.lon if chart.mc else np.nan
+    rec["cusps"] = [h.lon for h in chart.houses] if len(chart.houses) == 12 else np.nan
+    try:
+        rec["body"] = [PACKED_BODIES.index(p.name) for p in planets]
+    except ValueError:
+        raise ValueError(f"Cannot pack bodies outside PACKED_BODIES: {[p.name for p in planets]}")
+    rec["house"] = [p.house or 0 for p in planets]
+    retro = retrograde_mask([p.name for p in planets], [np.nan if p.speed is None else p.speed for p in planets])
+    rec["body_flags"] = [(RETROGRADE if r else 0) | (OUT_OF_BOUNDS if p.out_of_bounds else 0)
+                         for r, p in zip(retro, planets)]
+    for field in ("lon", "lat", "speed", "decl"):
+        rec[field] = [np.nan if getattr(p, field) is None else getattr(p, field) for p in planets]
+    return rec.tobytes()
+
+
+def _n_bodies(blob: bytes) -> int:
+    if blob[:2] != PACK_MAGIC or blob[2] != PACK_FORMAT:
+        raise ValueError("Not a packed chart (bad magic or format).")
+    return blob[_N_BODIES_AT]
+
+
+class PackedChart:
+    """Read-only view of one packed record."""
+
+    def __init__(self, record: np.void):
+        self.record = record
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "PackedChart":
+        return cls(np.frombuffer(blob, dtype=record_dtype(_n_bodies(blob)))[0])
+
+    @property
+    def engine_version(self) -> int:
+        return int(self.record["engine"])
+
+    @property
+    def bodies(self) -> List[str]:
+        return [PACKED_BODIES[i] for i in self.record["body"].tolist()]
+
+    @property
+    def sect(self) -> Optional[str]:
+        flags = int(self.record["flags"])
+        return ("day" if flags & SECT_DAY else "night") if flags & SECT_KNOWN else None
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.record[field]
+
+    def to_dict(self) -> Dict[str, object]:
+        r = self.record
+        flags = r["body_flags"]
+        bodies = {}
+        for k, name in enumerate(self.bodies):
+            bodies[name] = {
+                "lon": round(float(r["lon"][k]), 5),
+                "lat": round(float(r["lat"][k]), 5),
+                "speed": round(float(r["speed"][k]), 5),
+                "decl": round(float(r["decl"][k]), 5),
+                "house": int(r["house"][k]) or None,
+                "retrograde": bool(flags[k] & RETROGRADE),
+                "out_of_bounds": bool(flags[k] & OUT_OF_BOUNDS),
+            }
+        return {
+            "engine_version": self.engine_version,
+            "jd_ut": float(r["jd_ut"]),
+            "house_system": HOUSE_SYSTEM_CODES[int(r["house_system"])],
+            "zodiac": ZODIAC_CODES[int(r["zodiac"])],
+            "sect": self.sect,
+            "asc": round(float(r["asc"]), 5),
+            "mc": round(float(r["mc"]), 5),
+            "cusps": np.round(r["cusps"].astype(np.float64), 5).tolist(),
+            "bodies": bodies,
+        }
+
+
+def unpack_charts(blobs: Sequence[bytes]) -> List[PackedChart]:
+    """Decode many blobs: one `np.frombuffer` per distinct record size."""
+    out: List[Optional[PackedChart]] = [None] * len(blobs)
+    groups: Dict[int, List[int]] = {}
+    for i, blob in enumerate(blobs):
+        groups.setdefault(_n_bodies(blob), []).append(i)
+    for n, rows in groups.items():
+        records = np.frombuffer(b"".join(blobs[i] for i in rows), dtype=record_dtype(n))
+        for i, record in zip(rows, records):
+            out[i] = PackedChart(record)
+    return out
@@ -0,0 +1,262 @@
+"""
+rectification.py
+Birth-time rectification: sweep a time window, score every candidate
+minute against the user's life events and rank the results.
+
+Pipeline
+  1. Ephemeris  — slow planets are computed once for the whole window;
+                  fast bodies are sampled coarsely and interpolated.
+  2. Houses     — ASC / MC / Placidus cusps for every candidate in one
+                  vectorized call (`house_batch`).
+  3. Scoring    — pluggable scorers, each vectorized over candidates.
+  4. Parallel   — candidate chunks can be spread over worker processes.
+"""
+
+from __future__ import annotations
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+import pytz
+
+from backend.astro_engine.astro_config import RECTIFICATION_MAX_CANDIDATES
+from backend.astro_engine.ephemeris_loader import PLANETS, compute_lon_speed, interpolated_planet_matrix
+from backend.astro_engine.house_batch import nutation_frame, sidereal_degrees, placidus_batch
+from backend.astro_engine.time_utils import resolve_tz, local_to_utc, to_julian_day, from_julian_day
+from backend.astro_engine.zodiac_utils import deg_to_sign, wrap180
+
+# Angle emphasised by each life-event kind (others still count at half weight)
+EVENT_ANGLE_FOCUS = {
+    "marriage": "dsc", "relationship": "dsc", "divorce": "dsc",
+    "career": "mc", "promotion": "mc", "graduation": "mc",
+    "home": "ic", "relocation": "ic", "family": "ic", "parent_death": "ic",
+    "accident": "asc", "illness": "asc", "birth_of_child": "asc",
+}
+ANGLE_NAMES = ("asc", "mc", "dsc", "ic")
+
+TRANSIT_WEIGHTS = {"Mars": 0.5, "Jupiter": 0.8, "Saturn": 1.0, "Uranus": 1.0, "Neptune": 0.7, "Pluto": 0.9}
+TRANSIT_ORB = 2.0
+DIRECTION_ORB = 1.0
+HARD_ASPECTS = (0.0, 90.0, 180.0)
+
+
+class CandidateBatch:
+    """Vectorized chart data for a block of candidate birth instants."""
+
+    def __init__(self, jds: np.ndarray, asc: np.ndarray, mc: np.ndarray,
+                 cusps: np.ndarray, names: Sequence[str], lons: np.ndarray):
+        self.jds = jds          # (N,)
+        self.asc = asc          # (N,)
+        self.mc = mc            # (N,)
+        self.cusps = cusps      # (N, 12)
+        self.names = list(names)
+        self.lons = lons        # (N, P)
+
+    def angles(self) -> Dict[str, np.ndarray]:
+        return {
+            "asc": self.asc, "mc": self.mc,
+            "dsc": (self.asc + 180.0) % 360.0, "ic": (self.mc + 180.0) % 360.0,
+        }
+
+
+class EventContext:
+    """Per-event quantities computed once and shared by all candidates."""
+
+    def __init__(self, jd_ut: float, kind: str, weight: float, transits: Dict[str, float], solar_arc: float):
+        self.jd_ut = jd_ut
+        self.kind = kind
+        self.weight = weight
+        self.transits = transits
+        self.solar_arc = solar_arc
+
+    def angle_weights(self) -> Dict[str, float]:
+        focus = EVENT_ANGLE_FOCUS.get(self.kind)
+        return {a: (1.0 if focus in (None, a) else 0.5) for a in ANGLE_NAMES}
+
+
+Scorer = Callable[[CandidateBatch, EventContext], np.ndarray]
+
+
+def _hit_strength(sep: np.ndarray, orb: float) -> np.ndarray:
+    """Gaussian closeness of a separation to the nearest hard aspect (0..1)."""
+    best = np.full(sep.shape, np.inf)
+    for a in HARD_ASPECTS:
+        best = np.minimum(best, np.abs(np.abs(wrap180(sep)) - a))
+    return np.where(best <= orb, np.exp(-0.5 * (best / (orb / 2.0)) ** 2), 0.0)
+
+
+# ------------------------------------------------------------
+# Built-in scorers
+# ------------------------------------------------------------
+def score_transits_to_angles(batch: CandidateBatch, event: EventContext) -> np.ndarray:
+    """Slow transits over the candidate angles at the event date."""
+    score = np.zeros(len(batch.jds))
+    weights = event.angle_weights()
+    for angle, lon in batch.angles().items():
+        for body, w in TRANSIT_WEIGHTS.items():
+            score += w * weights[angle] * _hit_strength(lon - event.transits[body], TRANSIT_ORB)
+    return score
+
+
+def score_solar_arc_angles(batch: CandidateBatch, event: EventContext) -> np.ndarray:
+    """Solar-arc directed angles aspecting natal planets at the event date."""
+    score = np.zeros(len(batch.jds))
+    weights = event.angle_weights()
+    for angle, lon in batch.angles().items():
+        directed = lon + event.solar_arc
+        score += weights[angle] * _hit_strength(directed[:, None] - batch.lons, DIRECTION_ORB).sum(axis=1)
+    return score
+
+
+SCORERS: Dict[str, Scorer] = {
+    "transits_to_angles": score_transits_to_angles,
+    "solar_arc_angles": score_solar_arc_angles,
+}
+
+
+# ------------------------------------------------------------
+# Pipeline
+# ------------------------------------------------------------
+def _event_context(event: Dict, birth_jd: float, natal_sun: float) -> EventContext:
+    dt = event["date"]
+    if isinstance(dt, str):
+        dt = datetime.fromisoformat(dt)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(pytz.utc).replace(tzinfo=None)
+    jd = to_julian_day(dt)
+    transits = {body: compute_lon_speed(jd, PLANETS[body])[0] for body in TRANSIT_WEIGHTS}
+    # Secondary-progressed Sun: one day after birth per year of life
+    age_years = (jd - birth_jd) / 365.2422
+    progressed_sun = compute_lon_speed(birth_jd + age_years, PLANETS["Sun"])[0]
+    return EventContext(jd, event.get("kind", "general"), float(event.get("weight", 1.0)),
+                        transits, wrap180(progressed_sun - natal_sun) % 360.0)
+
+
+def _score_chunk(jds, names, lons, lat, lon, eps, eq_eq, events, scorers) -> tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Houses + scoring for one block of candidates (runs in worker processes)."""
+    armc = (sidereal_degrees(jds, eq_eq) + lon) % 360.0
+    cusps, asc, mc = placidus_batch(armc, np.full(len(jds), lat), eps)
+    batch = CandidateBatch(jds, asc, mc, cusps, names, lons)
+    parts: Dict[str, np.ndarray] = {}
+    for name, scorer in scorers.items():
+        total = np.zeros(len(jds))
+        for ev in events:
+            total += ev.weight * scorer(batch, ev)
+        parts[name] = total
+    return np.vstack([asc, mc]), parts
+
+
+def _resolve_scorers(scorers: Optional[Sequence[Union[str, Scorer]]]) -> Dict[str, Scorer]:
+    if not scorers:
+        return dict(SCORERS)
+    out: Dict[str, Scorer] = {}
+    for s in scorers:
+        if isinstance(s, str):
+            if s not in SCORERS:
+                raise ValueError(f"Unknown scorer '{s}'. Available: {sorted(SCORERS)}")
+            out[s] = SCORERS[s]
+        else:
+            out[getattr(s, "__name__", repr(s))] = s
+    return out
+
+
+def rectify_birth_time(
+    window_start: datetime,
+    window_end: datetime,
+    lat: float,
+    lon: float,
+    events: Sequence[Dict],
+    tz_name: Optional[str] = None,
+    scorers: Optional[Sequence[Union[str, Scorer]]] = None,
+    step_minutes: float = 1.0,
+    top_k: int = 10,
+    workers: int = 1,
+) -> Dict[str, object]:
+    """
+    Rank candidate birth times in [window_start, window_end] (naive local times).
+    events: [{"date": datetime | ISO str, "kind": "career", "weight": 1.0}, ...]
+    Custom scorers must be top-level callables when workers > 1 (pickling);
+    workers are capped at the machine's CPU count.
+    """
+    if not events:
+        raise ValueError("At least one life event is required for rectification.")
+    if window_end <= window_start:
+        raise ValueError("window_end must be after window_start.")
+    if step_minutes <= 0:
+        raise ValueError("step_minutes must be positive.")
+
+    t0 = time.perf_counter()
+    tz = tz_name or resolve_tz(lat, lon)
+    jd0 = to_julian_day(local_to_utc(window_start, tz))
+    jd1 = to_julian_day(local_to_utc(window_end, tz))
+    n = int(round((jd1 - jd0) * 1440.0 / step_minutes)) + 1
+    if n > RECTIFICATION_MAX_CANDIDATES:
+        raise ValueError(f"Too many candidate times ({n}); at most {RECTIFICATION_MAX_CANDIDATES}. "
+                         "Narrow the window or increase step_minutes.")
+    jds = jd0 + np.arange(n) * (step_minutes / 1440.0)
+    scorer_map = _resolve_scorers(scorers)
+
+    # 1️⃣ Ephemeris (shared by every candidate)
+    names, lons = interpolated_planet_matrix(jds)
+    mid_jd = float(jds[n // 2])
+    eps, eq_eq = nutation_frame(mid_jd)
+    natal_sun = float(lons[n // 2, names.index("Sun")])
+    ctxs = [_event_context(ev, mid_jd, natal_sun) for ev in events]
+    t1 = time.perf_counter()
+
+    # 2️⃣ + 3️⃣ Houses and scoring, optionally spread across processes
+    workers = max(1, min(workers, n, os.cpu_count() or 1))
+    if workers == 1:
+        angles, parts = _score_chunk(jds, names, lons, lat, lon, eps, eq_eq, ctxs, scorer_map)
+    else:
+        bounds = np.linspace(0, n, workers + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_score_chunk, jds[a:b], names, lons[a:b], lat, lon, eps, eq_eq, ctxs, scorer_map)
+                for a, b in zip(bounds[:-1], bounds[1:]) if b > a
+            ]
+            results = [f.result() for f in futures]
+        angles = np.hstack([r[0] for r in results])
+        parts = {k: np.concatenate([r[1][k] for r in results]) for k in scorer_map}
+    t2 = time.perf_counter()
+
+    # 4️⃣ Ranking
+    total = sum(parts.values())
+    order = np.argsort(-total, kind="stable")[:top_k]
+    local_tz = pytz.timezone(tz)
+    candidates = []
+    for i in order:
+        dt_utc = from_julian_day(float(jds[i]))
+        asc_sign, asc_deg = deg_to_sign(float(angles[0, i]))
+        candidates.append({
+            "dt_local": dt_utc.astimezone(local_tz).replace(tzinfo=None).isoformat(),
+            "dt_utc": dt_utc.isoformat(),
+            "jd_ut": round(float(jds[i]), 6),
+            "score": round(float(total[i]), 4),
+            "scores": {k: round(float(v[i]), 4) for k, v in parts.items()},
+            "asc": round(float(angles[0, i]), 3),
+            "asc_sign": asc_sign,
+            "asc_deg_in_sign": round(asc_deg, 2),
+            "mc": round(float(angles[1, i]), 3),
+        })
+    t3 = time.perf_counter()
+
+    return {
+        "tz_name": tz,
+        "candidates": candidates,
+        "stats": {
+            "candidates": n,
+            "events": len(ctxs),
+            "workers": workers,
+            "timings_ms": {
+                "ephemeris": round((t1 - t0) * 1000, 2),
+                "houses_and_scoring": round((t2 - t1) * 1000, 2),
+                "ranking": round((t3 - t2) * 1000, 2),
+                "total": round((t3 - t0) * 1000, 2),
+            },
+            "candidates_per_sec": round(n / max(t3 - t0, 1e-9), 1),
+        },
+    }
@@ -0,0 +1,206 @@
+"""
+relationship_charts.py
+Composite and Davison charts for every pair in a group.
+
+Composite: the nearer midpoint of each body's two natal longitudes. Natal
+longitudes are stacked into one (people × bodies) array, and all
+N·(N−1)/2 pairs come from a single vectorized midpoint over the
+`midpoint_pairs` index arrays. Composite cusps are the composite ASC plus
+the mean distance of each natal cusp from its own ASC, which keeps the
+twelve cusps in order even where the two ASCs lie far apart.
+
+Davison: a real chart cast for the midpoint in time (mean Julian Day) and
+space (great-circle midpoint of the birthplaces). Every pair's positions
+come from one multi-instant `compute_bodies_multi` call, and cusps from
+one `cusps_batch` pass.
+
+Natal charts come from the `get_natal_chart` cache, so a person who
+appears in many groups is only computed once.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.astro_engine.astro_config import DEFAULT_HOUSE_SYSTEM, DEFAULT_ZODIAC
+from backend.astro_engine.ayanamsa import ayanamsa, resolve_zodiac
+from backend.astro_engine.bodies import DEFAULT_BODY_SET, LON, compute_bodies_multi
+from backend.astro_engine.chart_generator import _cached_natal_chart
+from backend.astro_engine.house_batch import nutation_frame, sidereal_degrees, cusps_batch, locate_houses_batch
+from backend.astro_engine.midpoints import midpoint_pairs
+from backend.astro_engine.time_utils import local_to_utc, to_julian_day
+from backend.astro_engine.zodiac_utils import to_zodiac
+
+# (dt_local, lat, lon, tz_name or None)
+Birth = Tuple[datetime, float, float, Optional[str]]
+
+
+def circular_midpoints(a, b) -> np.ndarray:
+    """Nearer midpoint of two longitude arrays, element-wise."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    return (a + ((b - a + 180.0) % 360.0 - 180.0) / 2.0) % 360.0
+
+
+def geo_midpoints(lat_a, lon_a, lat_b, lon_b) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Great-circle midpoints (lat, lon) of coordinate arrays. Antipodal
+    pairs have no unique midpoint; they get the mean latitude and the
+    nearer mean longitude instead.
+    """
+    pa, la, pb, lb = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat_a, lon_a, lat_b, lon_b))
+    x = np.cos(pa) * np.cos(la) + np.cos(pb) * np.cos(lb)
+    y = np.cos(pa) * np.sin(la) + np.cos(pb) * np.sin(lb)
+    z = np.sin(pa) + np.sin(pb)
+    r = np.hypot(x, y)
+    lat = np.degrees(np.arctan2(z, r))
+    lon = np.degrees(np.arctan2(y, x))
+    degenerate = np.hypot(r, z) < 1e-9
+    if np.any(degenerate):
+        lat = np.where(degenerate, np.degrees(pa + pb) / 2.0, lat)
+        lon = np.where(degenerate, circular_midpoints(np.degrees(la), np.degrees(lb)), lon)
+    return lat, (lon + 180.0) % 360.0 - 180.0
+
+
+# ------------------------------------------------------------
+# Natal inputs
+# ------------------------------------------------------------
+def natal_arrays(
+    births: Sequence[Birth],
+    house_system: str = DEFAULT_HOUSE_SYSTEM,
+    zodiac: str = DEFAULT_ZODIAC,
+    body_set: str = DEFAULT_BODY_SET,
+) -> Dict[str, object]:
+    """
+    Stack the cached natal charts of a group: bodies present in every
+    chart, (N, B) longitudes, (N,) ASC / MC, (N, 12) cusps and the birth
+    instants and places.
+    """
+    # read-only use of the shared cache entries: skip get_natal_chart's defensive copy
+    charts = [_cached_natal_chart(dt, lat, lon, tz, False, house_system, (), zodiac, body_set, (), False)
+              for dt, lat, lon, tz in births]
+    names = [p.name for p in charts[0].planets]
+    for chart in charts[1:]:
+        present = {p.name for p in chart.planets}
+        names = [n for n in names if n in present]
+    lons = np.empty((len(charts), len(names)))
+    for i, chart in enumerate(charts):
+        by_name = {p.name: p.lon for p in chart.planets}
+        lons[i] = [by_name[n] for n in names]
+    return {
+        "bodies": names,
+        "lons": lons,
+        "asc": np.array([c.asc.lon for c in charts]),
+        "mc": np.array([c.mc.lon for c in charts]),
+        "cusps": np.array([[h.lon for h in c.houses] for c in charts]),
+        "jd": np.array([to_julian_day(local_to_utc(dt, c.meta["tz_name"])) for (dt, *_), c in zip(births, charts)]),
+        "lat": np.array([b[1] for b in births], dtype=np.float64),
+        "lon": np.array([b[2] for b in births], dtype=np.float64),
+    }
+
+
+# ------------------------------------------------------------
+# Composite
+# ------------------------------------------------------------
+def composite_batch(lons, asc, mc, cusps) -> Dict[str, np.ndarray]:
+    """
+    Composite charts for all pairs a < b of N natal charts.
+    (N, B) longitudes, (N,) ASC / MC, (N, 12) cusps → per-pair arrays in
+    `midpoint_pairs(N)` order: lons (M, B), asc, mc (M,), cusps (M, 12),
+    houses (M, B).
+    """
+    lons = np.asarray(lons, dtype=np.float64)
+    asc = np.asarray(asc, dtype=np.float64)
+    cusps = np.asarray(cusps, dtype=np.float64)
+    a, b = midpoint_pairs(len(lons))
+    comp_lons = circular_midpoints(lons[a], lons[b])
+    comp_asc = circular_midpoints(asc[a], asc[b])
+    comp_mc = circular_midpoints(np.asarray(mc)[a], np.asarray(mc)[b])
+    spans = (cusps - asc[:, None]) % 360.0          # cusp distance past its own ASC, monotone in the house
+    comp_cusps = (comp_asc[:, None] + (spans[a] + spans[b]) / 2.0) % 360.0
+    houses, _ = locate_houses_batch(comp_lons, comp_cusps)
+    return {"lons": comp_lons, "asc": comp_asc, "mc": comp_mc, "cusps": comp_cusps, "houses": houses}
+
+
+# ------------------------------------------------------------
+# Davison
+# ------------------------------------------------------------
+def davison_batch(
+    jds,
+    lats,
+    lons,
+    bodies: Sequence[str],
+    house_system: str = DEFAULT_HOUSE_SYSTEM,
+    zodiac: str = DEFAULT_ZODIAC,
+) -> Dict[str, np.ndarray]:
+    """
+    Davison charts for all pairs a < b of N births given as (N,) Julian
+    Days and coordinates. Returns per-pair arrays in `midpoint_pairs(N)`
+    order: jd, lat, lon (M,), lons (M, B), asc, mc (M,), cusps (M, 12),
+    houses (M, B).
+    """
+    jds = np.asarray(jds, dtype=np.float64)
+    a, b = midpoint_pairs(len(jds))
+    mid_jd = (jds[a] + jds[b]) / 2.0
+    mid_lat, mid_lon = geo_midpoints(np.asarray(lats)[a], np.asarray(lons)[a], np.asarray(lats)[b], np.asarray(lons)[b])
+
+    positions = compute_bodies_multi(mid_jd, bodies)
+    ay = ayanamsa(mid_jd, resolve_zodiac(zodiac))
+    body_lons = to_zodiac(positions[:, :, LON], ay[:, None])
+
+    frames = np.array([nutation_frame(float(jd)) for jd in mid_jd]).reshape(-1, 2)
+    eps, eq_eq = frames[:, 0], frames[:, 1]
+    armc = (sidereal_degrees(mid_jd, eq_eq) + mid_lon) % 360.0
+    cusps, asc, mc = cusps_batch(house_system, armc, mid_lat, eps, ayanamsa=ay)
+    cusps, asc, mc = to_zodiac(cusps, ay[:, None]), to_zodiac(asc, ay), to_zodiac(mc, ay)
+    houses, _ = locate_houses_batch(body_lons, cusps)
+    return {
+        "jd": mid_jd, "lat": mid_lat, "lon": mid_lon,
+        "lons": body_lons, "asc": asc, "mc": mc, "cusps": cusps, "houses": houses,
+    }
+
+
+# ------------------------------------------------------------
+# Group entry point
+# ------------------------------------------------------------
+def _table(block: Dict[str, np.ndarray]) -> Dict[str, list]:
+    out = {}
+    for key, values in block.items():
+        if key == "houses":
+            out[key] = values.tolist()
+        else:
+            out[key] = np.round(values, 6).tolist()
+    return out
+
+
+def relationship_charts(
+    births: Sequence[Birth],
+    house_system: str = DEFAULT_HOUSE_SYSTEM,
+    zodiac: str = DEFAULT_ZODIAC,
+    body_set: str = DEFAULT_BODY_SET,
+    include_davison: bool = True,
+) -> Dict[str, object]:
+    """
+    Composite (and Davison) charts for every pair of a group, as a compact
+    column-oriented table:
+      bodies         — shared by all rows
+      pairs          — [a, b] indices into `births`, one per row
+      composite      — lons / houses per body, asc, mc, 12 cusps per row
+      davison        — the same plus jd, lat, lon of the chart (optional)
+    """
+    if len(births) < 2:
+        raise ValueError("At least two people are required.")
+    natal = natal_arrays(births, house_system=house_system, zodiac=zodiac, body_set=body_set)
+    a, b = midpoint_pairs(len(births))
+    result: Dict[str, object] = {
+        "meta": {"house_system": house_system, "zodiac": zodiac, "body_set": body_set, "people": len(births)},
+        "bodies": natal["bodies"],
+        "pairs": np.stack([a, b], axis=1).tolist(),
+        "composite": _table(composite_batch(natal["lons"], natal["asc"], natal["mc"], natal["cusps"])),
+    }
+    if include_davison:
+        result["davison"] = _table(davison_batch(natal["jd"], natal["lat"], natal["lon"], natal["bodies"],
+                                                 house_system=house_system, zodiac=zodiac))
+    return result
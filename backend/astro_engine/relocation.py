@@ -0,0 +1,79 @@
+"""
+relocation.py
+Relocation charts for one birth instant at many locations.
+
+Planetary longitudes and planet-to-planet aspects do not depend on where
+the chart is cast, so they are computed once. Only ARMC, angles, cusps and
+house placements change per location, and those are batch-computed with
+the vectorized kernels in `house_batch`.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.astro_engine.aspects_detector import detect_aspects
+from backend.astro_engine.astro_config import DEFAULT_HOUSE_SYSTEM
+from backend.astro_engine.ephemeris_loader import compute_planet_lon_lat
+from backend.astro_engine.house_batch import (
+    nutation_frame, sidereal_degrees, cusps_batch, assign_houses_batch,
+)
+from backend.astro_engine.time_utils import resolve_tz, local_to_utc, to_julian_day
+
+
+def relocate_chart_batch(
+    dt_local: datetime,
+    birth_lat: float,
+    birth_lon: float,
+    locations: Sequence[Tuple[float, float]],
+    tz_name: Optional[str] = None,
+    house_system: str = DEFAULT_HOUSE_SYSTEM,
+) -> Dict[str, object]:
+    """
+    Relocated angles, cusps and house placements for every (lat, lon) in
+    `locations`. The birth instant is fixed by the birthplace timezone.
+
+    Returns a compact column-oriented table:
+      bodies / planet_lons / aspects — shared by all rows
+      lat, lon, asc, mc              — one value per location
+      cusps                          — 12 cusps per location
+      houses                         — one house per body per location
+    """
+    tz = tz_name or resolve_tz(birth_lat, birth_lon)
+    dt_utc = local_to_utc(dt_local, tz)
+    jd_ut = to_julian_day(dt_utc)
+
+    # --- Location-independent: planets + aspects, once
+    planets_raw = compute_planet_lon_lat(dt_utc)
+    names = list(planets_raw.keys())
+    planet_lons = np.array([planets_raw[n]["lon"] for n in names], dtype=np.float64)
+    aspects = detect_aspects(dict(zip(names, planet_lons.tolist())))
+
+    # --- Location-dependent: one vectorized pass over all rows
+    locs = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+    lats, lons = locs[:, 0], locs[:, 1]
+    eps, eq_eq = nutation_frame(jd_ut)
+    armc = (sidereal_degrees(jd_ut, eq_eq) + lons) % 360.0
+    cusps, asc, mc = cusps_batch(house_system, armc, lats, eps)
+    houses = assign_houses_batch(np.broadcast_to(planet_lons, (len(locs), len(names))), cusps)
+
+    return {
+        "meta": {
+            "tz_name": tz,
+            "house_system": house_system,
+            "dt_local": dt_local.isoformat(),
+            "dt_utc": dt_utc.isoformat(),
+            "jd_ut": f"{jd_ut:.6f}",
+        },
+        "bodies": names,
+        "planet_lons": np.round(planet_lons, 6).tolist(),
+        "aspects": [a.model_dump() for a in aspects],
+        "lat": lats.tolist(),
+        "lon": lons.tolist(),
+        "asc": np.round(asc, 6).tolist(),
+        "mc": np.round(mc, 6).tolist(),
+        "cusps": np.round(cusps, 6).tolist(),
+        "houses": houses.tolist(),
+    }
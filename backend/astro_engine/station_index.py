@@ -0,0 +1,218 @@
+"""
+station_index.py
+Retrograde station, shadow period and sign ingress index.
+
+The ephemeris is scanned once over a date range; every station, shadow
+window and ingress is stored in compact sorted arrays per body, so later
+queries ("is Mercury retrograde at t", "next ingress after t") are
+binary searches instead of fresh ephemeris calls.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.astro_engine.ephemeris_loader import PLANETS, compute_lon_speed, sample_lon_speed
+from backend.astro_engine.event_search import find_root, sign_change_brackets
+from backend.astro_engine.time_utils import to_julian_day
+from backend.astro_engine.zodiac_utils import SIGNS, normalize_lon, wrap180
+
+STATION_RETROGRADE = -1
+STATION_DIRECT = 1
+
+# Scan resolution in days; the fastest body (Moon) moves ~15°/day,
+# so no sign can be skipped between two samples.
+DEFAULT_STEP_DAYS = 1.0
+
+
+class BodyEvents:
+    """Sorted event arrays for a single body."""
+
+    __slots__ = (
+        "retrograde_at_start",
+        "station_jd", "station_lon", "station_kind",
+        "ingress_jd", "ingress_sign",
+        "shadow_start", "shadow_end",
+    )
+
+    def __init__(self):
+        self.retrograde_at_start = False
+        self.station_jd = np.empty(0, dtype=np.float64)
+        self.station_lon = np.empty(0, dtype=np.float64)
+        self.station_kind = np.empty(0, dtype=np.int8)
+        self.ingress_jd = np.empty(0, dtype=np.float64)
+        self.ingress_sign = np.empty(0, dtype=np.int8)
+        # One entry per retrograde station
+        self.shadow_start = np.empty(0, dtype=np.float64)
+        self.shadow_end = np.empty(0, dtype=np.float64)
+
+
+def _lon_crossing(pid: int, jds: np.ndarray, lons: np.ndarray, target: float,
+                  lo: int, hi: int, last: bool) -> float:
+    """Time the body crosses `target` longitude (forward) between samples lo..hi."""
+    if hi <= lo:
+        return float("nan")
+    rel = wrap180(lons[lo:hi + 1] - target)
+    idx = sign_change_brackets(rel, max_jump=180.0)
+    idx = idx[rel[idx] < 0]  # forward crossings only
+    if len(idx) == 0:
+        return float("nan")
+    i = lo + int(idx[-1] if last else idx[0])
+    func = lambda t: wrap180(compute_lon_speed(t, pid)[0] - target)
+    return find_root(func, float(jds[i]), float(jds[i + 1]), float(rel[i - lo]), float(rel[i + 1 - lo]))
+
+
+def _scan_body(pid: int, jds: np.ndarray) -> BodyEvents:
+    lons, speeds = sample_lon_speed(pid, jds)
+    ev = BodyEvents()
+    ev.retrograde_at_start = bool(speeds[0] < 0)
+
+    # --- Stations: zero crossings of the speed
+    speed_of = lambda t: compute_lon_speed(t, pid)[1]
+    st_jd, st_lon, st_kind = [], [], []
+    for i in sign_change_brackets(speeds):
+        t = find_root(speed_of, float(jds[i]), float(jds[i + 1]), float(speeds[i]), float(speeds[i + 1]))
+        st_jd.append(t)
+        st_lon.append(compute_lon_speed(t, pid)[0])
+        st_kind.append(STATION_RETROGRADE if speeds[i] > 0 else STATION_DIRECT)
+
+    # --- Ingresses: changes of sign index (both directions)
+    sign_idx = (normalize_lon(lons) // 30.0).astype(np.int8)
+    in_jd, in_sign = [], []
+    for i in np.nonzero(sign_idx[1:] != sign_idx[:-1])[0]:
+        old, new = int(sign_idx[i]), int(sign_idx[i + 1])
+        forward = wrap180(lons[i + 1] - lons[i]) > 0
+        boundary = (new if forward else old) * 30.0
+        func = lambda t, b=boundary: wrap180(compute_lon_speed(t, pid)[0] - b)
+        in_jd.append(find_root(func, float(jds[i]), float(jds[i + 1]),
+                               float(wrap180(lons[i] - boundary)), float(wrap180(lons[i + 1] - boundary))))
+        in_sign.append(new)
+
+    ev.station_jd = np.asarray(st_jd, dtype=np.float64)
+    ev.station_lon = np.asarray(st_lon, dtype=np.float64)
+    ev.station_kind = np.asarray(st_kind, dtype=np.int8)
+    ev.ingress_jd = np.asarray(in_jd, dtype=np.float64)
+    ev.ingress_sign = np.asarray(in_sign, dtype=np.int8)
+
+    # --- Shadows: pre-shadow starts when the body first reaches the degree of
+    # the coming direct station; post-shadow ends when it regains the degree
+    # of the retrograde station. Crossings outside the scanned range are
+    # clipped to the station itself (or the range end).
+    sh_start, sh_end = [], []
+    for k in np.nonzero(ev.station_kind == STATION_RETROGRADE)[0]:
+        sr_jd, sr_lon = ev.station_jd[k], ev.station_lon[k]
+        start = end = float("nan")
+        if k + 1 < len(ev.station_jd):
+            sd_jd, sd_lon = ev.station_jd[k + 1], ev.station_lon[k + 1]
+            sr_i = int(np.searchsorted(jds, sr_jd))
+            sd_i = int(np.searchsorted(jds, sd_jd))
+            prev_sd_i = int(np.searchsorted(jds, ev.station_jd[k - 1])) if k > 0 else 0
+            next_sr_i = (
+                int(np.searchsorted(jds, ev.station_jd[k + 2])) if k + 2 < len(ev.station_jd) else len(jds) - 1
+            )
+            start = _lon_crossing(pid, jds, lons, sd_lon, prev_sd_i, sr_i, last=True)
+            end = _lon_crossing(pid, jds, lons, sr_lon, sd_i, next_sr_i, last=False)
+        sh_start.append(sr_jd if np.isnan(start) else start)
+        sh_end.append(float(jds[-1]) if np.isnan(end) else end)
+    ev.shadow_start = np.asarray(sh_start, dtype=np.float64)
+    ev.shadow_end = np.asarray(sh_end, dtype=np.float64)
+    return ev
+
+
+class StationIndex:
+    """
+    Station / ingress index over [jd_start, jd_end] for a set of bodies.
+    All queries are O(log n) binary searches over the stored arrays.
+    """
+
+    def __init__(self, jd_start: float, jd_end: float, events: Dict[str, BodyEvents]):
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self.events = events
+
+    # ------------------------------------------------------------
+    # Point queries
+    # ------------------------------------------------------------
+    def _check_range(self, jd: float) -> None:
+        if not (self.jd_start <= jd <= self.jd_end):
+            raise ValueError(f"JD {jd} outside indexed range {self.jd_start}–{self.jd_end}.")
+
+    def is_retrograde(self, body: str, jd: float) -> bool:
+        self._check_range(jd)
+        ev = self.events[body]
+        i = int(np.searchsorted(ev.station_jd, jd, side="right")) - 1
+        if i < 0:
+            return ev.retrograde_at_start
+        return bool(ev.station_kind[i] == STATION_RETROGRADE)
+
+    def in_shadow(self, body: str, jd: float) -> bool:
+        """True between the pre-shadow start and the post-shadow end."""
+        self._check_range(jd)
+        ev = self.events[body]
+        i = int(np.searchsorted(ev.shadow_start, jd, side="right")) - 1
+        if i < 0:
+            return False
+        return bool(jd <= ev.shadow_end[i])
+
+    def next_station(self, body: str, jd: float) -> Optional[Tuple[float, int]]:
+        ev = self.events[body]
+        i = int(np.searchsorted(ev.station_jd, jd, side="right"))
+        if i >= len(ev.station_jd):
+            return None
+        return float(ev.station_jd[i]), int(ev.station_kind[i])
+
+    def next_ingress(self, body: str, jd: float) -> Optional[Tuple[float, str]]:
+        ev = self.events[body]
+        i = int(np.searchsorted(ev.ingress_jd, jd, side="right"))
+        if i >= len(ev.ingress_jd):
+            return None
+        return float(ev.ingress_jd[i]), SIGNS[int(ev.ingress_sign[i])]
+
+    def retrograde_flags(self, jd: float) -> Dict[str, bool]:
+        """{body: is_retrograde} at `jd`, ready for the `is_retrograde` context flag."""
+        return {body: self.is_retrograde(body, jd) for body in self.events}
+
+    # ------------------------------------------------------------
+    # Range queries
+    # ------------------------------------------------------------
+    def retrograde_periods(self, body: str) -> List[Dict[str, Optional[float]]]:
+        """Every retrograde period fully or partly inside the indexed range."""
+        ev = self.events[body]
+        out: List[Dict[str, Optional[float]]] = []
+        sr_positions = np.nonzero(ev.station_kind == STATION_RETROGRADE)[0]
+        for n, k in enumerate(sr_positions):
+            sd = float(ev.station_jd[k + 1]) if k + 1 < len(ev.station_jd) else None
+            out.append({
+                "station_retrograde": float(ev.station_jd[k]),
+                "station_direct": sd,
+                "shadow_start": float(ev.shadow_start[n]),
+                "shadow_end": float(ev.shadow_end[n]),
+            })
+        return out
+
+
+def build_station_index(
+    jd_start: float,
+    jd_end: float,
+    bodies: Optional[Iterable[str]] = None,
+    step_days: float = DEFAULT_STEP_DAYS,
+) -> StationIndex:
+    """Scan the ephemeris once over [jd_start, jd_end] and index all events."""
+    names = list(bodies) if bodies is not None else list(PLANETS.keys())
+    jds = np.arange(jd_start, jd_end + step_days, step_days, dtype=np.float64)
+    events = {name: _scan_body(PLANETS[name], jds) for name in names}
+    return StationIndex(jd_start, float(jds[-1]), events)
+
+
+@lru_cache(maxsize=8)
+def station_index_for_year(year: int) -> StationIndex:
+    """
+    Cached index for one calendar year. The scan is padded on both sides so
+    shadow periods of retrogrades near the year boundary are complete.
+    """
+    jd0 = to_julian_day(datetime(year, 1, 1))
+    jd1 = to_julian_day(datetime(year + 1, 1, 1))
+    return build_station_index(jd0 - 120.0, jd1 + 120.0)
@@ -1,5 +1,5 @@
 # backend/astro_engine/time_utils.py
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from timezonefinder import TimezoneFinder
 import pytz
 import math
@@ -31,3 +31,25 @@ def to_julian_day(dt_utc: datetime) -> float:
     B = 2 - A + math.floor(A/4)
     jd = math.floor(365.25*(year+4716)) + math.floor(30.6001*(month+1)) + day + B - 1524.5
     return jd
+
+def from_julian_day(jd: float) -> datetime:
+    """Inverse of `to_julian_day`: Julian Day (UT) → aware UTC datetime."""
+    # Algorithm: Meeus, Astronomical Algorithms ch. 7
+    jd = jd + 0.5
+    Z = math.floor(jd)
+    F = jd - Z
+    if Z < 2299161:
+        A = Z
+    else:
+        alpha = math.floor((Z - 1867216.25) / 36524.25)
+        A = Z + 1 + alpha - math.floor(alpha / 4)
+    B = A + 1524
+    C = math.floor((B - 122.1) / 365.25)
+    D = math.floor(365.25 * C)
+    E = math.floor((B - D) / 30.6001)
+    day = B - D - math.floor(30.6001 * E) + F
+    month = E - 1 if E < 14 else E - 13
+    year = C - 4716 if month > 2 else C - 4715
+    day_int = int(day)
+    seconds = round((day - day_int) * 86400)
+    return datetime(year, month, day_int, tzinfo=timezone.utc) + timedelta(seconds=seconds)
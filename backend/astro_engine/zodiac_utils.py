@@ -22,13 +22,29 @@ def normalize_lon(deg: float) -> float:
     """Normalize any angle to 0–360°."""
     return deg % 360.0
 
-def deg_to_sign(lon: float) -> tuple[str,float]:
-    """Return sign & degree-in-sign for a longitude."""
-    lon = normalize_lon(lon)
+def wrap180(deg):
+    """Wrap an angle (or array of angles) to the signed range -180…+180°."""
+    return (deg + 180.0) % 360.0 - 180.0
+
+def to_zodiac(lon, ayanamsa=0.0):
+    """Tropical longitude (or array) → longitude in a zodiac offset by `ayanamsa`."""
+    return (lon - ayanamsa) % 360.0
+
+def deg_to_sign(lon: float, ayanamsa: float = 0.0) -> tuple[str,float]:
+    """Return sign & degree-in-sign for a longitude (sidereal when ayanamsa > 0)."""
+    lon = to_zodiac(lon, ayanamsa)
     sign_index = int(lon // 30)
     deg_in_sign = lon % 30
     return SIGNS[sign_index], deg_in_sign
 
+def whole_sign_cusps(asc_lon: float, ayanamsa: float = 0.0) -> list[float]:
+    """
+    Whole-sign cusps: house 1 is the whole sign of the Ascendant in the
+    chosen zodiac. Cusps are returned in the same frame as `asc_lon`.
+    """
+    first = (to_zodiac(asc_lon, ayanamsa) // 30) * 30 + ayanamsa
+    return [normalize_lon(first + 30 * i) for i in range(12)]
+
 def element_and_modality_counts(planets: list[dict]) -> tuple[dict,dict]:
     """Count elements & modalities from planet placements."""
     elem_counts = {"Fire":0,"Earth":0,"Air":0,"Water":0}
@@ -1,7 +1,7 @@
 # backend/core/config.py
 from __future__ import annotations
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -26,6 +26,30 @@ class Settings(BaseSettings):
     # horoscope_service.py expects DATA_DIR to exist.
     DATA_DIR: str = Field(default="data")
 
+    # ------------------------------------------------------------------
+    # Astro engine
+    # ------------------------------------------------------------------
+    # Brightest-first cap on the fixed-star catalog used for conjunctions
+    # (None = the whole embedded catalog, 57 stars)
+    FIXED_STAR_MAX_COUNT: Optional[int] = Field(default=None)
+    # Essential dignity tables: "egyptian" / "ptolemaic" terms,
+    # "dorothean" / "lilly" triplicity rulers
+    DIGNITY_TERMS: Literal["egyptian", "ptolemaic"] = Field(default="egyptian")
+    DIGNITY_TRIPLICITY: Literal["dorothean", "lilly"] = Field(default="dorothean")
+    # precision_norm_map: "minmax" (within the chart) or "percentile"
+    # (population percentiles from the calibration sketches below)
+    PRECISION_NORMALIZATION: Literal["minmax", "percentile"] = Field(default="minmax")
+    PRECISION_CALIBRATION_PATH: str = Field(default="data/calibration/precision_sketches.json")
+    # Similar-chart search: memory-mapped embeddings + IVF index
+    SIMILARITY_INDEX_DIR: str = Field(default="data/similarity")
+    SIMILARITY_NLIST: int = Field(default=256)
+    SIMILARITY_NPROBE: int = Field(default=12)
+    # Embed + index new Profile rows as they are committed (single writer:
+    # enable in one server process only)
+    SIMILARITY_AUTO_INDEX: bool = Field(default=False)
+    # Pack and store the natal chart when a Profile row is inserted
+    PROFILE_CHART_PRECOMPUTE: bool = Field(default=True)
+
     # ------------------------------------------------------------------
     # Database
     # ------------------------------------------------------------------
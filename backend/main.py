@@ -30,13 +30,36 @@ async def lifespan(app: FastAPI):
     # --------------------------
     try:
         Base.metadata.create_all(bind=engine)
+        # create_all does not alter existing tables: add the stored-chart columns
+        from backend.services.profile_charts import ensure_chart_columns
+        added = ensure_chart_columns(engine)
+        if added:
+            logger.info(f"🧱 Added profile columns: {', '.join(added)}")
         logger.info("✅ Database initialized successfully.")
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
         raise
 
+    # --------------------------
+    # Similar-chart index: pick up new profiles as they arrive
+    # --------------------------
+    if settings.SIMILARITY_AUTO_INDEX:
+        from backend.services.similarity_index import enable_profile_indexing
+        enable_profile_indexing()
+        logger.info("🔎 Similar-chart indexing enabled for new profiles.")
+
+    # --------------------------
+    # Stored charts: pack each new profile's chart on insert
+    # --------------------------
+    if settings.PROFILE_CHART_PRECOMPUTE:
+        from backend.services.profile_charts import enable_chart_precompute
+        enable_chart_precompute()
+
     yield
 
+    if settings.SIMILARITY_AUTO_INDEX:
+        from backend.services.similarity_index import get_similarity_index
+        get_similarity_index().save()
     logger.info("🛑 Shutting down AI Astrom backend...")
 
 
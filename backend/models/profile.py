@@ -1,34 +1,11 @@
 # backend/models/profile.py
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Integer, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 from backend.core.db import Base
-# backend/models/profile.py
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
-from backend.core.db import Base
-
-class Profile(Base):
-    __tablename__ = "profiles"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
-    name = Column(String(100), nullable=False)
-    birth_datetime = Column(DateTime(timezone=True), nullable=False)
-    city = Column(String(120))
-    country = Column(String(120))
-    lat = Column(Float)
-    lon = Column(Float)
-    tz_name = Column(String(80))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-
-    # Relationship to User
-    user = relationship("User", backref="profiles")
+from backend.models.user import User  # noqa: F401  (target of the relationship below)
 
 class Profile(Base):
     __tablename__ = "profiles"
@@ -42,6 +19,9 @@ class Profile(Base):
     lat = Column(Float)
     lon = Column(Float)
     tz_name = Column(String(80))
+    # Packed natal chart (astro_engine.packed_chart) + engine version it was computed with
+    chart_packed = Column(LargeBinary)
+    chart_version = Column(Integer, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationship to User
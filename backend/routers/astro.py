@@ -1,11 +1,28 @@
 # backend/routers/astro.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from backend.models.astro_request import ChartRequest
-from backend.astro_engine.chart_generator import build_natal_chart
+from backend.schemas.astro_schema import (
+    RectificationRequest, RelocationRequest, AstrocartographyRequest, SimilarChartsRequest,
+    RelationshipChartsRequest,
+)
+from backend.astro_engine.astro_config import HOUSE_SYSTEMS, ZODIAC_MODES, MIDPOINT_DIALS, RELATIONSHIP_MAX_PEOPLE
+from backend.astro_engine.bodies import resolve_bodies
+from backend.astro_engine.chart_generator import get_natal_chart
+from backend.astro_engine.dispositor_chain import DispositorGraph
+from backend.astro_engine.midpoints import midpoint_tree
+from backend.astro_engine.harmonics import harmonic_profile
 from backend.services.horoscope_service import analyze_chart
 from backend.services.ai_service import AIService
 from backend.services.report_builder import build_markdown_report
+from backend.services.uncertainty_service import analyze_birth_time_uncertainty
+from backend.services.chart_embedding import chart_embedding
+from backend.services.similarity_index import get_similarity_index
+from backend.astro_engine.lunar_calendar import lunar_calendar, LUNAR_CALENDAR_VERSION
+from backend.astro_engine.rectification import rectify_birth_time
+from backend.astro_engine.relocation import relocate_chart_batch
+from backend.astro_engine.relationship_charts import relationship_charts
+from backend.astro_engine.astrocartography import build_astrocartography
 
 router = APIRouter(prefix="/astro", tags=["Astrology"])
 
@@ -15,14 +32,30 @@ def compute_chart(request: ChartRequest):
     """
     Compute natal chart → analyze → AI narrative → Markdown report + precision JSON.
     """
+    if request.house_system not in HOUSE_SYSTEMS or not set(request.extra_house_systems) <= set(HOUSE_SYSTEMS):
+        raise HTTPException(status_code=400, detail=f"Unknown house system. Available: {sorted(HOUSE_SYSTEMS)}")
+    if request.zodiac not in ZODIAC_MODES:
+        raise HTTPException(status_code=400, detail=f"Unknown zodiac. Available: {sorted(ZODIAC_MODES)}")
+    if request.midpoint_dial is not None and request.midpoint_dial not in MIDPOINT_DIALS:
+        raise HTTPException(status_code=400, detail=f"Unknown midpoint dial. Available: {list(MIDPOINT_DIALS)}")
+    try:
+        resolve_bodies(request.body_set, request.extra_bodies)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     try:
         # 1️⃣ Generate natal chart
-        chart = build_natal_chart(
+        chart = get_natal_chart(
             request.dt_local,
             request.lat,
             request.lon,
             request.tz_name,
             request.include_angles_in_aspects,
+            house_system=request.house_system,
+            extra_house_systems=request.extra_house_systems,
+            zodiac=request.zodiac,
+            body_set=request.body_set,
+            extra_bodies=request.extra_bodies,
+            include_fixed_stars=request.include_fixed_stars,
         )
 
         # 2️⃣ Deterministic analysis + precision layers
@@ -35,7 +68,7 @@ def compute_chart(request: ChartRequest):
         # 4️⃣ Markdown report
         report_md = build_markdown_report(profile, narrative)
 
-        return {
+        result = {
             "overview": profile.overview,
             "dominant_elements": profile.dominant_elements,
             "dominant_modalities": profile.dominant_modalities,
@@ -46,7 +79,186 @@ def compute_chart(request: ChartRequest):
             "precision_raw_map": profile.precision_raw_map or {},
             "precision_norm_map": profile.precision_norm_map or {},
             "precision_envelope": profile.precision_envelope or {},
+            # Cusps + planet houses per house system (primary first)
+            "house_systems": {
+                chart.house_system: {
+                    "houses": [h.model_dump() for h in chart.houses],
+                    "planet_houses": {p.name: p.house for p in chart.planets},
+                },
+                **{name: view.model_dump(exclude={"system"}) for name, view in chart.alt_house_systems.items()},
+            },
+            "aspect_patterns": [pat.model_dump() for pat in chart.patterns],
+            "parallels": [a.model_dump() for a in chart.parallels],
+            "declinations": {
+                p.name: {"ra": p.ra, "decl": p.decl, "out_of_bounds": p.out_of_bounds} for p in chart.planets
+            },
+            "sect": chart.sect,
+            "lots": [lot.model_dump(include={"name", "lon", "sign", "deg_in_sign", "house"}) for lot in chart.lots],
+            "dispositors": DispositorGraph({p.name: p.sign for p in chart.planets}).summary(),
         }
 
+        if request.midpoint_dial is not None:
+            points = [(p.name, p.lon) for p in chart.planets + [chart.asc, chart.mc] if p is not None]
+            result["midpoints"] = midpoint_tree([n for n, _ in points], [l for _, l in points], dial=request.midpoint_dial)
+
+        if request.include_harmonics:
+            result["harmonics"] = harmonic_profile([p.name for p in chart.planets], [p.lon for p in chart.planets])
+
+        if request.include_fixed_stars:
+            result["fixed_stars"] = [c.model_dump() for c in chart.fixed_stars]
+
+        # 5️⃣ Optional birth-time uncertainty analysis
+        if request.birth_time_uncertainty_minutes:
+            result["uncertainty"] = analyze_birth_time_uncertainty(
+                chart,
+                request.lat,
+                request.lon,
+                request.birth_time_uncertainty_minutes,
+                samples=request.uncertainty_samples,
+            )
+
+        return result
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chart computation failed: {e}")
+
+
+# Ephemeris output for a given year never changes → long-lived public cache
+LUNAR_CALENDAR_MAX_AGE = 7 * 24 * 3600
+
+
+@router.get("/lunar-calendar/{year}")
+def get_lunar_calendar(year: int, request: Request, response: Response):
+    """
+    Moon phases, sign ingresses and void-of-course windows for a UTC year.
+    Results are cached per year in-process and marked cacheable for clients.
+    """
+    if not 1800 <= year <= 2200:
+        raise HTTPException(status_code=400, detail="Year must be between 1800 and 2200.")
+
+    etag = f'"lunar-{year}-v{LUNAR_CALENDAR_VERSION}"'
+    headers = {
+        "Cache-Control": f"public, max-age={LUNAR_CALENDAR_MAX_AGE}",
+        "ETag": etag,
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    try:
+        calendar = lunar_calendar(year)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Lunar calendar computation failed: {e}")
+
+    response.headers.update(headers)
+    return calendar
+
+
+@router.post("/rectify")
+def rectify(request: RectificationRequest):
+    """
+    Rank candidate birth times inside a window against the user's life events.
+    """
+    try:
+        return rectify_birth_time(
+            request.window_start,
+            request.window_end,
+            request.lat,
+            request.lon,
+            [e.model_dump() for e in request.events],
+            tz_name=request.tz_name or None,
+            scorers=request.scorers,
+            step_minutes=request.step_minutes,
+            top_k=request.top_k,
+            workers=request.workers,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Rectification failed: {e}")
+
+
+@router.post("/relocate")
+def relocate(request: RelocationRequest):
+    """
+    Relocated angles, cusps and houses for one birth instant at many places.
+    """
+    if not request.locations:
+        raise HTTPException(status_code=400, detail="At least one location is required.")
+    if request.house_system not in HOUSE_SYSTEMS:
+        raise HTTPException(status_code=400, detail=f"Unknown house system. Available: {sorted(HOUSE_SYSTEMS)}")
+    try:
+        table = relocate_chart_batch(
+            request.dt_local,
+            request.lat,
+            request.lon,
+            [(loc.lat, loc.lon) for loc in request.locations],
+            tz_name=request.tz_name or None,
+            house_system=request.house_system,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Relocation failed: {e}")
+    table["name"] = [loc.name for loc in request.locations]
+    return table
+
+
+@router.post("/astrocartography")
+def astrocartography(request: AstrocartographyRequest):
+    """
+    Planetary ASC/DSC/MC/IC lines as GeoJSON, plus an optional influence raster.
+    """
+    try:
+        result = build_astrocartography(
+            request.dt_local,
+            request.lat,
+            request.lon,
+            tz_name=request.tz_name or None,
+            line_step_deg=request.line_step_deg,
+            resolution_deg=request.raster_resolution_deg,
+            orb_deg=request.orb_deg,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Astrocartography failed: {e}")
+    raster = result.get("raster")
+    if raster is not None:
+        for key in ("lats", "lons", "dominant"):
+            raster[key] = raster[key].tolist()
+        raster["values"] = raster["values"].round(4).tolist()
+    return result
+
+
+@router.post("/similar")
+def similar_charts(request: SimilarChartsRequest):
+    """
+    Stored profiles whose charts are closest to the given birth data
+    (cosine similarity of chart embeddings).
+    """
+    try:
+        chart = get_natal_chart(request.dt_local, request.lat, request.lon, request.tz_name)
+        matches = get_similarity_index().search(chart_embedding(chart), k=request.k, exclude=request.exclude_ids)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Similar chart search failed: {e}")
+    return {"matches": [{"profile_id": pid, "score": round(score, 4)} for pid, score in matches]}
+
+
+@router.post("/relationships")
+def relationship_chart_table(request: RelationshipChartsRequest):
+    """
+    Composite and Davison charts for every pair of a group.
+    """
+    if not 2 <= len(request.people) <= RELATIONSHIP_MAX_PEOPLE:
+        raise HTTPException(status_code=400, detail=f"Between 2 and {RELATIONSHIP_MAX_PEOPLE} people are required.")
+    if request.house_system not in HOUSE_SYSTEMS:
+        raise HTTPException(status_code=400, detail=f"Unknown house system. Available: {sorted(HOUSE_SYSTEMS)}")
+    if request.zodiac not in ZODIAC_MODES:
+        raise HTTPException(status_code=400, detail=f"Unknown zodiac. Available: {sorted(ZODIAC_MODES)}")
+    try:
+        table = relationship_charts(
+            [(p.dt_local, p.lat, p.lon, p.tz_name or None) for p in request.people],
+            house_system=request.house_system,
+            zodiac=request.zodiac,
+            include_davison=request.include_davison,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Relationship charts failed: {e}")
+    table["name"] = [p.name for p in request.people]
+    return table
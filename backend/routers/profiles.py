@@ -1,8 +1,39 @@
 # backend/routers/profiles.py
-from fastapi import APIRouter
+import uuid
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from backend.core.db import get_db
+from backend.models.user import User
+from backend.routers.users import get_current_user
+from backend.services.profile_charts import load_profile_charts
 
 router = APIRouter(prefix="/profiles", tags=["Profiles"])
 
 @router.get("/")
 def list_profiles():
     return {"message": "Profiles route active"}
+
+
+@router.get("/charts")
+def list_profile_charts(
+    ids: Optional[List[uuid.UUID]] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Stored natal charts of the current user's profiles, read with one
+    query; stale charts are recomputed on the way (chart is null when
+    it cannot be computed).
+    """
+    try:
+        rows = load_profile_charts(db, ids=ids, user_id=user.id, limit=limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Loading charts failed: {e}")
+    return {"profiles": [
+        {"id": str(row.id), "name": row.name, "chart": chart.to_dict() if chart is not None else None}
+        for row, chart in rows
+    ]}
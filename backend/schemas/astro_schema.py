@@ -1,5 +1,13 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from datetime import datetime
+from typing import List
+
+from backend.astro_engine.astro_config import (
+    DEFAULT_HOUSE_SYSTEM, DEFAULT_ZODIAC,
+    RECTIFICATION_MAX_CANDIDATES, RECTIFICATION_MAX_TOP_K, RECTIFICATION_MAX_WINDOW_HOURS,
+    RELOCATION_MAX_LOCATIONS,
+    UNCERTAINTY_MAX_MINUTES, UNCERTAINTY_MAX_SAMPLES,
+)
 
 class ChartRequest(BaseModel):
     dt_local: datetime
@@ -7,5 +15,109 @@ class ChartRequest(BaseModel):
     lon: float
     tz_name: str | None = None
     include_angles_in_aspects: bool = True
+    # Primary house system + optional systems shown side by side
+    house_system: str = DEFAULT_HOUSE_SYSTEM
+    extra_house_systems: List[str] = []
+    # "tropical" or a sidereal mode: lahiri / raman / krishnamurti
+    zodiac: str = DEFAULT_ZODIAC
+    # Named body set (classic / traditional / extended) + e.g. "Asteroid 433"
+    body_set: str = "classic"
+    extra_bodies: List[str] = []
+    include_fixed_stars: bool = False
+    # Midpoint trees on the 360 / 90 / 45° dial (None = off)
+    midpoint_dial: int | None = None
+    # Harmonic strength spectrum (H = 1..32) with the strongest harmonics' conjunctions
+    include_harmonics: bool = False
+    # Uncertainty mode: ± minutes around dt_local (None = exact birth time)
+    birth_time_uncertainty_minutes: float | None = Field(None, gt=0, le=UNCERTAINTY_MAX_MINUTES)
+    uncertainty_samples: int = Field(500, ge=2, le=UNCERTAINTY_MAX_SAMPLES)
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class LifeEvent(BaseModel):
+    date: datetime
+    kind: str = "general"
+    weight: float = 1.0
+
+
+class RectificationRequest(BaseModel):
+    window_start: datetime
+    window_end: datetime
+    lat: float
+    lon: float
+    tz_name: str | None = None
+    events: List[LifeEvent]
+    scorers: List[str] | None = None
+    step_minutes: float = Field(1.0, gt=0, le=60)
+    top_k: int = Field(10, ge=1, le=RECTIFICATION_MAX_TOP_K)
+    # Worker processes; the engine caps this at the CPU count
+    workers: int = Field(1, ge=1, le=32)
+
+    model_config = ConfigDict(extra="ignore")
+
+    @model_validator(mode="after")
+    def _check_window(self):
+        hours = (self.window_end - self.window_start).total_seconds() / 3600.0
+        if hours > RECTIFICATION_MAX_WINDOW_HOURS:
+            raise ValueError(f"Window is longer than {RECTIFICATION_MAX_WINDOW_HOURS} hours.")
+        if hours * 60.0 / self.step_minutes > RECTIFICATION_MAX_CANDIDATES:
+            raise ValueError(f"Window / step_minutes gives more than {RECTIFICATION_MAX_CANDIDATES} candidates.")
+        return self
+
+
+class Location(BaseModel):
+    lat: float = Field(ge=-90, le=90)
+    lon: float = Field(ge=-180, le=180)
+    name: str | None = None
+
+
+class RelocationRequest(BaseModel):
+    dt_local: datetime
+    lat: float
+    lon: float
+    tz_name: str | None = None
+    locations: List[Location] = Field(max_length=RELOCATION_MAX_LOCATIONS)
+    house_system: str = DEFAULT_HOUSE_SYSTEM
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class AstrocartographyRequest(BaseModel):
+    dt_local: datetime
+    lat: float
+    lon: float
+    tz_name: str | None = None
+    line_step_deg: float = Field(0.5, gt=0, le=5)
+    raster_resolution_deg: float | None = Field(None, ge=0.25, le=10)
+    orb_deg: float = Field(3.0, gt=0, le=20)
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class SimilarChartsRequest(BaseModel):
+    dt_local: datetime
+    lat: float
+    lon: float
+    tz_name: str | None = None
+    k: int = Field(10, ge=1, le=100)
+    exclude_ids: List[str] = []
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class Person(BaseModel):
+    dt_local: datetime
+    lat: float
+    lon: float
+    tz_name: str | None = None
+    name: str | None = None
+
+
+class RelationshipChartsRequest(BaseModel):
+    people: List[Person]
+    house_system: str = DEFAULT_HOUSE_SYSTEM
+    zodiac: str = DEFAULT_ZODIAC
+    include_davison: bool = True
 
     model_config = ConfigDict(extra="ignore")
@@ -0,0 +1,87 @@
+# backend/services/chart_embedding.py
+"""
+Fixed-length chart embedding for similar-chart search.
+
+Blocks, one row per body of EMBEDDING_BODIES:
+  longitude  — sin / cos of the ecliptic longitude
+  house      — sin / cos of the house as an angle (house 1 = 0°, 30° steps)
+  precision  — the PlanetPrecision axes from the contextual weights
+
+Each block is scaled by its weight and the whole vector is L2-normalised,
+so cosine similarity is a plain dot product. Bodies missing from a chart
+contribute zeros.
+"""
+
+from __future__ import annotations
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from backend.astro_engine.bodies import BODY_SETS
+from backend.astro_engine.models.chart_model import ChartModel
+from backend.models.horoscope_profile import PlanetPrecision
+from backend.models.profile import Profile
+from backend.services.horoscope_service import compute_contextual_weights
+from backend.services.profile_charts import profile_chart
+
+EMBEDDING_BODIES = BODY_SETS["classic"]
+EMBEDDING_AXES = tuple(PlanetPrecision.model_fields)
+BLOCK_WEIGHTS = {"longitude": 1.0, "house": 0.5, "precision": 0.5}
+EMBEDDING_DIM = len(EMBEDDING_BODIES) * (4 + len(EMBEDDING_AXES))
+
+
+def embed_arrays(
+    lons,
+    houses,
+    precision,
+    block_weights: Optional[Dict[str, float]] = None,
+) -> np.ndarray:
+    """
+    (N, B) longitudes, (N, B) houses (0 = unknown) and (N, B, A) precision
+    axes → (N, EMBEDDING_DIM) float32 unit vectors.
+    """
+    bw = {**BLOCK_WEIGHTS, **(block_weights or {})}
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+    houses = np.asarray(houses, dtype=np.float64)
+    present = ~np.isnan(lon)
+    lon = np.where(present, lon, 0.0)
+    h_ang = np.radians((houses - 1.0) * 30.0)
+    has_house = houses > 0
+    parts = [
+        bw["longitude"] * np.where(present, np.sin(lon), 0.0),
+        bw["longitude"] * np.where(present, np.cos(lon), 0.0),
+        bw["house"] * np.where(has_house, np.sin(h_ang), 0.0),
+        bw["house"] * np.where(has_house, np.cos(h_ang), 0.0),
+        bw["precision"] * np.nan_to_num(np.asarray(precision, dtype=np.float64)).reshape(lon.shape[0], -1),
+    ]
+    vec = np.concatenate(parts, axis=1)
+    norm = np.linalg.norm(vec, axis=1, keepdims=True)
+    return (vec / np.where(norm > 0, norm, 1.0)).astype(np.float32)
+
+
+def chart_embedding(
+    chart: ChartModel,
+    weights: Optional[Dict[str, PlanetPrecision]] = None,
+    bodies: Sequence[str] = EMBEDDING_BODIES,
+) -> np.ndarray:
+    """(EMBEDDING_DIM,) float32 unit vector for one chart."""
+    weights = compute_contextual_weights(chart) if weights is None else weights
+    by_name = {p.name: p for p in chart.planets}
+    lons = np.full((1, len(bodies)), np.nan)
+    houses = np.zeros((1, len(bodies)))
+    precision = np.zeros((1, len(bodies), len(EMBEDDING_AXES)))
+    for k, name in enumerate(bodies):
+        p = by_name.get(name)
+        if p is None:
+            continue
+        lons[0, k] = p.lon
+        houses[0, k] = p.house or 0
+        w = weights.get(name)
+        if w is not None:
+            precision[0, k] = [getattr(w, a) for a in EMBEDDING_AXES]
+    return embed_arrays(lons, houses, precision)[0]
+
+
+def profile_embedding(profile: Profile) -> np.ndarray:
+    """Embedding of a stored profile's natal chart (default chart settings)."""
+    return chart_embedding(profile_chart(profile))
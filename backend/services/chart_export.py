@@ -0,0 +1,256 @@
+# backend/services/chart_export.py
+"""
+Columnar bulk export of charts and precision outputs (Arrow / Parquet).
+
+Charts are streamed into fixed-schema Arrow record batches of
+`batch_rows` rows, one column per value:
+  identity     — profile_id, birth_year, birth_decade, jd_ut, lat, lon
+  chart        — house_system, zodiac, sect, asc, mc, cusps (12-item list)
+  per body     — <body>_lon / _lat / _speed / _decl / _house
+  precision    — <body>_precision_<axis> for every PlanetPrecision axis,
+                 and <body>_precision_influence (the raw influence score)
+  aspects      — list<struct<p1, p2, aspect, angle, orb>> per chart
+Bodies missing from a chart are nulls. Only one batch is held in memory
+at a time; `write_parquet_dataset` hands the batches to Arrow's dataset
+writer, which writes hive-partitioned Parquet files as they arrive.
+
+pyarrow is an optional dependency (requirements/worker.txt), only needed here.
+"""
+
+from __future__ import annotations
+import uuid
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # optional: requirements/worker.txt
+    pa = ds = None
+
+from backend.astro_engine.bodies import BODY_SETS
+from backend.astro_engine.models.chart_model import ChartModel
+from backend.core.logger import logger
+from backend.models.horoscope_profile import PlanetPrecision
+from backend.models.profile import Profile
+from backend.services.horoscope_service import compute_contextual_weights
+from backend.services.precision_summary_service import influence_score
+from backend.services.profile_charts import profile_chart
+
+EXPORT_BODIES = BODY_SETS["classic"]
+EXPORT_AXES = (*PlanetPrecision.model_fields, "influence")
+BODY_COLUMNS = ("lon", "lat", "speed", "decl")
+EXPORT_BATCH_ROWS = 4096
+MAX_ROWS_PER_FILE = 1_000_000
+DEFAULT_PARTITIONING = ("birth_decade",)
+
+
+def _require_arrow() -> None:
+    if pa is None:
+        raise RuntimeError("Chart export needs pyarrow (pip install -r requirements/worker.txt).")
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(" ", "_")
+
+
+def export_schema(bodies: Sequence[str] = EXPORT_BODIES, with_precision: bool = True) -> "pa.Schema":
+    """Fixed Arrow schema for a body list."""
+    _require_arrow()
+    label = pa.dictionary(pa.int8(), pa.string())
+    fields = [
+        pa.field("profile_id", pa.string()),
+        pa.field("birth_year", pa.int16()),
+        pa.field("birth_decade", pa.int16()),
+        pa.field("jd_ut", pa.float64()),
+        pa.field("lat", pa.float64()),
+        pa.field("lon", pa.float64()),
+        pa.field("house_system", label),
+        pa.field("zodiac", label),
+        pa.field("sect", label),
+        pa.field("asc", pa.float64()),
+        pa.field("mc", pa.float64()),
+        pa.field("cusps", pa.list_(pa.float64(), 12)),
+    ]
+    for body in bodies:
+        s = _slug(body)
+        fields.append(pa.field(f"{s}_lon", pa.float64()))
+        fields += [pa.field(f"{s}_{col}", pa.float32()) for col in BODY_COLUMNS[1:]]
+        fields.append(pa.field(f"{s}_house", pa.int8()))
+        if with_precision:
+            fields += [pa.field(f"{s}_precision_{axis}", pa.float32()) for axis in EXPORT_AXES]
+    fields.append(pa.field("aspects", pa.list_(pa.struct([
+        pa.field("p1", pa.string()),
+        pa.field("p2", pa.string()),
+        pa.field("aspect", pa.string()),
+        pa.field("angle", pa.float32()),
+        pa.field("orb", pa.float32()),
+    ]))))
+    return pa.schema(fields)
+
+
+class ChartBatchBuilder:
+    """Column buffers for up to `capacity` charts → one RecordBatch."""
+
+    def __init__(self, bodies: Sequence[str] = EXPORT_BODIES, capacity: int = EXPORT_BATCH_ROWS,
+                 with_precision: bool = True):
+        self.bodies = tuple(bodies)
+        self.capacity = capacity
+        self.with_precision = with_precision
+        self.schema = export_schema(self.bodies, with_precision)
+        self._col = {name: k for k, name in enumerate(self.bodies)}
+        self.reset()
+
+    def __len__(self) -> int:
+        return self.n
+
+    def reset(self) -> None:
+        n, b = self.capacity, len(self.bodies)
+        self.n = 0
+        self.ids, self.labels = [], {"house_system": [], "zodiac": [], "sect": []}
+        self.scalars = {k: np.full(n, np.nan) for k in ("jd_ut", "lat", "lon", "asc", "mc")}
+        self.years = np.zeros(n, dtype=np.int16)
+        self.cusps = np.full((n, 12), np.nan)
+        self.body = np.full((len(BODY_COLUMNS), n, b), np.nan)
+        self.houses = np.zeros((n, b), dtype=np.int8)
+        self.axes = np.full((len(EXPORT_AXES), n, b), np.nan, dtype=np.float32)
+        self.aspect_counts = np.zeros(n, dtype=np.int32)
+        self.aspect_cols = {"p1": [], "p2": [], "aspect": [], "angle": [], "orb": []}
+
+    def add(self, profile_id, chart: ChartModel, lat: Optional[float] = None, lon: Optional[float] = None) -> None:
+        i = self.n
+        if i >= self.capacity:
+            raise ValueError("Batch is full; flush it first.")
+        self.ids.append(str(profile_id))
+        self.years[i] = int(chart.meta["dt_local"][:4])
+        self.scalars["jd_ut"][i] = float(chart.meta["jd_ut"])
+        self.scalars["lat"][i] = np.nan if lat is None else lat
+        self.scalars["lon"][i] = np.nan if lon is None else lon
+        self.scalars["asc"][i] = chart.asc.lon if chart.asc else np.nan
+        self.scalars["mc"][i] = chart.mc.lon if chart.mc else np.nan
+        self.labels["house_system"].append(chart.house_system)
+        self.labels["zodiac"].append(chart.zodiac)
+        self.labels["sect"].append(chart.sect)
+        if len(chart.houses) == 12:
+            self.cusps[i] = [h.lon for h in chart.houses]
+        for p in chart.planets:
+            k = self._col.get(p.name)
+            if k is None:
+                continue
+            self.body[:, i, k] = [np.nan if v is None else v for v in (p.lon, p.lat, p.speed, p.decl)]
+            self.houses[i, k] = p.house or 0
+        if self.with_precision:
+            for name, w in compute_contextual_weights(chart).items():
+                k = self._col.get(name)
+                if k is not None:
+                    self.axes[:, i, k] = [getattr(w, a, 0.0) for a in EXPORT_AXES[:-1]] + [influence_score(w)]
+        for a in chart.aspects:
+            for key in ("p1", "p2", "aspect", "angle", "orb"):
+                self.aspect_cols[key].append(getattr(a, key))
+        self.aspect_counts[i] = len(chart.aspects)
+        self.n += 1
+
+    def flush(self) -> "pa.RecordBatch":
+        """RecordBatch of the buffered rows; the builder is emptied."""
+        n = self.n
+        columns = {
+            "profile_id": pa.array(self.ids, pa.string()),
+            "birth_year": pa.array(self.years[:n]),
+            "birth_decade": pa.array(self.years[:n] // 10 * 10),
+        }
+        for key, values in self.scalars.items():
+            columns[key] = pa.array(values[:n], from_pandas=True)
+        for key, values in self.labels.items():
+            columns[key] = pa.array(values, pa.string()).dictionary_encode().cast(self.schema.field(key).type)
+        columns["cusps"] = pa.FixedSizeListArray.from_arrays(pa.array(self.cusps[:n].ravel(), from_pandas=True), 12)
+        for k, body in enumerate(self.bodies):
+            s = _slug(body)
+            missing = np.isnan(self.body[0, :n, k])
+            columns[f"{s}_lon"] = pa.array(self.body[0, :n, k], from_pandas=True)
+            for c, col in enumerate(BODY_COLUMNS[1:], start=1):
+                columns[f"{s}_{col}"] = pa.array(self.body[c, :n, k].astype(np.float32), from_pandas=True)
+            columns[f"{s}_house"] = pa.array(self.houses[:n, k], mask=missing | (self.houses[:n, k] == 0))
+            if self.with_precision:
+                for x, axis in enumerate(EXPORT_AXES):
+                    columns[f"{s}_precision_{axis}"] = pa.array(self.axes[x, :n, k], from_pandas=True)
+        offsets = np.concatenate([[0], np.cumsum(self.aspect_counts[:n])]).astype(np.int32)
+        aspect_type = self.schema.field("aspects").type
+        flat = pa.StructArray.from_arrays(
+            [pa.array(self.aspect_cols[f.name], f.type) for f in aspect_type.value_type],
+            fields=list(aspect_type.value_type),
+        )
+        columns["aspects"] = pa.ListArray.from_arrays(pa.array(offsets), flat, type=aspect_type)
+        batch = pa.RecordBatch.from_arrays([columns[f.name] for f in self.schema], schema=self.schema)
+        self.reset()
+        return batch
+
+
+def chart_record_batches(
+    rows: Iterable[Tuple[str, ChartModel, Optional[float], Optional[float]]],
+    bodies: Sequence[str] = EXPORT_BODIES,
+    batch_rows: int = EXPORT_BATCH_ROWS,
+    with_precision: bool = True,
+) -> Iterator["pa.RecordBatch"]:
+    """Stream (profile_id, chart, lat, lon) rows into RecordBatches."""
+    builder = ChartBatchBuilder(bodies, batch_rows, with_precision)
+    for profile_id, chart, lat, lon in rows:
+        builder.add(profile_id, chart, lat, lon)
+        if len(builder) == batch_rows:
+            yield builder.flush()
+    if len(builder):
+        yield builder.flush()
+
+
+def profile_chart_rows(
+    profiles: Iterable[Profile],
+    failed: Optional[List[str]] = None,
+) -> Iterator[Tuple[str, ChartModel, float, float]]:
+    """
+    (id, natal chart, lat, lon) for profiles with coordinates. Profiles
+    whose chart cannot be computed are logged, added to `failed` when
+    given, and skipped so one bad row never aborts an export.
+    """
+    for profile in profiles:
+        if profile.lat is None or profile.lon is None:
+            continue
+        try:
+            chart = profile_chart(profile)
+        except Exception as e:
+            logger.warning(f"Chart for profile {profile.id} failed: {e}")
+            if failed is not None:
+                failed.append(str(profile.id))
+            continue
+        yield str(profile.id), chart, profile.lat, profile.lon
+
+
+def write_parquet_dataset(
+    batches: Iterable["pa.RecordBatch"],
+    out_dir,
+    schema: "pa.Schema",
+    partition_by: Sequence[str] = DEFAULT_PARTITIONING,
+    max_rows_per_file: int = MAX_ROWS_PER_FILE,
+    max_open_files: int = 64,
+) -> Path:
+    """
+    Write streamed batches as hive-partitioned Parquet under `out_dir`.
+    Files of one run share a unique prefix, so repeated exports into the
+    same directory add files instead of overwriting them.
+    """
+    _require_arrow()
+    out_dir = Path(out_dir)
+    ds.write_dataset(
+        batches,
+        out_dir,
+        schema=schema,
+        format="parquet",
+        partitioning=list(partition_by) or None,
+        partitioning_flavor="hive",
+        basename_template=f"charts-{uuid.uuid4().hex[:12]}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_file=max_rows_per_file,
+        max_rows_per_group=min(max_rows_per_file, 1 << 17),
+        max_open_files=max_open_files,
+    )
+    return out_dir
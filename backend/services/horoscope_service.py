@@ -4,6 +4,8 @@ from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import json
 
+import numpy as np
+
 from backend.astro_engine.models.chart_model import ChartModel, PlanetPlacement, AspectLink
 from backend.models.horoscope_profile import (
     HoroscopeProfile,
@@ -13,7 +15,11 @@ from backend.models.horoscope_profile import (
 )
 from backend.core.config import settings
 
+from backend.astro_engine.context_builder import build_motion_contexts
 from backend.astro_engine.context_weights import apply_contextual_weights
+from backend.astro_engine.dignities import dignity_scores, is_diurnal
+from backend.astro_engine.dispositor_chain import DispositorGraph
+from backend.astro_engine.lots import sect_matches
 from backend.astro_engine.tone_utils import build_tone_map
 from backend.services.precision_summary_service import build_precision_summary
 from backend.services.precision_envelope import build_precision_envelope
@@ -105,6 +111,15 @@ def _house_focus_from_positions(chart: ChartModel) -> Tuple[List[int], List[str]
     return focus, texts
 
 
+PATTERN_NOTES = {
+    "grand_trine": "Easy flow of talent between {focus}.",
+    "kite": "Gifts channelled into purpose through {focus}.",
+    "t_square": "Pressure converges on {focus}, driving effort and growth.",
+    "grand_cross": "Competing demands between {focus} ask for steady balance.",
+    "yod": "A point of adjustment and special focus around {focus}.",
+}
+
+
 def _collect_strengths_challenges(chart: ChartModel) -> Tuple[List[str], List[str]]:
     strengths: List[str] = []
     challenges: List[str] = []
@@ -114,15 +129,95 @@ def _collect_strengths_challenges(chart: ChartModel) -> Tuple[List[str], List[st
     if "Fixed" in (chart.dominant_modalities or []):
         strengths.append("Persistence and follow-through under pressure.")
 
-    for a in chart.aspects:
-        if a.aspect in ("square", "opposition") and a.orb <= 4.0:
-            challenges.append(f"Tension between {a.p1} and {a.p2} calls for balance and patience.")
-            if len(challenges) >= 4:
-                break
+    for pat in chart.patterns:
+        note = PATTERN_NOTES.get(pat.kind)
+        if not note or pat.strength < 0.25:
+            continue
+        focus = pat.apex or ", ".join(pat.bodies)
+        (strengths if pat.kind in ("grand_trine", "kite") else challenges).append(note.format(focus=focus))
+
+    challenges += [
+        f"Tension between {a.p1} and {a.p2} calls for balance and patience."
+        for a in chart.aspects
+        if a.aspect in ("square", "opposition") and a.orb <= 4.0
+    ]
 
     return strengths[:4], challenges[:4]
 
 
+# ---------------------------------------------------
+# PRECISION (Phase 9.5)
+# ---------------------------------------------------
+def base_planet_precision(p: PlanetPlacement, essential: float = 0.0) -> PlanetPrecision:
+    """Baseline precision axes for one placement, before contextual weighting."""
+    # Very light heuristics; `essential` comes from the dignity engine.
+    if p.house in (1, 4, 7, 10):
+        house_weight = 0.7
+    elif p.house in (2, 5, 8, 11):
+        house_weight = 0.5
+    else:
+        house_weight = 0.3
+
+    hierarchy = 0.8 if p.name in ("Sun", "Moon", "Ascendant", "MC") else 0.5
+
+    return PlanetPrecision(
+        essential=essential,
+        accidental=0.0,
+        aspectual=0.0,
+        hierarchy=hierarchy,
+        house=house_weight,
+        speed=1.0,
+        temperament=0.0,
+        neighbor=0.0,
+        stability=1.0,
+    )
+
+
+def compute_essential_dignities(chart: ChartModel) -> Dict[str, float]:
+    """
+    Traditional essential dignity per planet (clipped to -1…1), scored for
+    the whole chart with one table gather. Bodies without traditional
+    dignities (outer planets, points) get 0.
+    """
+    if not chart.planets:
+        return {}
+    lons = {p.name: p.lon for p in chart.planets}
+    diurnal = True
+    if chart.sect:
+        diurnal = chart.sect == "day"
+    elif "Sun" in lons and chart.asc is not None:
+        diurnal = is_diurnal(lons["Sun"], chart.asc.lon)
+    scores = dignity_scores(list(lons), list(lons.values()),
+                            terms=settings.DIGNITY_TERMS, triplicity=settings.DIGNITY_TRIPLICITY, diurnal=diurnal)
+    return {name: round(float(v), 3) for name, v in zip(lons, np.clip(scores, -1.0, 1.0))}
+
+
+def build_planet_contexts(chart: ChartModel) -> Dict[str, Dict[str, object]]:
+    """Contextual flags per planet for `apply_contextual_weights`."""
+    contexts = build_motion_contexts(chart.planets)
+    reception = DispositorGraph({p.name: p.sign for p in chart.planets}).in_mutual_reception()
+    in_sect = sect_matches(chart.sect, {p.name: p.lon for p in chart.planets}) if chart.sect else {}
+    return {
+        p.name: {
+            **contexts[p.name],
+            "mutual_reception": reception[p.name],
+            "sect_match": in_sect.get(p.name, False),
+            "out_of_bounds": bool(p.out_of_bounds),
+        }
+        for p in chart.planets
+    }
+
+
+def compute_contextual_weights(chart: ChartModel) -> Dict[str, PlanetPrecision]:
+    """Baseline PlanetPrecision + contextual weights for every planet."""
+    contexts = build_planet_contexts(chart)
+    essential = compute_essential_dignities(chart)
+    return {
+        p.name: apply_contextual_weights(p.name, base_planet_precision(p, essential[p.name]), contexts[p.name])
+        for p in chart.planets
+    }
+
+
 # ---------------------------------------------------
 # CORE
 # ---------------------------------------------------
@@ -220,36 +315,7 @@ def analyze_chart(chart: ChartModel, max_aspects: int = 12) -> HoroscopeProfile:
     # -------------------------------------------
     # Phase 9.5 — Baseline PlanetPrecision + Contextual weights + Tone
     # -------------------------------------------
-    base_precision: Dict[str, PlanetPrecision] = {}
-
-    for p in chart.planets:
-        # Very light heuristics; dignities engine can overwrite later.
-        if p.house in (1, 4, 7, 10):
-            house_weight = 0.7
-        elif p.house in (2, 5, 8, 11):
-            house_weight = 0.5
-        else:
-            house_weight = 0.3
-
-        hierarchy = 0.8 if p.name in ("Sun", "Moon", "Ascendant", "MC") else 0.5
-
-        base_precision[p.name] = PlanetPrecision(
-            essential=0.0,
-            accidental=0.0,
-            aspectual=0.0,
-            hierarchy=hierarchy,
-            house=house_weight,
-            speed=1.0,
-            temperament=0.0,
-            neighbor=0.0,
-            stability=1.0,
-        )
-
-    contextual_weights: Dict[str, PlanetPrecision] = {}
-    for p in chart.planets:
-        ctx: Dict[str, object] = {}  # placeholder for future: sect, retrograde, oob, etc.
-        contextual_weights[p.name] = apply_contextual_weights(p.name, base_precision[p.name], ctx)
-
+    contextual_weights = compute_contextual_weights(chart)
     profile.contextual_weights = contextual_weights
     profile.tone_map = build_tone_map(contextual_weights)
     profile.intensity_vector = dict(profile.tone_map)
@@ -0,0 +1,113 @@
+# backend/services/precision_calibration.py
+"""
+Population calibration for precision scores.
+
+One `QuantileSketch` per (planet, axis) — the PlanetPrecision axes plus the
+raw `influence` score — is fed from a synthetic birth sample
+(`scripts/calibrate_precision.py`) or from live traffic, persisted as
+JSON, and used to turn raw scores into population percentiles. This makes
+a value of 0.9 comparable between users and charts.
+"""
+
+from __future__ import annotations
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from backend.core.config import settings
+from backend.models.horoscope_profile import PlanetPrecision
+from backend.services.quantile_sketch import DEFAULT_COMPRESSION, QuantileSketch
+
+INFLUENCE_AXIS = "influence"
+CALIBRATION_VERSION = 1
+
+
+class PrecisionCalibration:
+    """Sketches keyed by (planet, axis)."""
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.sketches: Dict[Tuple[str, str], QuantileSketch] = {}
+
+    def _sketch(self, planet: str, axis: str) -> QuantileSketch:
+        key = (planet, axis)
+        if key not in self.sketches:
+            self.sketches[key] = QuantileSketch(self.compression)
+        return self.sketches[key]
+
+    def observe(self, raw_map: Mapping[str, float],
+                weights: Optional[Mapping[str, PlanetPrecision]] = None) -> None:
+        """Add one chart's raw influence scores (and optionally its axes)."""
+        for planet, value in raw_map.items():
+            self._sketch(planet, INFLUENCE_AXIS).update([value])
+        for planet, w in (weights or {}).items():
+            for axis, value in w.model_dump().items():
+                if isinstance(value, (int, float)):
+                    self._sketch(planet, axis).update([value])
+
+    def observe_many(self, planet: str, axis: str, values: Iterable[float]) -> None:
+        self._sketch(planet, axis).update(list(values))
+
+    def merge(self, other: "PrecisionCalibration") -> "PrecisionCalibration":
+        for (planet, axis), sketch in other.sketches.items():
+            self._sketch(planet, axis).merge(sketch)
+        return self
+
+    def has(self, planet: str, axis: str = INFLUENCE_AXIS) -> bool:
+        sketch = self.sketches.get((planet, axis))
+        return sketch is not None and sketch.count > 0
+
+    def percentile(self, planet: str, value: float, axis: str = INFLUENCE_AXIS) -> float:
+        return float(self.sketches[(planet, axis)].percentile(value))
+
+    def normalize(self, raw_map: Mapping[str, float]) -> Dict[str, float]:
+        """Population percentiles (0..1) for planets with a sketch."""
+        return {
+            planet: round(self.percentile(planet, value), 4)
+            for planet, value in raw_map.items()
+            if self.has(planet)
+        }
+
+    # ------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "version": CALIBRATION_VERSION,
+            "compression": self.compression,
+            "sketches": {f"{p}|{a}": s.to_dict() for (p, a), s in sorted(self.sketches.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "PrecisionCalibration":
+        cal = cls(int(data.get("compression", DEFAULT_COMPRESSION)))
+        for key, sketch in (data.get("sketches") or {}).items():
+            planet, axis = key.split("|", 1)
+            cal.sketches[(planet, axis)] = QuantileSketch.from_dict(sketch)
+        return cal
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path) -> "PrecisionCalibration":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path: str, mtime: float) -> PrecisionCalibration:
+    return PrecisionCalibration.load(path)
+
+
+def load_calibration(path: Optional[str] = None) -> Optional[PrecisionCalibration]:
+    """Calibration from settings (reloaded when the file changes); None if absent."""
+    path = Path(path or settings.PRECISION_CALIBRATION_PATH)
+    if not path.is_file():
+        return None
+    return _load_cached(str(path), path.stat().st_mtime)
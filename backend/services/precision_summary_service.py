@@ -5,10 +5,32 @@ Builds raw influence scores, normalized maps, and planet-level summaries.
 """
 
 from __future__ import annotations
-from typing import Dict, Tuple
+from typing import Dict, List, Literal, Optional, Tuple
+
+import numpy as np
 
 from backend.astro_engine.models.chart_model import ChartModel, PlanetPlacement
+from backend.core.config import settings
 from backend.models.horoscope_profile import PlanetPrecision
+from backend.services.precision_calibration import INFLUENCE_AXIS, load_calibration
+
+
+# Axis weights of the raw influence score (sum to 1.0)
+INFLUENCE_WEIGHTS: Dict[str, float] = {
+    "essential": 0.28,
+    "accidental": 0.20,
+    "aspectual": 0.18,
+    "hierarchy": 0.12,
+    "house": 0.12,
+    "speed": 0.05,
+    "temperament": 0.03,
+    "neighbor": 0.02,
+}
+
+
+def influence_score(w: PlanetPrecision) -> float:
+    """Raw weighted influence of one planet's precision axes."""
+    return sum(getattr(w, axis) * weight for axis, weight in INFLUENCE_WEIGHTS.items())
 
 
 def build_precision_summary(
@@ -30,33 +52,11 @@ def build_precision_summary(
     # --------------------------------------------------
     if chart is None:
         for pname, w in contextual_weights.items():
-            influence = (
-                w.essential * 0.28 +
-                w.accidental * 0.20 +
-                w.aspectual * 0.18 +
-                w.hierarchy * 0.12 +
-                w.house * 0.12 +
-                w.speed * 0.05 +
-                w.temperament * 0.03 +
-                w.neighbor * 0.02
-            )
+            influence = influence_score(w)
             raw_map[pname] = influence
             summaries[pname] = f"{pname}: baseline influence level ({influence:.2f})."
 
-        if raw_map:
-            min_v = min(raw_map.values())
-            max_v = max(raw_map.values())
-            if max_v != min_v:
-                norm_map = {
-                    k: round((v - min_v) / (max_v - min_v), 4)
-                    for k, v in raw_map.items()
-                }
-            else:
-                norm_map = {k: 0.5 for k in raw_map}
-        else:
-            norm_map = {}
-
-        return summaries, raw_map, norm_map
+        return summaries, raw_map, normalize_influence(raw_map)
 
     # --------------------------------------------------
     # Normal mode: we have a chart and can use houses etc.
@@ -66,40 +66,67 @@ def build_precision_summary(
         if not w:
             continue
 
-        influence = (
-            w.essential * 0.28 +
-            w.accidental * 0.20 +
-            w.aspectual * 0.18 +
-            w.hierarchy * 0.12 +
-            w.house * 0.12 +
-            w.speed * 0.05 +
-            w.temperament * 0.03 +
-            w.neighbor * 0.02
-        )
+        influence = influence_score(w)
 
         raw_map[planet.name] = influence
         summaries[planet.name] = _build_precision_sentence(planet, w, influence)
 
-    # Normalize
-    if raw_map:
-        min_v = min(raw_map.values())
-        max_v = max(raw_map.values())
-        if max_v != min_v:
-            norm_map = {
-                k: round((v - min_v) / (max_v - min_v), 4)
-                for k, v in raw_map.items()
-            }
-        else:
-            norm_map = {k: 0.5 for k in raw_map}
-    else:
-        norm_map = {}
+    return summaries, raw_map, normalize_influence(raw_map)
+
 
-    return summaries, raw_map, norm_map
+def normalize_influence(raw_map: Dict[str, float], mode: Optional[Literal["minmax", "percentile"]] = None) -> Dict[str, float]:
+    """
+    0–1 influence per planet. "percentile" uses the population sketches
+    when every planet is calibrated and falls back to in-chart min–max
+    otherwise, so one map never mixes the two scales.
+    """
+    mode = mode or settings.PRECISION_NORMALIZATION
+    if mode not in ("minmax", "percentile"):
+        raise ValueError(f"Unknown normalization {mode!r}; use 'minmax' or 'percentile'.")
+    if mode == "percentile":
+        calibration = load_calibration()
+        if calibration is not None:
+            norm_map = calibration.normalize(raw_map)
+            if len(norm_map) == len(raw_map):
+                return norm_map
+    return _minmax(raw_map)
+
+
+def normalize_influence_batch(raw: np.ndarray, names: List[str],
+                              mode: Optional[Literal["minmax", "percentile"]] = None) -> np.ndarray:
+    """
+    `normalize_influence` for many charts at once: raw is (N, P) with one
+    column per planet in `names`. Same scale and fallback rule — percentiles
+    only when every planet is calibrated, else min–max within each row.
+    """
+    mode = mode or settings.PRECISION_NORMALIZATION
+    if mode not in ("minmax", "percentile"):
+        raise ValueError(f"Unknown normalization {mode!r}; use 'minmax' or 'percentile'.")
+    raw = np.asarray(raw, dtype=np.float64)
+    if mode == "percentile":
+        calibration = load_calibration()
+        if calibration is not None and all(calibration.has(name) for name in names):
+            return np.column_stack([
+                calibration.sketches[(name, INFLUENCE_AXIS)].percentile(raw[:, k]) for k, name in enumerate(names)
+            ])
+    lo = raw.min(axis=1, keepdims=True)
+    span = raw.max(axis=1, keepdims=True) - lo
+    return np.where(span > 0, (raw - lo) / np.where(span > 0, span, 1.0), 0.5)
 
 
 # ------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------
+def _minmax(raw_map: Dict[str, float]) -> Dict[str, float]:
+    if not raw_map:
+        return {}
+    min_v = min(raw_map.values())
+    max_v = max(raw_map.values())
+    if max_v == min_v:
+        return {k: 0.5 for k in raw_map}
+    return {k: round((v - min_v) / (max_v - min_v), 4) for k, v in raw_map.items()}
+
+
 def _build_precision_sentence(
     planet: PlanetPlacement,
     w: PlanetPrecision,
@@ -0,0 +1,191 @@
+# backend/services/profile_charts.py
+"""
+Natal charts of stored profiles.
+
+`Profile.birth_datetime` is an aware instant; charts are cast from the
+wall-clock time in the birth timezone (the profile's own, or the one
+resolved from its coordinates) with default chart settings.
+
+Each row also keeps its chart packed (`chart_packed`, see
+astro_engine.packed_chart) with the engine version it was computed with.
+It is filled on insert and recomputed lazily once CHART_ENGINE_VERSION
+moves on: reading a stale or missing chart computes it and writes it
+back. Lists of charts are read with one query and decoded in bulk.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pytz
+from sqlalchemy import bindparam, event, inspect, or_, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from backend.astro_engine.astro_config import CHART_ENGINE_VERSION
+from backend.astro_engine.chart_generator import get_natal_chart
+from backend.astro_engine.models.chart_model import ChartModel
+from backend.astro_engine.packed_chart import PackedChart, pack_chart, unpack_charts
+from backend.astro_engine.time_utils import resolve_tz
+from backend.core.logger import logger
+from backend.models.profile import Profile
+
+# Columns needed to compute and read a stored chart
+_CHART_SOURCE = (Profile.id, Profile.name, Profile.birth_datetime, Profile.lat, Profile.lon,
+                 Profile.tz_name, Profile.chart_packed, Profile.chart_version)
+
+
+def profile_chart(profile: Profile) -> ChartModel:
+    """Natal chart of a stored profile (cached by birth data)."""
+    tz = profile.tz_name or resolve_tz(profile.lat, profile.lon)
+    dt = profile.birth_datetime
+    if dt.tzinfo is not None:
+        # stored as an aware instant → wall-clock time in the birth timezone
+        dt = dt.astimezone(pytz.timezone(tz)).replace(tzinfo=None)
+    return get_natal_chart(dt, profile.lat, profile.lon, tz)
+
+
+def chart_columns(profile) -> Dict[str, object]:
+    """{"chart_packed", "chart_version"} for a profile (or any row with birth data)."""
+    return {"chart_packed": pack_chart(profile_chart(profile), CHART_ENGINE_VERSION), "chart_version": CHART_ENGINE_VERSION}
+
+
+def is_stale(profile) -> bool:
+    return profile.chart_packed is None or profile.chart_version != CHART_ENGINE_VERSION
+
+
+def stale_clause():
+    return or_(Profile.chart_version.is_(None), Profile.chart_version != CHART_ENGINE_VERSION)
+
+
+# ------------------------------------------------------------
+# One profile
+# ------------------------------------------------------------
+def stored_chart(profile: Profile) -> PackedChart:
+    """
+    The profile's packed chart; recomputed and set on the instance when
+    missing or stale (the caller's session persists it on commit).
+    """
+    if is_stale(profile):
+        for key, value in chart_columns(profile).items():
+            setattr(profile, key, value)
+    return PackedChart.from_bytes(profile.chart_packed)
+
+
+def enable_chart_precompute() -> None:
+    """
+    Pack the chart of every Profile inserted through the ORM. A chart that
+    cannot be computed never blocks the insert: its columns stay NULL for
+    `recompute_stale` to retry.
+    """
+    if event.contains(Profile, "before_insert", _pack_on_insert):
+        return
+    event.listen(Profile, "before_insert", _pack_on_insert)
+
+
+def _pack_on_insert(mapper, connection, target) -> None:
+    if target.lat is None or target.lon is None or not is_stale(target):
+        return
+    try:
+        columns = chart_columns(target)
+    except Exception as e:
+        logger.warning(f"Chart for new profile {target.id} failed: {e}")
+        return
+    for key, value in columns.items():
+        setattr(target, key, value)
+
+
+# ------------------------------------------------------------
+# Many profiles
+# ------------------------------------------------------------
+def _write_back(db, rows: Sequence[Dict[str, object]]) -> None:
+    """Bulk UPDATE of chart columns: one executemany."""
+    if not rows:
+        return
+    stmt = (
+        update(Profile.__table__)
+        .where(Profile.__table__.c.id == bindparam("_id"))
+        .values(chart_packed=bindparam("chart_packed"), chart_version=bindparam("chart_version"))
+    )
+    db.execute(stmt, list(rows))
+
+
+def load_profile_charts(
+    db: Session,
+    ids: Optional[Iterable] = None,
+    user_id=None,
+    limit: Optional[int] = None,
+) -> List[Tuple[Profile, Optional[PackedChart]]]:
+    """
+    (row, chart) for many profiles with one SELECT. Stored blobs are
+    decoded in bulk; stale ones are recomputed, written back in a single
+    bulk UPDATE and committed. Rows without coordinates are skipped; rows
+    whose chart cannot be computed are logged and come back with None.
+    """
+    stmt = select(*_CHART_SOURCE).where(Profile.lat.is_not(None), Profile.lon.is_not(None))
+    if ids is not None:
+        stmt = stmt.where(Profile.id.in_(list(ids)))
+    if user_id is not None:
+        stmt = stmt.where(Profile.user_id == user_id)
+    rows = db.execute(stmt.order_by(Profile.created_at, Profile.id).limit(limit)).all()
+
+    blobs: List[Optional[bytes]] = []
+    fresh = []
+    for row in rows:
+        if not is_stale(row):
+            blobs.append(row.chart_packed)
+            continue
+        try:
+            cols = chart_columns(row)
+        except Exception as e:
+            logger.warning(f"Chart for profile {row.id} failed: {e}")
+            blobs.append(None)
+            continue
+        fresh.append({"_id": row.id, **cols})
+        blobs.append(cols["chart_packed"])
+    if fresh:
+        _write_back(db, fresh)
+        db.commit()
+    decoded = iter(unpack_charts([b for b in blobs if b is not None]))
+    return [(row, None if blob is None else next(decoded)) for row, blob in zip(rows, blobs)]
+
+
+def recompute_stale(engine: Engine, batch_size: int = 500, limit: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Recompute stale charts, `batch_size` rows per transaction, walking the
+    table by id so each row is visited once. Rows whose chart cannot be
+    computed are logged and left stale. Returns (updated, failed).
+    """
+    updated, failed, last_id = 0, 0, None
+    while limit is None or updated + failed < limit:
+        stmt = select(*_CHART_SOURCE).where(stale_clause(), Profile.lat.is_not(None), Profile.lon.is_not(None))
+        if last_id is not None:
+            stmt = stmt.where(Profile.id > last_id)
+        take = batch_size if limit is None else min(batch_size, limit - updated - failed)
+        with engine.begin() as conn:
+            rows = conn.execute(stmt.order_by(Profile.id).limit(take)).all()
+            if not rows:
+                break
+            params = []
+            for row in rows:
+                try:
+                    params.append({"_id": row.id, **chart_columns(row)})
+                except Exception as e:
+                    failed += 1
+                    logger.warning(f"Chart for profile {row.id} failed: {e}")
+            _write_back(conn, params)
+        updated += len(params)
+        last_id = rows[-1].id
+    return updated, failed
+
+
+def ensure_chart_columns(engine: Engine) -> List[str]:
+    """Add the chart columns to an existing `profiles` table; returns those added."""
+    existing = {c["name"] for c in inspect(engine).get_columns(Profile.__tablename__)}
+    added = []
+    with engine.begin() as conn:
+        for column in (Profile.__table__.c.chart_packed, Profile.__table__.c.chart_version):
+            if column.name not in existing:
+                col_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {Profile.__tablename__} ADD COLUMN {column.name} {col_type}"))
+                added.append(column.name)
+    return added
@@ -0,0 +1,267 @@
+# backend/services/profile_import.py
+"""
+Streaming bulk import of birth records into `profiles`.
+
+Pipeline, one chunk of `batch_size` rows at a time:
+  parse     — CSV (header row) or NDJSON, read incrementally
+  validate  — one pydantic TypeAdapter call per chunk; rows that fail are
+              written to the failed-rows file with their errors
+  timezone  — missing tz names are resolved from the coordinates through a
+              cache, so a city shared by many records is looked up once;
+              naive birth times are read as wall-clock time in that zone
+  insert    — one SQLAlchemy Core executemany per chunk, in its own
+              transaction. If the chunk fails, its rows are retried one
+              by one so a single bad row does not drop its neighbours.
+  charts    — optionally each row's packed chart is stored with it; a
+              chart that fails leaves the columns NULL for the backfill
+  after     — optional callback with the inserted rows, e.g. to index
+              their charts
+
+Memory stays at one chunk whatever the file size.
+"""
+
+from __future__ import annotations
+import csv
+import json
+import time
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pytz
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.astro_engine.time_utils import resolve_tz
+from backend.models.profile import Profile
+from backend.services.profile_charts import chart_columns
+
+DEFAULT_BATCH_SIZE = 1000
+TZ_CACHE_SIZE = 65536
+TZ_CACHE_DECIMALS = 4                  # ~11 m: same city, same lookup
+
+Row = Tuple[int, Dict[str, object]]    # (line number, raw fields)
+
+
+class ProfileRecord(BaseModel):
+    """One import row; naive birth times are local to `tz_name`."""
+    name: str = Field(min_length=1, max_length=100)
+    birth_datetime: datetime
+    lat: float = Field(ge=-90, le=90)
+    lon: float = Field(ge=-180, le=180)
+    tz_name: Optional[str] = Field(None, max_length=80)
+    city: Optional[str] = Field(None, max_length=120)
+    country: Optional[str] = Field(None, max_length=120)
+    user_id: Optional[uuid.UUID] = None
+
+    model_config = {"extra": "ignore", "str_strip_whitespace": True}
+
+
+_CHUNK = TypeAdapter(List[ProfileRecord])
+
+
+class ImportReport:
+    """Counters for one import run."""
+
+    def __init__(self):
+        self.read = 0
+        self.imported = 0
+        self.failed = 0
+        self.charts_missing = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.read / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "read": self.read,
+            "imported": self.imported,
+            "failed": self.failed,
+            "charts_missing": self.charts_missing,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+# ------------------------------------------------------------
+# Parsing
+# ------------------------------------------------------------
+def _clean(raw: Dict[str, object]) -> Dict[str, object]:
+    """Blank CSV cells → None."""
+    return {k: (None if isinstance(v, str) and not v.strip() else v) for k, v in raw.items() if k}
+
+
+def iter_rows(path, fmt: Optional[str] = None) -> Iterator[Row]:
+    """
+    (line number, fields) for every record of a CSV or NDJSON file. NDJSON
+    lines that are not JSON objects come back as {"_error": ...}.
+    """
+    path = Path(path)
+    fmt = fmt or ("csv" if path.suffix.lower() == ".csv" else "ndjson")
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            for line, raw in enumerate(csv.DictReader(f), start=2):
+                yield line, _clean(raw)
+            return
+        for line, text in enumerate(f, start=1):
+            if not text.strip():
+                continue
+            try:
+                raw = json.loads(text)
+            except json.JSONDecodeError as e:
+                yield line, {"_error": f"invalid JSON: {e}", "_raw": text.rstrip("\n")}
+                continue
+            yield line, _clean(raw) if isinstance(raw, dict) else {"_error": "not a JSON object", "_raw": raw}
+
+
+def _chunks(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    chunk: List[Row] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ------------------------------------------------------------
+# Validation + timezones
+# ------------------------------------------------------------
+@lru_cache(maxsize=TZ_CACHE_SIZE)
+def _cached_tz(lat: float, lon: float) -> str:
+    return resolve_tz(lat, lon)
+
+
+def cached_tz(lat: float, lon: float) -> str:
+    """IANA timezone for coordinates, cached on a ~11 m grid."""
+    return _cached_tz(round(lat, TZ_CACHE_DECIMALS), round(lon, TZ_CACHE_DECIMALS))
+
+
+def validate_chunk(chunk: List[Row]) -> Tuple[List[Tuple[int, ProfileRecord]], List[Tuple[Row, List[str]]]]:
+    """(valid records, failed rows with error messages) for one chunk."""
+    failed: List[Tuple[Row, List[str]]] = []
+    rows = []
+    for row in chunk:
+        if "_error" in row[1]:
+            failed.append((row, [str(row[1]["_error"])]))
+        else:
+            rows.append(row)
+    try:
+        return list(zip([line for line, _ in rows], _CHUNK.validate_python([raw for _, raw in rows]))), failed
+    except ValidationError as e:
+        errors: Dict[int, List[str]] = {}
+        for err in e.errors():
+            field = ".".join(str(p) for p in err["loc"][1:])
+            errors.setdefault(err["loc"][0], []).append(f"{field}: {err['msg']}")
+    failed += [(row, errors[k]) for k, row in enumerate(rows) if k in errors]
+    good = [row for k, row in enumerate(rows) if k not in errors]
+    return list(zip([line for line, _ in good], _CHUNK.validate_python([raw for _, raw in good]))), failed
+
+
+def to_profile_row(record: ProfileRecord, default_user_id: Optional[uuid.UUID] = None) -> Dict[str, object]:
+    """Insert parameters for one record; naive birth times are localized."""
+    tz = record.tz_name or cached_tz(record.lat, record.lon)
+    dt = record.birth_datetime
+    if dt.tzinfo is None:
+        dt = pytz.timezone(tz).localize(dt)
+    return {
+        "id": uuid.uuid4(),
+        "user_id": record.user_id or default_user_id,
+        "name": record.name,
+        "birth_datetime": dt.astimezone(pytz.utc),
+        "city": record.city,
+        "country": record.country,
+        "lat": record.lat,
+        "lon": record.lon,
+        "tz_name": tz,
+    }
+
+
+# ------------------------------------------------------------
+# Import
+# ------------------------------------------------------------
+def _insert(engine: Engine, rows: List[Dict[str, object]]) -> None:
+    with engine.begin() as conn:
+        conn.execute(insert(Profile.__table__), rows)
+
+
+def import_profiles(
+    rows: Iterable[Row],
+    engine: Engine,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    failed_path=None,
+    default_user_id: Optional[uuid.UUID] = None,
+    after_batch: Optional[Callable[[List[Dict[str, object]]], None]] = None,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+    store_charts: bool = False,
+) -> ImportReport:
+    """
+    Validate and insert parsed rows chunk by chunk. Failed rows go to
+    `failed_path` as NDJSON ({"line", "row", "errors"}) when given. With
+    `store_charts` each row is inserted with its packed chart; rows whose
+    chart fails are still inserted, with NULL chart columns.
+    """
+    report = ImportReport()
+    failed_file = open(failed_path, "w", encoding="utf-8") if failed_path else None
+
+    def fail(row: Row, errors: List[str]) -> None:
+        report.failed += 1
+        if failed_file:
+            failed_file.write(json.dumps({"line": row[0], "row": row[1], "errors": errors}, default=str) + "\n")
+
+    try:
+        for chunk in _chunks(rows, batch_size):
+            report.read += len(chunk)
+            valid, invalid = validate_chunk(chunk)
+            for row, errors in invalid:
+                fail(row, errors)
+            params, sources = [], []
+            raw_by_line = dict(chunk)
+            for line, record in valid:
+                try:
+                    row = to_profile_row(record, default_user_id)
+                except Exception as e:
+                    fail((line, raw_by_line[line]), [f"tz_name: {e}"])
+                    continue
+                if store_charts:
+                    try:
+                        row.update(chart_columns(SimpleNamespace(**row)))
+                    except Exception:
+                        # every row of an executemany needs the same keys
+                        row.update(chart_packed=None, chart_version=None)
+                        report.charts_missing += 1
+                params.append(row)
+                sources.append((line, raw_by_line[line]))
+            if not params:
+                continue
+            try:
+                _insert(engine, params)
+                inserted = params
+            except SQLAlchemyError:
+                inserted = []
+                for source, row in zip(sources, params):
+                    try:
+                        _insert(engine, [row])
+                        inserted.append(row)
+                    except SQLAlchemyError as e:
+                        fail(source, [f"insert: {getattr(e, 'orig', None) or e}"])
+            report.imported += len(inserted)
+            if after_batch and inserted:
+                after_batch(inserted)
+            report.seconds = time.perf_counter() - report.started
+            if progress:
+                progress(report)
+    finally:
+        if failed_file:
+            failed_file.close()
+    report.seconds = time.perf_counter() - report.started
+    return report
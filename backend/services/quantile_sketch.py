@@ -0,0 +1,132 @@
+# backend/services/quantile_sketch.py
+"""
+Mergeable quantile sketch (merging t-digest).
+
+Values are buffered and folded into at most ~`compression` weighted
+centroids. Centroid sizes follow the arcsine scale, so the tails stay
+nearly exact while the middle is summarised coarsely. Sketches built on
+different machines or batches merge by pooling centroids and
+re-compressing. Once frozen, `percentile` / `quantile` are one
+`np.interp` over the k centroids, a binary search of O(log k) per
+value.
+"""
+
+from __future__ import annotations
+from typing import Dict, Optional
+
+import numpy as np
+
+DEFAULT_COMPRESSION = 200
+
+
+class QuantileSketch:
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = int(compression)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer: list = []
+        self._buffered = 0
+        self._frozen: Optional[tuple] = None
+
+    # ------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------
+    @property
+    def count(self) -> float:
+        self._flush()
+        return float(self.weights.sum())
+
+    def update(self, values) -> "QuantileSketch":
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size:
+            self._buffer.append(values)
+            self._buffered += values.size
+            self._frozen = None
+            if self._buffered >= 10 * self.compression:
+                self._flush()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        other._flush()
+        self._flush()
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        return self
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        values = np.concatenate(self._buffer)
+        self._buffer, self._buffered = [], 0
+        self.min, self.max = min(self.min, values.min()), max(self.max, values.max())
+        self._compress(np.concatenate([self.means, values]),
+                       np.concatenate([self.weights, np.ones(values.size)]))
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        self._frozen = None
+        if not means.size:
+            self.means, self.weights = means, weights
+            return
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        cum = np.cumsum(weights)
+        q = (cum - weights / 2.0) / cum[-1]
+        # arcsine scale: one bucket per unit of k → small centroids at the tails
+        k = np.floor(self.compression / (2.0 * np.pi) * np.arcsin(2.0 * q - 1.0))
+        starts = np.flatnonzero(np.diff(k, prepend=k[0] - 1))
+        w = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / w
+        self.weights = w
+
+    # ------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------
+    def _interp_table(self) -> tuple:
+        self._flush()
+        if self._frozen is None:
+            total = self.weights.sum()
+            ranks = (np.cumsum(self.weights) - self.weights / 2.0) / total
+            xs = np.concatenate([[self.min], self.means, [self.max]])
+            ps = np.concatenate([[0.0], ranks, [1.0]])
+            self._frozen = (xs, ps)
+        return self._frozen
+
+    def percentile(self, values):
+        """Population fraction (0..1) at or below each value."""
+        if not self.count:
+            raise ValueError("Empty sketch.")
+        xs, ps = self._interp_table()
+        return np.interp(values, xs, ps)
+
+    def quantile(self, q):
+        """Value at population fraction(s) q."""
+        if not self.count:
+            raise ValueError("Empty sketch.")
+        xs, ps = self._interp_table()
+        return np.interp(q, ps, xs)
+
+    # ------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------
+    def to_dict(self) -> Dict[str, object]:
+        self._flush()
+        return {
+            "compression": self.compression,
+            "min": float(self.min) if self.weights.size else None,
+            "max": float(self.max) if self.weights.size else None,
+            "means": self.means.tolist(),
+            "weights": self.weights.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "QuantileSketch":
+        sketch = cls(int(data.get("compression", DEFAULT_COMPRESSION)))
+        sketch.means = np.asarray(data.get("means", []), dtype=np.float64)
+        sketch.weights = np.asarray(data.get("weights", []), dtype=np.float64)
+        if sketch.weights.size:
+            sketch.min, sketch.max = float(data["min"]), float(data["max"])
+        return sketch
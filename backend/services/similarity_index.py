@@ -0,0 +1,283 @@
+# backend/services/similarity_index.py
+"""
+Similar-chart search over stored chart embeddings.
+
+Storage: one contiguous float32 matrix in a memory-mapped file
+(`vectors.f32`), grown by doubling, plus `ids.txt` with one profile id per
+row. Rows are only ever appended, so inserts never rewrite the matrix.
+
+Index: an inverted-file (IVF) index. A k-means coarse quantizer splits
+the unit vectors into `nlist` cells, and each row is listed under its
+nearest centroid. A query scores only the rows of its `nprobe` nearest
+cells, exactly, by dot product (cosine similarity). New rows are assigned
+to a cell as they arrive. Until enough rows exist to train the quantizer,
+search is exact brute force over the whole matrix.
+
+Every `add` persists the row count (`meta.json`), so a reopened store
+keeps all rows; the quantizer (`ivf.npz`) is saved when it is trained,
+and rows added after that are re-assigned to their cells on load.
+The store has a single writer: with several server processes, enable
+SIMILARITY_AUTO_INDEX in one of them only (or index from a script).
+"""
+
+from __future__ import annotations
+import json
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.core.logger import logger
+from backend.models.profile import Profile
+from backend.services.chart_embedding import EMBEDDING_DIM, profile_embedding
+
+KMEANS_ITERATIONS = 12
+TRAIN_POINTS_PER_LIST = 39          # rows per cell before the quantizer is trained
+MAX_TRAIN_SAMPLE = 100_000
+
+
+def brute_force_search(vectors: np.ndarray, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(rows, scores) of the k highest dot products, best first."""
+    scores = vectors @ query
+    k = min(k, scores.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return top, scores[top]
+
+
+def train_kmeans(sample: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    """Spherical k-means centroids (nlist, dim) for unit vectors."""
+    rng = np.random.default_rng(seed)
+    centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].astype(np.float32)
+    for _ in range(KMEANS_ITERATIONS):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        counts = np.bincount(assign, minlength=nlist)
+        empty = counts == 0
+        sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+        centroids = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+    return centroids.astype(np.float32)
+
+
+class EmbeddingStore:
+    """Append-only memory-mapped float32 matrix with row ids."""
+
+    def __init__(self, directory, dim: int, initial_capacity: int = 1024):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        meta_path = self.dir / "meta.json"
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if meta["dim"] != dim:
+                raise ValueError(f"Store dimension {meta['dim']} does not match {dim}.")
+            self.count, self.capacity = meta["count"], meta["capacity"]
+        else:
+            self.count, self.capacity = 0, initial_capacity
+        self.dim = dim
+        self._mm = self._open(self.capacity)
+        ids_path = self.dir / "ids.txt"
+        lines = ids_path.read_text().split("\n") if ids_path.exists() else []
+        self.ids: List[str] = lines[:self.count]
+        if len(lines) > self.count + 1:
+            # rows appended after the last flush are dropped with their ids
+            ids_path.write_text("".join(f"{i}\n" for i in self.ids))
+
+    def _open(self, capacity: int) -> np.memmap:
+        path = self.dir / "vectors.f32"
+        mode = "r+" if path.exists() else "w+"
+        if path.exists() and path.stat().st_size < capacity * self.dim * 4:
+            with open(path, "r+b") as f:
+                f.truncate(capacity * self.dim * 4)
+        return np.memmap(path, dtype=np.float32, mode=mode, shape=(capacity, self.dim))
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._mm[:self.count]
+
+    def append(self, ids: Sequence[str], vectors: np.ndarray) -> np.ndarray:
+        """Append rows; returns their row numbers."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        n = len(vectors)
+        if self.count + n > self.capacity:
+            self._mm.flush()
+            while self.count + n > self.capacity:
+                self.capacity *= 2
+            self._mm = self._open(self.capacity)
+        rows = np.arange(self.count, self.count + n)
+        self._mm[rows] = vectors
+        self.count += n
+        self.ids.extend(str(i) for i in ids)
+        with open(self.dir / "ids.txt", "a") as f:
+            f.write("".join(f"{i}\n" for i in ids))
+        self.flush()
+        return rows
+
+    def flush(self) -> None:
+        """Write vectors, then the row count (atomically) that makes them visible."""
+        self._mm.flush()
+        tmp = self.dir / "meta.json.tmp"
+        tmp.write_text(json.dumps({"dim": self.dim, "count": self.count, "capacity": self.capacity}))
+        os.replace(tmp, self.dir / "meta.json")
+
+
+class IVFIndex:
+    """Inverted lists over an EmbeddingStore; trained lazily, extended incrementally."""
+
+    def __init__(self, store: EmbeddingStore, nlist: Optional[int] = None, nprobe: Optional[int] = None):
+        self.store = store
+        self.nlist = nlist or settings.SIMILARITY_NLIST
+        self.nprobe = nprobe or settings.SIMILARITY_NPROBE
+        self.centroids: Optional[np.ndarray] = None
+        self.assign = np.empty(0, dtype=np.int32)
+        self.lists: List[np.ndarray] = []
+        path = store.dir / "ivf.npz"
+        if path.exists():
+            data = np.load(path)
+            if len(data["assign"]) <= store.count:
+                self.centroids, self.assign = data["centroids"], data["assign"]
+                self.nlist = len(self.centroids)
+                self._add_rows(np.arange(len(self.assign), store.count))
+                self._rebuild_lists()
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def train(self, seed: int = 0) -> None:
+        vectors = self.store.vectors
+        rng = np.random.default_rng(seed)
+        sample = vectors if len(vectors) <= MAX_TRAIN_SAMPLE else vectors[np.sort(rng.choice(len(vectors), MAX_TRAIN_SAMPLE, replace=False))]
+        self.centroids = train_kmeans(np.asarray(sample), self.nlist, seed)
+        self.assign = np.empty(0, dtype=np.int32)
+        self._add_rows(np.arange(self.store.count))
+        self._rebuild_lists()
+
+    def _add_rows(self, rows: np.ndarray) -> None:
+        if not rows.size:
+            return
+        cells = np.argmax(self.store.vectors[rows] @ self.centroids.T, axis=1).astype(np.int32)
+        self.assign = np.concatenate([self.assign, cells])
+
+    def _rebuild_lists(self) -> None:
+        order = np.argsort(self.assign, kind="stable")
+        bounds = np.searchsorted(self.assign[order], np.arange(self.nlist + 1))
+        self.lists = [order[bounds[c]:bounds[c + 1]] for c in range(self.nlist)]
+
+    def add(self, rows: np.ndarray) -> None:
+        """Register freshly appended store rows (trains and saves once enough exist)."""
+        if not self.trained:
+            if self.store.count >= TRAIN_POINTS_PER_LIST * self.nlist:
+                self.train()
+                self.save()
+            return
+        start = len(self.assign)
+        self._add_rows(np.asarray(rows))
+        for row, cell in zip(range(start, len(self.assign)), self.assign[start:]):
+            self.lists[cell] = np.append(self.lists[cell], row)
+
+    def search(self, query: np.ndarray, k: int, nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        query = np.asarray(query, dtype=np.float32)
+        if not self.trained:
+            return brute_force_search(self.store.vectors, query, k)
+        probe = min(nprobe or self.nprobe, self.nlist)
+        cells = np.argpartition(-(self.centroids @ query), probe - 1)[:probe]
+        candidates = np.concatenate([self.lists[c] for c in cells])
+        rows, scores = brute_force_search(self.store.vectors[candidates], query, k)
+        return candidates[rows], scores
+
+    def save(self) -> None:
+        self.store.flush()
+        if self.trained:
+            np.savez(self.store.dir / "ivf.npz", centroids=self.centroids, assign=self.assign)
+
+
+class SimilarityIndex:
+    """Store + IVF index behind one lock: add embeddings by id, query top-K."""
+
+    def __init__(self, directory=None, dim: Optional[int] = None, nlist: Optional[int] = None,
+                 nprobe: Optional[int] = None):
+        self.store = EmbeddingStore(directory or settings.SIMILARITY_INDEX_DIR, dim or EMBEDDING_DIM)
+        self.index = IVFIndex(self.store, nlist=nlist, nprobe=nprobe)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.store.count
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        with self._lock:
+            rows = self.store.append(ids, vectors)
+            self.index.add(rows)
+
+    def search(self, query: np.ndarray, k: int = 10, exclude: Sequence[str] = ()) -> List[Tuple[str, float]]:
+        with self._lock:
+            rows, scores = self.index.search(query, k + len(exclude))
+            hits = [(self.store.ids[r], float(s)) for r, s in zip(rows.tolist(), scores.tolist())]
+        return [h for h in hits if h[0] not in set(exclude)][:k]
+
+    def save(self) -> None:
+        with self._lock:
+            self.index.save()
+
+
+# ------------------------------------------------------------
+# Profiles
+# ------------------------------------------------------------
+@lru_cache(maxsize=1)
+def get_similarity_index() -> SimilarityIndex:
+    return SimilarityIndex()
+
+
+def index_profiles(profiles: Iterable[Profile], index: Optional[SimilarityIndex] = None) -> int:
+    """Embed and add profiles; returns how many were indexed."""
+    index = get_similarity_index() if index is None else index
+    ids, vectors = [], []
+    for profile in profiles:
+        if profile.lat is None or profile.lon is None:
+            continue
+        ids.append(str(profile.id))
+        vectors.append(profile_embedding(profile))
+    if ids:
+        index.add(ids, np.stack(vectors))
+    return len(ids)
+
+
+_indexing_target: Optional[SimilarityIndex] = None
+
+
+def enable_profile_indexing(index: Optional[SimilarityIndex] = None) -> None:
+    """
+    Index new Profile rows as they are committed: inserts are collected on
+    the session and embedded after a successful commit. Listeners are
+    registered once; a later call only changes the target index.
+    """
+    global _indexing_target
+    _indexing_target = index
+    if not event.contains(Profile, "after_insert", _collect_new_profile):
+        event.listen(Profile, "after_insert", _collect_new_profile)
+        event.listen(Session, "after_commit", _index_new_profiles)
+
+
+def _collect_new_profile(mapper, connection, target) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("new_profiles", []).append(target)
+
+
+def _index_new_profiles(session) -> None:
+    pending = session.info.pop("new_profiles", None)
+    if not pending:
+        return
+    try:
+        index_profiles(pending, _indexing_target)
+    except Exception as e:
+        # the rows are committed; `scripts/index_profiles.py` picks them up on the next run
+        logger.warning(f"Indexing {len(pending)} new profiles failed: {e}")
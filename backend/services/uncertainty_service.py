@@ -0,0 +1,255 @@
+"""
+Birth-time uncertainty layer.
+Samples the birth time across an uncertainty interval, runs houses and the
+precision pipeline over all samples as one vectorized batch, and reports
+which placements are stable plus confidence intervals per precision axis.
+
+The precision pipeline is not re-implemented here. Everything it reads
+that can change across samples is resolved per sample as a small discrete
+state — house, essential dignity (degree and sect), sect match, mutual
+reception (from the sampled signs of all bodies) and Sun-proximity band —
+and the real per-planet pipeline runs once per distinct state; results are
+gathered into (samples × planets) arrays. Speed and declination flags are
+taken from the central chart.
+"""
+
+from __future__ import annotations
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from backend.astro_engine.ayanamsa import ayanamsa
+from backend.astro_engine.astro_config import SUN_PROXIMITY_ORBS, UNCERTAINTY_MAX_SAMPLES
+from backend.astro_engine.bodies import LON, compute_bodies_multi
+from backend.astro_engine.context_builder import house_type
+from backend.astro_engine.context_weights import apply_contextual_weights
+from backend.astro_engine.dignities import dignity_scores
+from backend.astro_engine.dispositor_chain import DispositorGraph
+from backend.astro_engine.ephemeris_loader import FAST_SAMPLE_MINUTES, interpolated_planet_matrix
+from backend.astro_engine.house_batch import (
+    nutation_frame, sidereal_degrees, cusps_batch, assign_houses_batch,
+)
+from backend.astro_engine.lots import planet_sect
+from backend.astro_engine.models.chart_model import ChartModel
+from backend.astro_engine.zodiac_utils import SIGNS, to_zodiac, wrap180
+from backend.core.config import settings
+from backend.models.horoscope_profile import PlanetPrecision
+from backend.services.horoscope_service import base_planet_precision, build_planet_contexts
+from backend.services.precision_summary_service import influence_score, normalize_influence_batch
+
+# A placement counts as stable when it keeps its modal house/sign this often
+STABILITY_THRESHOLD = 0.95
+CI_PERCENTILES = (2.5, 50.0, 97.5)
+PRECISION_AXES: List[str] = list(PlanetPrecision.model_fields.keys())
+
+
+def _sample_offsets(n: int, half_width_minutes: float, seed: Optional[int]) -> np.ndarray:
+    """Stratified uniform offsets (days) covering [-w, +w] evenly."""
+    rng = np.random.default_rng(seed)
+    edges = np.linspace(-half_width_minutes, half_width_minutes, n + 1)
+    offsets = edges[:-1] + rng.random(n) * np.diff(edges)
+    return np.sort(offsets) / 1440.0
+
+
+def _distribution(values: np.ndarray, labels) -> Dict[str, float]:
+    counts = np.bincount(values, minlength=len(labels))
+    total = int(counts.sum())
+    return {str(labels[i]): round(float(c) / total, 4) for i, c in enumerate(counts) if c}
+
+
+def _ci(values: np.ndarray) -> List[float]:
+    return [round(float(v), 4) for v in np.percentile(values, CI_PERCENTILES)]
+
+
+def _body_matrix(jds: np.ndarray, names: List[str]) -> np.ndarray:
+    """
+    (N, P) tropical longitudes of `names`: planets from the shared
+    interpolated matrix, other bodies (nodes, Lilith, asteroids) sampled on
+    the same coarse grid and interpolated. Unavailable bodies are NaN.
+    """
+    planet_names, planet_lons = interpolated_planet_matrix(jds)
+    out = np.full((len(jds), len(names)), np.nan)
+    others = []
+    for k, name in enumerate(names):
+        if name in planet_names:
+            out[:, k] = planet_lons[:, planet_names.index(name)]
+        else:
+            others.append(k)
+    if others:
+        step = FAST_SAMPLE_MINUTES / 1440.0
+        grid = np.arange(jds.min(), jds.max() + step, step)
+        if len(grid) < 2:
+            grid = np.array([jds.min(), jds.min() + step])
+        sampled = compute_bodies_multi(grid, [names[k] for k in others])[:, :, LON]
+        for j, k in enumerate(others):
+            if not np.isnan(sampled[:, j]).any():
+                out[:, k] = np.interp(jds, grid, np.unwrap(sampled[:, j], period=360.0)) % 360.0
+    return out
+
+
+def _sample_states(chart: ChartModel, names: List[str], lons: np.ndarray, houses: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    (N, P) per-sample inputs of the precision pipeline: essential dignity,
+    sect match, mutual reception and Sun distance.
+    """
+    n = len(lons)
+    sun = names.index("Sun") if "Sun" in names else None
+    if sun is not None:
+        diurnal = houses[:, sun] >= 7                              # sect_from_house per sample
+    else:
+        diurnal = np.full(n, chart.sect != "night")
+    tables = {
+        d: dignity_scores(names, lons, terms=settings.DIGNITY_TERMS,
+                          triplicity=settings.DIGNITY_TRIPLICITY, diurnal=d)
+        for d in (True, False)
+    }
+    essential = np.round(np.clip(np.where(diurnal[:, None], tables[True], tables[False]), -1.0, 1.0), 3)
+
+    sect_match = np.zeros(lons.shape, dtype=bool)
+    if chart.sect:
+        for k, name in enumerate(names):
+            if name == "Mercury" and sun is not None:
+                day = wrap180(lons[:, k] - lons[:, sun]) < 0            # morning star
+            else:
+                member = planet_sect(name, {})
+                if member is None:
+                    continue
+                day = np.full(n, member == "day")
+            sect_match[:, k] = day == diurnal
+
+    signs = (lons // 30.0).astype(np.int8)
+    sign_rows, inverse = np.unique(signs, axis=0, return_inverse=True)
+    reception_rows = np.array([
+        [flags[name] for name in names]
+        for flags in (DispositorGraph({nm: SIGNS[s] for nm, s in zip(names, row)}).in_mutual_reception()
+                      for row in sign_rows)
+    ], dtype=bool)
+    reception = reception_rows[inverse.ravel()]
+
+    if sun is not None:
+        sun_distance = np.abs(wrap180(lons - lons[:, sun:sun + 1]))
+        sun_distance[:, sun] = np.nan
+    else:
+        sun_distance = np.full(lons.shape, np.nan)
+    return {"essential": essential, "sect_match": sect_match, "mutual_reception": reception,
+            "sun_distance": sun_distance}
+
+
+def analyze_birth_time_uncertainty(
+    chart: ChartModel,
+    lat: float,
+    lon: float,
+    uncertainty_minutes: float,
+    samples: int = 500,
+    seed: Optional[int] = 0,
+) -> Dict[str, object]:
+    """
+    Monte Carlo sensitivity of the chart + precision outputs to birth time.
+    `chart` is the central chart; samples cover ±uncertainty_minutes around it.
+    """
+    if uncertainty_minutes <= 0:
+        raise ValueError("uncertainty_minutes must be positive.")
+    samples = min(max(2, int(samples)), UNCERTAINTY_MAX_SAMPLES)
+    t0 = time.perf_counter()
+
+    # --- Sampled instants + ephemeris / houses for all of them at once
+    jd_center = float(chart.meta["jd_ut"])
+    jds = jd_center + _sample_offsets(samples, uncertainty_minutes, seed)
+    by_name = {p.name: p for p in chart.planets}
+    lons = _body_matrix(jds, list(by_name))
+    available = ~np.isnan(lons).any(axis=0)
+    skipped = [name for name, ok in zip(by_name, available) if not ok]
+    names, lons = [name for name, ok in zip(by_name, available) if ok], lons[:, available]
+    eps, eq_eq = nutation_frame(jd_center)
+    ay = ayanamsa(jd_center, chart.zodiac)                          # constant over minutes
+    armc = (sidereal_degrees(jds, eq_eq) + lon) % 360.0
+    cusps, asc, mc = cusps_batch(chart.house_system, armc, np.full(samples, lat), eps, ayanamsa=ay)
+    lons, cusps = to_zodiac(lons, ay), to_zodiac(cusps, ay)
+    asc, mc = to_zodiac(asc, ay), to_zodiac(mc, ay)
+    houses = assign_houses_batch(lons, cusps)                       # (N, P)
+    signs = (lons // 30.0).astype(np.int8)                          # (N, P)
+
+    # --- Precision pipeline per distinct (planet, state), then gather
+    contexts = build_planet_contexts(chart)
+    states = _sample_states(chart, names, lons, houses)
+    sun_band = np.searchsorted(SUN_PROXIMITY_ORBS, np.nan_to_num(states["sun_distance"], nan=999.0), side="right")
+    raw_s = np.empty((samples, len(names)))
+    axes_s = np.empty((samples, len(names), len(PRECISION_AXES)))
+    for k, name in enumerate(names):
+        placement = by_name[name]
+        keys = np.column_stack([
+            houses[:, k], np.rint(states["essential"][:, k] * 1000), sun_band[:, k],
+            states["sect_match"][:, k], states["mutual_reception"][:, k],
+        ])
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        raw_k = np.empty(len(first))
+        axes_k = np.empty((len(first), len(PRECISION_AXES)))
+        for u, i in enumerate(first):
+            h = int(houses[i, k])
+            ctx = {
+                **contexts.get(name, {}),
+                "house_type": house_type(h),
+                "sect_match": bool(states["sect_match"][i, k]),
+                "mutual_reception": bool(states["mutual_reception"][i, k]),
+            }
+            ctx.pop("sun_distance", None)
+            if not np.isnan(states["sun_distance"][i, k]):
+                ctx["sun_distance"] = float(states["sun_distance"][i, k])
+            moved = placement.model_copy(update={"house": h})
+            w = apply_contextual_weights(name, base_planet_precision(moved, float(states["essential"][i, k])), ctx)
+            axes_k[u] = [getattr(w, a) for a in PRECISION_AXES]
+            raw_k[u] = influence_score(w)
+        raw_s[:, k] = raw_k[inverse.ravel()]
+        axes_s[:, k] = axes_k[inverse.ravel()]
+
+    norm_s = normalize_influence_batch(raw_s, names)                # same scale as precision_norm_map
+
+    # --- Stability report
+    placements: Dict[str, Dict[str, object]] = {}
+    stable: List[str] = []
+    unstable: List[str] = []
+    for k, name in enumerate(names):
+        h_counts = np.bincount(houses[:, k], minlength=13)
+        s_counts = np.bincount(signs[:, k], minlength=12)
+        house_share = h_counts.max() / samples
+        sign_share = s_counts.max() / samples
+        is_stable = house_share >= STABILITY_THRESHOLD and sign_share >= STABILITY_THRESHOLD
+        (stable if is_stable else unstable).append(name)
+        placements[name] = {
+            "modal_house": int(h_counts.argmax()),
+            "house_probabilities": _distribution(houses[:, k], list(range(13))),
+            "modal_sign": SIGNS[int(s_counts.argmax())],
+            "sign_probabilities": _distribution(signs[:, k], SIGNS),
+            "stable": bool(is_stable),
+        }
+
+    angles: Dict[str, Dict[str, object]] = {}
+    for label, arr, center in (("Ascendant", asc, chart.asc), ("MC", mc, chart.mc)):
+        sign_idx = (arr // 30.0).astype(np.int8)
+        share = np.bincount(sign_idx, minlength=12).max() / samples
+        ref = center.lon if center else float(arr[samples // 2])
+        spread = wrap180(arr - ref)
+        angles[label] = {
+            "sign_probabilities": _distribution(sign_idx, SIGNS),
+            "lon_ci": [round(float((ref + d) % 360.0), 3) for d in np.percentile(spread, CI_PERCENTILES)],
+            "stable": bool(share >= STABILITY_THRESHOLD),
+        }
+        (stable if share >= STABILITY_THRESHOLD else unstable).append(label)
+
+    return {
+        "samples": samples,
+        "uncertainty_minutes": uncertainty_minutes,
+        # bodies with no ephemeris over the window (e.g. missing asteroid files)
+        "skipped_bodies": skipped,
+        "stable": stable,
+        "unstable": unstable,
+        "angles": angles,
+        "placements": placements,
+        "precision_norm_ci": {name: _ci(norm_s[:, k]) for k, name in enumerate(names)},
+        "precision_axes_ci": {
+            name: {a: _ci(axes_s[:, k, j]) for j, a in enumerate(PRECISION_AXES)}
+            for k, name in enumerate(names)
+        },
+        "elapsed_ms": round((time.perf_counter() - t0) * 1000, 2),
+    }
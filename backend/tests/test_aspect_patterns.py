@@ -0,0 +1,56 @@
+# backend/tests/test_aspect_patterns.py
+from itertools import combinations
+
+import numpy as np
+
+from backend.astro_engine.aspect_patterns import AspectGraph, detect_aspect_patterns
+from backend.astro_engine.aspects_detector import detect_aspects
+
+
+def _kinds(patterns, kind):
+    return [sorted(p.bodies) for p in patterns if p.kind == kind]
+
+
+def test_textbook_patterns():
+    lons = {
+        "A": 0.0, "B": 120.5, "C": 240.0,   # grand trine
+        "D": 180.0,                          # opposite A, sextile B and C → kite
+        "E": 90.0, "F": 270.0,               # squares to the A–D axis → grand cross
+    }
+    patterns = detect_aspect_patterns(detect_aspects(lons), names=list(lons))
+    assert _kinds(patterns, "grand_trine") == [["A", "B", "C"]]
+    kite = [p for p in patterns if p.kind == "kite"]
+    assert len(kite) == 1 and kite[0].apex == "A" and sorted(kite[0].bodies) == ["A", "B", "C", "D"]
+    assert _kinds(patterns, "grand_cross") == [["A", "D", "E", "F"]]
+    apexes = sorted(p.apex for p in patterns if p.kind == "t_square")
+    assert apexes == ["A", "D", "E", "F"]
+    assert all(0.0 <= p.strength <= 1.0 for p in patterns)
+    strengths = [p.strength for p in patterns]
+    assert strengths == sorted(strengths, reverse=True)
+
+
+def test_yod_apex_and_orbs():
+    lons = {"Sun": 10.0, "Moon": 70.0, "Pluto": 220.0}
+    (yod,) = detect_aspect_patterns(detect_aspects(lons), kinds=("yod",))
+    assert yod.apex == "Pluto" and sorted(yod.bodies) == ["Moon", "Pluto", "Sun"]
+    assert yod.max_orb == max(l.orb for l in yod.links)
+
+
+def test_matches_brute_force_on_dense_charts():
+    rng = np.random.default_rng(5)
+    for _ in range(20):
+        lons = {f"P{k}": float(x) for k, x in enumerate(rng.uniform(0, 360, 32))}
+        aspects = detect_aspects(lons)
+        g = AspectGraph(aspects, names=list(lons))
+        has = lambda a, b, asp: bool(g.mask(asp, a) >> b & 1)
+        n = len(lons)
+        trines = {frozenset(t) for t in combinations(range(n), 3)
+                  if all(has(a, b, "trine") for a, b in combinations(t, 2))}
+        tsq = {(frozenset((a, b)), c) for a, b in combinations(range(n), 2) if has(a, b, "opposition")
+               for c in range(n) if has(a, c, "square") and has(b, c, "square")}
+
+        found = detect_aspect_patterns(aspects, names=list(lons), kinds=("grand_trine", "t_square"))
+        idx = g.index
+        assert {frozenset(idx[b] for b in p.bodies) for p in found if p.kind == "grand_trine"} == trines
+        got_tsq = [(frozenset(idx[b] for b in p.bodies if b != p.apex), idx[p.apex]) for p in found if p.kind == "t_square"]
+        assert len(got_tsq) == len(tsq) and set(got_tsq) == tsq
@@ -0,0 +1,70 @@
+# backend/tests/test_astrocartography.py
+import numpy as np
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.astro_engine.astrocartography import astrocartography_lines, influence_raster, planet_equatorial
+from backend.astro_engine.ephemeris_loader import PLANETS
+
+client = TestClient(app)
+JD = 2443463.4  # 1977-11-15 21:36 UT
+
+
+def _features(fc, body, angle):
+    return [f for f in fc["features"] if f["properties"] == {"body": body, "angle": angle}][0]
+
+
+def test_equatorial_matches_swiss_ephemeris():
+    names, ra, dec = planet_equatorial(JD)
+    for name, r, d in zip(names, ra, dec):
+        ref = swe.calc_ut(JD, PLANETS[name], swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)[0]
+        assert abs(r - ref[0]) < 1e-6 and abs(d - ref[1]) < 1e-6
+
+
+def test_horizon_lines_put_body_on_horizon():
+    fc = astrocartography_lines(JD, step_deg=1.0)
+    sun = swe.calc_ut(JD, swe.SUN, swe.FLG_SWIEPH)[0]
+    for angle in ("ASC", "DSC"):
+        for segment in _features(fc, "Sun", angle)["geometry"]["coordinates"]:
+            for lon, lat in segment[::25]:
+                az, alt, _ = swe.azalt(JD, swe.ECL2HOR, (lon, lat, 0), 0, 0, sun[:3])
+                assert abs(alt) < 1e-3
+                # Swiss azimuth runs from south through west: east half is rising
+                assert (az > 180) == (angle == "ASC")
+
+
+def test_mc_line_matches_house_armc():
+    fc = astrocartography_lines(JD)
+    names, ra, _ = planet_equatorial(JD)
+    lon = _features(fc, "Moon", "MC")["geometry"]["coordinates"][0][0][0]
+    armc = swe.houses_ex(JD, 0.0, lon, b"P")[1][2]
+    # On the MC line local sidereal time equals the body's right ascension
+    assert abs(((armc - ra[names.index("Moon")]) + 180) % 360 - 180) < 1e-3
+
+
+def test_influence_raster_peaks_on_lines():
+    r = influence_raster(JD, resolution_deg=1.0, bodies=["Sun"], angles=["MC"])
+    assert r["values"].shape == (180, 360)
+    names, ra, _ = planet_equatorial(JD, ["Sun"])
+    col = int(np.argmax(r["values"][90]))
+    assert r["dominant"].max() == 0
+    fc = astrocartography_lines(JD, bodies=["Sun"])
+    mc_lon = _features(fc, "Sun", "MC")["geometry"]["coordinates"][0][0][0]
+    assert abs(r["lons"][col] - mc_lon) <= 1.0
+
+
+def test_astrocartography_endpoint():
+    payload = {
+        "dt_local": "1977-11-16T00:10:00",
+        "lat": 33.8938,
+        "lon": 35.5018,
+        "tz_name": "Asia/Beirut",
+        "raster_resolution_deg": 5,
+    }
+    resp = client.post("/astro/astrocartography", json=payload)
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["lines"]["type"] == "FeatureCollection"
+    assert len(data["lines"]["features"]) == 4 * len(PLANETS)
+    assert len(data["raster"]["values"]) == 36 and len(data["raster"]["values"][0]) == 72
@@ -0,0 +1,75 @@
+# backend/tests/test_bodies.py
+from datetime import datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from backend.astro_engine.aspects_detector import DEFAULT_ASPECT_DEFS, _angle_diff, detect_aspects
+from backend.astro_engine.bodies import (
+    BODY_SETS, LON, compute_bodies, compute_bodies_multi, resolve_bodies,
+)
+from backend.astro_engine.chart_generator import build_natal_chart
+
+JD = 2443463.4
+BIRTH = datetime(1977, 11, 16, 0, 10)
+
+
+def _loop_aspects(lon_map, moon_extra_orb=2):
+    """Reference: the original pairwise loop."""
+    names = list(lon_map)
+    out = []
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            sep = _angle_diff(lon_map[names[i]], lon_map[names[j]])
+            for name, angle, base_orb in DEFAULT_ASPECT_DEFS:
+                orb = base_orb
+                if "Moon" in (names[i], names[j]):
+                    orb = max(orb, base_orb + moon_extra_orb)
+                if abs(sep - angle) <= orb:
+                    out.append((names[i], names[j], name, round(sep, 3), round(abs(sep - angle), 3)))
+    out.sort(key=lambda x: (x[4], abs(x[3] - 180.0)))
+    return out
+
+
+def test_body_set_positions_and_derived_south_node():
+    names = resolve_bodies("traditional")
+    pos = compute_bodies(JD, names)
+    assert pos.shape == (len(names), 6)
+    north, south = pos[names.index("North Node")], pos[names.index("South Node")]
+    assert abs((south[LON] - north[LON]) % 360.0 - 180.0) < 1e-9
+    mars = swe.calc_ut(JD, swe.MARS, swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+    assert np.allclose(pos[names.index("Mars")], mars)
+
+
+def test_multi_instant_matches_single():
+    names = resolve_bodies("classic", ["Lilith"])
+    jds = [JD, JD + 1.5, JD + 40.0]
+    multi = compute_bodies_multi(jds, names)
+    for t, jd in enumerate(jds):
+        assert np.array_equal(multi[t], compute_bodies(jd, names))
+
+
+def test_unknown_bodies_rejected():
+    with pytest.raises(ValueError):
+        resolve_bodies("everything")
+    with pytest.raises(ValueError):
+        resolve_bodies("classic", ["Planet X"])
+    assert resolve_bodies("classic", ["Asteroid 433"])[-1] == "Asteroid 433"
+
+
+def test_extended_chart_places_every_available_body():
+    chart = build_natal_chart(BIRTH, 33.8938, 35.5018, "Asia/Beirut", body_set="extended")
+    placed = {p.name for p in chart.planets}
+    missing = set(filter(None, chart.meta.get("unavailable_bodies", "").split(", ")))
+    assert placed | missing == set(BODY_SETS["extended"])
+    assert {"North Node", "South Node", "Lilith"} <= placed
+    assert all(p.house in range(1, 13) and p.speed is not None for p in chart.planets)
+
+
+def test_vectorized_aspects_match_loop():
+    rng = np.random.default_rng(5)
+    for _ in range(20):
+        lon_map = {n: float(x) for n, x in zip(BODY_SETS["extended"], rng.uniform(0, 360, 18))}
+        got = [(a.p1, a.p2, a.aspect, a.angle, a.orb) for a in detect_aspects(lon_map)]
+        assert got == _loop_aspects(lon_map)
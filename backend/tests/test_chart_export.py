@@ -0,0 +1,71 @@
+# backend/tests/test_chart_export.py
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.services import chart_export
+from backend.services.chart_export import (
+    chart_record_batches, export_schema, profile_chart_rows, write_parquet_dataset,
+)
+from backend.services.horoscope_service import compute_contextual_weights
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+
+BIRTHS = [
+    (datetime(1977, 11, 16, 0, 10), 33.8938, 35.5018, "Asia/Beirut"),
+    (datetime(1984, 3, 2, 14, 45), 48.8566, 2.3522, "Europe/Paris"),
+    (datetime(1991, 7, 21, 6, 30), 40.7128, -74.0060, "America/New_York"),
+    (datetime(1993, 1, 5, 22, 0), -33.8688, 151.2093, "Australia/Sydney"),
+    (datetime(2001, 9, 9, 9, 9), 51.5074, -0.1278, "Europe/London"),
+]
+
+
+def _rows():
+    for k, (dt, lat, lon, tz) in enumerate(BIRTHS):
+        yield f"p{k}", build_natal_chart(dt, lat, lon, tz), lat, lon
+
+
+def test_batches_have_fixed_schema_and_chart_values():
+    batches = list(chart_record_batches(_rows(), batch_rows=2))
+    assert [b.num_rows for b in batches] == [2, 2, 1]
+    assert all(b.schema == export_schema() for b in batches)
+
+    row = pa.Table.from_batches(batches).slice(0, 1).to_pylist()[0]
+    chart = build_natal_chart(*BIRTHS[0])
+    sun = next(p for p in chart.planets if p.name == "Sun")
+    weights = compute_contextual_weights(chart)
+    assert row["profile_id"] == "p0" and row["birth_decade"] == 1970
+    assert row["sun_lon"] == pytest.approx(sun.lon) and row["sun_house"] == sun.house
+    assert row["sun_precision_essential"] == pytest.approx(weights["Sun"].essential, abs=1e-6)
+    assert row["cusps"] == pytest.approx([h.lon for h in chart.houses])
+    assert [(a["p1"], a["p2"], a["aspect"]) for a in row["aspects"]] == [(a.p1, a.p2, a.aspect) for a in chart.aspects]
+
+
+def test_partitioned_parquet_round_trip(tmp_path):
+    schema = export_schema(with_precision=False)
+    write_parquet_dataset(chart_record_batches(_rows(), batch_rows=2, with_precision=False), tmp_path, schema)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["birth_decade=1970", "birth_decade=1980",
+                                                          "birth_decade=1990", "birth_decade=2000"]
+    table = ds.dataset(tmp_path, format="parquet", partitioning="hive").to_table()
+    assert table.num_rows == len(BIRTHS)
+    assert "sun_precision_essential" not in table.column_names
+    assert sorted(table.column("profile_id").to_pylist()) == [f"p{k}" for k in range(len(BIRTHS))]
+
+
+def test_failing_profile_is_skipped_and_counted(monkeypatch):
+    profiles = [SimpleNamespace(id=k, lat=lat, lon=lon) for k, (_, lat, lon, _) in enumerate(BIRTHS[:3])]
+    profiles.append(SimpleNamespace(id=9, lat=None, lon=None))
+
+    def chart(profile):
+        if profile.id == 1:
+            raise RuntimeError("no cusps")
+        return build_natal_chart(*BIRTHS[profile.id])
+
+    monkeypatch.setattr(chart_export, "profile_chart", chart)
+    failed = []
+    rows = list(profile_chart_rows(profiles, failed))
+    assert [r[0] for r in rows] == ["0", "2"]
+    assert failed == ["1"]
@@ -0,0 +1,39 @@
+# backend/tests/test_context_builder.py
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.context_builder import house_type, motion_context
+from backend.services.horoscope_service import build_planet_contexts, compute_contextual_weights
+
+
+def test_motion_context_columns():
+    names = ["Sun", "Mercury", "Mars", "North Node", "Asteroid 433"]
+    cols = motion_context(
+        names,
+        lons=[100.0, 104.0, 250.0, 10.0, 99.8],
+        speeds=[0.95, -0.4, 0.786, -0.05, np.nan],
+        houses=[10, 11, 3, 0, 10],
+        sun_lon=100.0,
+    )
+    assert cols["is_retrograde"].tolist() == [False, True, False, False, False]
+    assert cols["speed_ratio"][2] == pytest.approx(1.5, rel=1e-3)
+    assert cols["speed_ratio"][4] == 1.0
+    assert cols["house_type"].tolist() == ["angular", "succedent", "cadent", "cadent", "angular"]
+    assert cols["sun_distance"][1] == pytest.approx(4.0) and cols["sun_distance"][2] == pytest.approx(150.0)
+    assert [house_type(h) for h in (1, 5, 12, None)] == ["angular", "succedent", "cadent", "cadent"]
+
+
+def test_every_planet_gets_a_context():
+    chart = build_natal_chart(datetime(1990, 6, 15, 13, 0), 51.5, -0.12, "Europe/London")
+    contexts = build_planet_contexts(chart)
+    assert set(contexts) == {p.name for p in chart.planets}
+    for p in chart.planets:
+        ctx = contexts[p.name]
+        assert ctx["is_retrograde"] == (p.speed < 0)
+        assert ctx["house_type"] == house_type(p.house)
+        assert ("sun_distance" in ctx) == (p.name != "Sun")
+    weights = compute_contextual_weights(chart)
+    assert all(-1.0 <= w.accidental <= 1.0 for w in weights.values())
@@ -0,0 +1,44 @@
+# backend/tests/test_declinations.py
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+
+from backend.astro_engine.aspects_detector import detect_parallels
+from backend.astro_engine.bodies import DEC, RA, compute_bodies
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.ephemeris_loader import FLAGS, PLANETS
+from backend.astro_engine.house_batch import nutation_frame
+from backend.services.horoscope_service import build_planet_contexts
+
+
+def test_equatorial_columns_match_swiss_ephemeris():
+    jd = 2448000.5
+    eps, _ = nutation_frame(jd)
+    names = list(PLANETS)
+    pos = compute_bodies(jd, names, eps=eps)
+    assert pos.shape == (len(names), 8)
+    for k, name in enumerate(names):
+        ra, dec = swe.calc_ut(jd, PLANETS[name], FLAGS | swe.FLG_EQUATORIAL)[0][:2]
+        assert pos[k, RA] == pytest.approx(ra, abs=1e-6)
+        assert pos[k, DEC] == pytest.approx(dec, abs=1e-6)
+
+
+def test_parallels_and_contraparallels():
+    links = detect_parallels({"Sun": 20.1, "Moon": 20.6, "Mars": -20.3, "Venus": 5.0})
+    kinds = {(l.p1, l.p2): l.aspect for l in links}
+    assert kinds == {("Sun", "Moon"): "parallel", ("Sun", "Mars"): "contraparallel", ("Moon", "Mars"): "contraparallel"}
+    assert [l.orb for l in links] == sorted(l.orb for l in links)
+
+
+def test_chart_out_of_bounds_flags_and_context():
+    # Moon reached ~28.7° declination in early 2006 (major lunar standstill)
+    chart = build_natal_chart(datetime(2006, 3, 10, 12, 0), 51.5, -0.12, "Europe/London")
+    eps = nutation_frame(float(chart.meta["jd_ut"]))[0]
+    for p in chart.planets:
+        assert p.out_of_bounds == (abs(p.decl) > eps)
+    assert next(p for p in chart.planets if p.name == "Moon").out_of_bounds
+    assert abs(chart.mc.decl) <= eps + 1e-9
+    ctx = build_planet_contexts(chart)
+    assert all(ctx[p.name]["out_of_bounds"] == p.out_of_bounds for p in chart.planets)
+    assert all(l.aspect in ("parallel", "contraparallel") for l in chart.parallels)
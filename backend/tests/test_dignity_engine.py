@@ -0,0 +1,52 @@
+# backend/tests/test_dignity_engine.py
+from datetime import datetime
+
+import numpy as np
+
+from backend.astro_engine.astro_config import DIGNITY_SCORES as S
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.dignities import DIGNITY_PLANETS, dignity_labels, dignity_scores, dignity_table
+from backend.services.horoscope_service import analyze_chart, compute_essential_dignities
+
+
+def test_table_covers_every_degree():
+    for terms in ("egyptian", "ptolemaic"):
+        table = dignity_table(terms, "dorothean", True)
+        assert table.shape == (len(DIGNITY_PLANETS) + 1, 360)
+        assert not table[-1].any()
+        # Each degree has exactly one term ruler and one face ruler among the seven
+        flags = [dignity_labels(p, d, terms) for d in range(360) for p in DIGNITY_PLANETS]
+        assert sum("term" in f for f in flags) == 360
+        assert sum("face" in f for f in flags) == 360
+
+
+def test_classic_placements():
+    assert dignity_labels("Sun", 130.0) == ["rulership", "triplicity"]                     # Leo, by day
+    assert dignity_labels("Sun", 130.0, diurnal=False) == ["rulership"]
+    assert "exaltation" in dignity_labels("Venus", 350.0)                                   # Pisces
+    assert dignity_labels("Saturn", 5.0) == ["fall", "peregrine"]                           # Aries 5°
+    assert dignity_labels("Mars", 200.0) == ["detriment", "peregrine"]                      # Libra 20°
+    assert "term" in dignity_labels("Jupiter", 2.0, terms="ptolemaic")
+    assert dignity_scores(["Mars"], [5.5])[0] == S["rulership"] + S["face"]
+
+
+def test_chart_scoring_is_one_gather():
+    rng = np.random.default_rng(4)
+    lons = rng.uniform(0, 360, (200, 8))
+    names = list(DIGNITY_PLANETS) + ["Pluto"]
+    scores = dignity_scores(names[:8], lons)
+    assert scores.shape == (200, 8)
+    row = 17
+    for k, name in enumerate(names[:8]):
+        labels = dignity_labels(name, lons[row, k]) if name in DIGNITY_PLANETS else []
+        assert np.isclose(scores[row, k], sum(S[x] for x in labels))
+
+
+def test_analyze_chart_fills_essential_axis():
+    chart = build_natal_chart(datetime(1977, 11, 16, 0, 10), 33.8938, 35.5018, "Asia/Beirut")
+    essential = compute_essential_dignities(chart)
+    profile = analyze_chart(chart)
+    assert any(v != 0.0 for v in essential.values())
+    assert essential["Pluto"] == 0.0
+    assert all(-1.0 <= v <= 1.0 for v in essential.values())
+    assert profile.contextual_weights["Mars"].essential != 0.0
@@ -0,0 +1,65 @@
+# backend/tests/test_dispositor_graph.py
+import numpy as np
+
+from backend.astro_engine.dispositor_chain import (
+    RULERS, DispositorGraph, build_dispositor_chain, dominance_batch,
+)
+from backend.astro_engine.zodiac_utils import SIGNS
+
+PLANETS = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+
+
+def _walk_every_chain(planet_positions):
+    """Reference: the original walk with a fresh visited set per planet."""
+    dominance = {p: 0.0 for p in planet_positions}
+    for planet, sign in planet_positions.items():
+        ruler = RULERS.get(sign)
+        weight = 1.0
+        visited = set()
+        while ruler and ruler not in visited:
+            visited.add(ruler)
+            dominance[ruler] = dominance.get(ruler, 0) + weight
+            ruler = RULERS.get(planet_positions.get(ruler, ""), None)
+            weight *= 0.5
+    return dominance
+
+
+def _random_charts(n, names, seed=11):
+    idx = np.random.default_rng(seed).integers(0, 12, (n, len(names)))
+    return idx, [{name: SIGNS[s] for name, s in zip(names, row)} for row in idx]
+
+
+def test_memoized_dominance_matches_reference():
+    _, charts = _random_charts(300, PLANETS)
+    # include charts where some rulers are not placed at all
+    _, partial = _random_charts(100, ["Sun", "Moon", "Venus", "Pluto"], seed=12)
+    for positions in charts + partial:
+        got = build_dispositor_chain(positions)
+        ref = _walk_every_chain(positions)
+        assert got.keys() == ref.keys()
+        assert all(abs(got[k] - ref[k]) < 1e-12 for k in ref)
+
+
+def test_cycles_final_dispositor_and_mutual_reception():
+    # Mars in Aries rules everything in fire/Scorpio; Venus/Mercury in mutual reception
+    graph = DispositorGraph({
+        "Mars": "Aries", "Sun": "Scorpio", "Jupiter": "Aries",
+        "Venus": "Gemini", "Mercury": "Libra",
+    })
+    assert sorted(map(sorted, graph.cycles)) == [["Mars"], ["Mercury", "Venus"]]
+    assert graph.final_dispositors == ["Mars"]
+    assert graph.sole_final_dispositor is None
+    assert graph.mutual_receptions in ([("Venus", "Mercury")], [("Mercury", "Venus")])
+    assert graph.in_mutual_reception()["Venus"] and not graph.in_mutual_reception()["Sun"]
+    assert graph.terminal("Sun") == "Mars" and graph.terminal("Venus") is None
+
+    solo = DispositorGraph({"Mars": "Aries", "Sun": "Scorpio", "Moon": "Leo"})
+    assert solo.sole_final_dispositor == "Mars"
+
+
+def test_batch_matches_per_chart():
+    idx, charts = _random_charts(500, PLANETS, seed=13)
+    batch = dominance_batch(PLANETS, idx)
+    for row in (0, 99, 499):
+        ref = build_dispositor_chain(charts[row])
+        assert np.allclose(batch[row], [ref[p] for p in PLANETS])
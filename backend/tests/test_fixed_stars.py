@@ -0,0 +1,53 @@
+# backend/tests/test_fixed_stars.py
+from datetime import datetime
+
+import numpy as np
+
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.fixed_stars import find_star_conjunctions, load_star_table, precessed_longitudes
+from backend.core.config import settings
+
+# J2000 ecliptic longitudes of a few reference stars
+J2000_LONS = {"Regulus": 149.83, "Spica": 203.84, "Algol": 56.17, "Aldebaran": 69.79, "Antares": 249.76}
+
+
+def test_catalog_converts_to_j2000_ecliptic():
+    table = load_star_table(100)
+    for name, lon in J2000_LONS.items():
+        assert abs(table.lon[table.names.index(name)] - lon) < 0.02
+
+
+def test_precession_rate_and_cap(monkeypatch):
+    table = load_star_table(5)
+    assert len(table) == 5 and table.names[0] == "Sirius"
+    century = precessed_longitudes(2451545.0 + 36525.0, table) - precessed_longitudes(2451545.0, table)
+    assert np.allclose(century, 5030.2077 / 3600.0)
+    monkeypatch.setattr(settings, "FIXED_STAR_MAX_COUNT", 12)
+    capped = load_star_table()
+    assert len(capped) == 12 and capped.names == load_star_table(100).names[:12]
+    monkeypatch.setattr(settings, "FIXED_STAR_MAX_COUNT", None)
+    assert len(load_star_table()) == len(load_star_table(100)) == 57
+
+
+def test_conjunctions_via_binary_search_match_brute_force():
+    jd = 2443463.4
+    table = load_star_table(100)
+    star_lon = precessed_longitudes(jd, table)
+    rng = np.random.default_rng(7)
+    points = {f"P{i}": float(x) for i, x in enumerate(rng.uniform(0, 360, 40))}
+    points["Edge"] = float((star_lon[table.names.index("Regulus")] + 0.99) % 360.0)
+    got = {(h["star"], h["point"]) for h in find_star_conjunctions(jd, points, orb=1.0, table=table)}
+    brute = {
+        (s, p) for i, s in enumerate(table.names) for p, lon in points.items()
+        if abs((lon - star_lon[i] + 180.0) % 360.0 - 180.0) <= 1.0
+    }
+    assert got == brute and ("Regulus", "Edge") in got
+
+
+def test_chart_fixed_stars_follow_zodiac():
+    dt = datetime(1977, 11, 16, 0, 10)
+    trop = build_natal_chart(dt, 33.8938, 35.5018, "Asia/Beirut", include_fixed_stars=True)
+    sid = build_natal_chart(dt, 33.8938, 35.5018, "Asia/Beirut", include_fixed_stars=True, zodiac="lahiri")
+    assert [(c.star, c.point) for c in trop.fixed_stars] == [(c.star, c.point) for c in sid.fixed_stars]
+    assert ("Regulus", "Saturn") in {(c.star, c.point) for c in trop.fixed_stars}
+    assert all(c.orb <= 1.0 for c in trop.fixed_stars)
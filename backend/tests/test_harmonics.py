@@ -0,0 +1,39 @@
+# backend/tests/test_harmonics.py
+import numpy as np
+
+from backend.astro_engine.aspects_detector import detect_aspects
+from backend.astro_engine.harmonics import (
+    harmonic_conjunctions, harmonic_longitudes, harmonic_profile, harmonic_spectrum, harmonic_spectrum_batch,
+)
+
+
+def test_harmonic_longitudes_shape_and_values():
+    hl = harmonic_longitudes([10.0, 200.0], harmonics=[1, 2, 5])
+    assert hl.shape == (3, 2)
+    assert np.allclose(hl[:, 0], [10.0, 20.0, 50.0]) and np.allclose(hl[:, 1], [200.0, 40.0, 280.0])
+
+
+def test_fifth_harmonic_dominates_quintiles():
+    names = ["A", "B", "C", "D", "E"]
+    lons = [0.0, 72.0, 144.5, 216.0, 288.0]
+    prof = harmonic_profile(names, lons, top=1)
+    assert prof["strongest"][0]["harmonic"] == 5
+    assert len(prof["strongest"][0]["conjunctions"]) == 10
+
+
+def test_h1_conjunctions_agree_with_detect_aspects():
+    rng = np.random.default_rng(9)
+    names = [f"P{k}" for k in range(10)]
+    lons = rng.uniform(0, 360, 10)
+    got = {(c["p1"], c["p2"]) for c in harmonic_conjunctions(names, lons, 1, orb=8.0)}
+    ref = {(a.p1, a.p2) for a in detect_aspects(dict(zip(names, lons.tolist())),
+                                                aspect_defs=(("conjunction", 0, 8),), moon_extra_orb=0)}
+    assert got == ref
+
+
+def test_batch_matches_single():
+    rng = np.random.default_rng(4)
+    lons = rng.uniform(0, 360, (37, 12))
+    batch = harmonic_spectrum_batch(lons, chunk_size=8)
+    assert batch.shape == (37, 32)
+    assert np.allclose(batch[20], harmonic_spectrum(lons[20]))
@@ -0,0 +1,51 @@
+# backend/tests/test_house_index.py
+import numpy as np
+import swisseph as swe
+
+from backend.astro_engine.house_batch import locate_houses_batch, placidus_batch
+from backend.astro_engine.house_blending import blend_nearby_houses
+from backend.astro_engine.house_calculator import HouseIndex
+from backend.astro_engine.zodiac_utils import normalize_lon
+
+
+def _linear_scan(lon, cusps):
+    """Reference: the original per-house scan."""
+    lon = normalize_lon(lon)
+    for i in range(12):
+        start, end = normalize_lon(cusps[i]), normalize_lon(cusps[(i + 1) % 12])
+        if (start <= lon < end) if start < end else (lon >= start or lon < end):
+            return i + 1
+    return 12
+
+
+def test_house_index_matches_linear_scan():
+    rng = np.random.default_rng(1)
+    for jd, lat, lon in [(2443463.4, 33.9, 35.5), (2451545.0, -41.3, 174.8), (2460000.5, 64.1, -21.9)]:
+        cusps = list(swe.houses_ex(jd, lat, lon, b"P")[0])
+        lons = np.concatenate([rng.uniform(0, 360, 500), cusps, [359.9999999, 0.0]])
+        houses, offsets = HouseIndex(cusps).locate(lons)
+        assert [int(h) for h in houses] == [_linear_scan(x, cusps) for x in lons]
+        assert np.all((offsets >= 0) & (offsets < 360))
+        # Offsets are measured from the cusp of the house the point is in
+        starts = np.asarray(cusps)[houses - 1]
+        assert np.allclose((lons - starts) % 360.0, offsets)
+
+
+def test_blend_uses_offsets_from_index():
+    cusps = [(i * 30.0 + 10.0) for i in range(12)]
+    index = HouseIndex(cusps)
+    assert index.house_of(12.0) == 1
+    assert index.blend([12.0])[0] == blend_nearby_houses(1, 2.0)
+    assert index.blend(8.0)[0] == blend_nearby_houses(12, 28.0)
+
+
+def test_locate_houses_batch_rows_independent():
+    rng = np.random.default_rng(2)
+    armc = rng.uniform(0, 360, 64)
+    cusps, _, _ = placidus_batch(armc, np.full(64, 48.85), 23.44)
+    lons = rng.uniform(0, 360, (64, 30))
+    houses, offsets = locate_houses_batch(lons, cusps)
+    for row in (0, 17, 63):
+        ref_h, ref_o = HouseIndex(cusps[row]).locate(lons[row])
+        assert np.array_equal(houses[row], ref_h)
+        assert np.allclose(offsets[row], ref_o)
@@ -0,0 +1,63 @@
+# backend/tests/test_house_systems.py
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.astro_engine import house_calculator
+from backend.astro_engine.astro_config import HOUSE_SYSTEMS
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.house_calculator import compute_house_cusps, compute_placidus_cusps
+
+client = TestClient(app)
+JD, LAT, LON = 2443463.4, 33.8938, 35.5018
+
+
+def test_all_systems_match_houses_ex():
+    result = compute_house_cusps(JD, LAT, LON, list(HOUSE_SYSTEMS))
+    for name, code in HOUSE_SYSTEMS.items():
+        ref_cusps, ref_ascmc = swe.houses_ex(JD, LAT, LON, code.encode())
+        houses, asc, mc = result[name]
+        assert [h["house"] for h in houses] == list(range(1, 13))
+        assert max(abs(h["lon"] - c) for h, c in zip(houses, ref_cusps)) < 1e-9
+        assert abs(asc - ref_ascmc[0]) < 1e-9 and abs(mc - ref_ascmc[1]) < 1e-9
+
+
+def test_switching_system_is_a_cache_lookup(monkeypatch):
+    compute_house_cusps(JD, LAT, LON, ["placidus", "whole_sign"])
+    monkeypatch.setattr(house_calculator.swe, "houses_armc", lambda *a: pytest.fail("cache miss"))
+    assert compute_house_cusps(JD, LAT, LON, ["whole_sign"])["whole_sign"][0][0]["lon"] % 30 == 0
+    assert compute_placidus_cusps(JD, LAT, LON)[1] == compute_house_cusps(JD, LAT, LON)["placidus"][1]
+
+
+def test_unknown_system_rejected():
+    with pytest.raises(ValueError):
+        compute_house_cusps(JD, LAT, LON, ["campanus-ish"])
+
+
+def test_chart_primary_and_side_by_side_systems():
+    dt = datetime(1977, 11, 16, 0, 10)
+    chart = build_natal_chart(dt, LAT, LON, "Asia/Beirut", house_system="whole_sign",
+                              extra_house_systems=["placidus", "koch"])
+    assert chart.house_system == "whole_sign"
+    assert set(chart.alt_house_systems) == {"placidus", "koch"}
+    # Whole sign: house = signs counted from the Ascendant sign
+    asc_sign = int(chart.asc.lon // 30)
+    for p in chart.planets:
+        assert p.house == (int(p.lon // 30) - asc_sign) % 12 + 1
+    placidus = build_natal_chart(dt, LAT, LON, "Asia/Beirut")
+    assert chart.alt_house_systems["placidus"].planet_houses == {p.name: p.house for p in placidus.planets}
+
+
+def test_compute_endpoint_house_systems():
+    payload = {
+        "dt_local": "1977-11-16T00:10:00", "lat": LAT, "lon": LON, "tz_name": "Asia/Beirut",
+        "house_system": "equal", "extra_house_systems": ["regiomontanus"],
+    }
+    resp = client.post("/astro/compute", json=payload)
+    assert resp.status_code == 200, resp.text
+    assert list(resp.json()["house_systems"]) == ["equal", "regiomontanus"]
+    bad = client.post("/astro/compute", json={**payload, "house_system": "nope"})
+    assert bad.status_code == 400
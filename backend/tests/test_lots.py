@@ -0,0 +1,59 @@
+# backend/tests/test_lots.py
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.lots import (
+    LOT_POINTS, LotCatalog, default_lot_catalog, lot_longitudes, planet_sect, sect_from_house,
+)
+from backend.services.horoscope_service import build_planet_contexts
+
+POINTS = dict(zip(LOT_POINTS, [100.0, 10.0, 40.0, 250.0, 30.0, 70.0, 200.0, 300.0, 5.0]))
+
+
+def _lots(diurnal):
+    cat = default_lot_catalog()
+    return dict(zip(cat.names, lot_longitudes([POINTS[p] for p in cat.points], diurnal).tolist()))
+
+
+def test_fortune_spirit_and_reversal():
+    asc, sun, moon, venus = POINTS["Ascendant"], POINTS["Sun"], POINTS["Moon"], POINTS["Venus"]
+    day, night = _lots(True), _lots(False)
+    assert day["Fortune"] == pytest.approx((asc + moon - sun) % 360)
+    assert day["Spirit"] == pytest.approx((asc + sun - moon) % 360)
+    assert night["Fortune"] == pytest.approx(day["Spirit"])
+    # Eros refers to Spirit of the same sect
+    assert day["Eros"] == pytest.approx((asc + venus - day["Spirit"]) % 360)
+    assert night["Eros"] == pytest.approx((asc + night["Spirit"] - venus) % 360)
+
+
+def test_batch_and_custom_catalog():
+    cat = default_lot_catalog()
+    x = np.random.default_rng(2).uniform(0, 360, (6, len(cat.points)))
+    diurnal = np.array([True, False] * 3)
+    batch = lot_longitudes(x, diurnal)
+    assert np.allclose(batch[1], lot_longitudes(x[1], False))
+    custom = LotCatalog([("Test", "MC", "Sun", "Moon", False)])
+    assert custom.names == ["Test"] and np.allclose(custom.day, custom.night)
+    with pytest.raises(ValueError):
+        LotCatalog([("Bad", "Ascendant", "Spirit", "Sun", True)])
+
+
+def test_sect_helpers():
+    assert sect_from_house(10) == "day" and sect_from_house(3) == "night"
+    assert planet_sect("Jupiter", {}) == "day" and planet_sect("Mars", {}) == "night"
+    assert planet_sect("Mercury", {"Sun": 100.0, "Mercury": 90.0}) == "day"
+    assert planet_sect("Uranus", {}) is None
+
+
+def test_chart_lots_and_sect_context():
+    chart = build_natal_chart(datetime(1990, 6, 15, 13, 0), 51.5, -0.12, "Europe/London")
+    assert chart.sect == "day"
+    fortune = next(l for l in chart.lots if l.name == "Fortune")
+    lon = {p.name: p.lon for p in chart.planets}
+    assert fortune.lon == pytest.approx((chart.asc.lon + lon["Moon"] - lon["Sun"]) % 360)
+    assert 1 <= fortune.house <= 12
+    ctx = build_planet_contexts(chart)
+    assert ctx["Sun"]["sect_match"] and not ctx["Mars"]["sect_match"]
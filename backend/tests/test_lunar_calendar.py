@@ -0,0 +1,30 @@
+# backend/tests/test_lunar_calendar.py
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.astro_engine.lunar_calendar import lunar_calendar
+
+client = TestClient(app)
+
+
+def test_lunar_calendar_2024_contents():
+    cal = lunar_calendar(2024)
+    new_moons = [p for p in cal["phases"] if p["phase"] == "new_moon"]
+    assert len(new_moons) == 13  # incl. the "black moon" of 2024-12-30
+    # New Moon of 2024-01-11 11:57 UT
+    assert new_moons[0]["utc"].startswith("2024-01-11T11:5")
+
+    assert 150 < len(cal["ingresses"]) < 170
+    for voc in cal["void_of_course"]:
+        assert voc["start"]["jd"] <= voc["end"]["jd"]
+        assert voc["duration_hours"] < 72
+
+
+def test_lunar_calendar_endpoint_caching_headers():
+    resp = client.get("/astro/lunar-calendar/2024")
+    assert resp.status_code == 200
+    assert "max-age" in resp.headers["cache-control"]
+    etag = resp.headers["etag"]
+
+    cached = client.get("/astro/lunar-calendar/2024", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
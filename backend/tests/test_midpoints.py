@@ -0,0 +1,40 @@
+# backend/tests/test_midpoints.py
+import numpy as np
+import pytest
+
+from backend.astro_engine.midpoints import compute_midpoints, midpoint_hits_batch, midpoint_tree
+
+
+def test_nearer_midpoint_wraps():
+    assert np.allclose(compute_midpoints([350.0, 10.0]), [0.0])
+    assert np.allclose(compute_midpoints([10.0, 100.0, 200.0]), [55.0, 285.0, 150.0])
+
+
+def test_tree_on_90_dial():
+    names = ["Sun", "Moon", "Mars", "Venus"]
+    # Sun/Moon midpoint = 50; Mars at 140.5 sits on it by 90° dial (square), Venus at 230 by opposition
+    tree = midpoint_tree(names, [20.0, 80.0, 140.5, 230.0], dial=90, orb=1.0)
+    mars = tree["Mars"]
+    assert mars[0]["midpoint"] == "Sun/Moon" and mars[0]["lon"] == 50.0 and mars[0]["orb"] == 0.5
+    assert any(e["midpoint"] == "Sun/Moon" and e["orb"] == 0.0 for e in tree["Venus"])
+    # a point is never matched to midpoints it belongs to
+    assert all(not e["midpoint"].startswith("Sun/") and "/Sun" not in e["midpoint"] for e in tree["Sun"])
+    with pytest.raises(ValueError):
+        midpoint_tree(names, [0, 1, 2, 3], dial=30)
+
+
+def test_batch_matches_brute_force():
+    rng = np.random.default_rng(3)
+    lons = rng.uniform(0, 360, (50, 12))
+    dial, orb = 45.0, 1.2
+    hits = midpoint_hits_batch(lons, dial=dial, orb=orb)
+    got = set(zip(hits["chart"].tolist(), hits["point"].tolist(), hits["pair_a"].tolist(), hits["pair_b"].tolist()))
+
+    mids = compute_midpoints(lons)
+    a, b = np.triu_indices(12, 1)
+    d = (lons[:, :, None] - mids[:, None, :] + dial / 2) % dial - dial / 2
+    ok = (np.abs(d) <= orb) & (a[None, None, :] != np.arange(12)[None, :, None]) & (b[None, None, :] != np.arange(12)[None, :, None])
+    c, p, m = np.nonzero(ok)
+    assert got == set(zip(c.tolist(), p.tolist(), a[m].tolist(), b[m].tolist()))
+    assert len(got) == len(hits["chart"])
+    assert np.all(np.abs(hits["orb"]) <= orb + 1e-9)
@@ -0,0 +1,54 @@
+# backend/tests/test_precision_calibration.py
+import numpy as np
+import pytest
+
+from backend.core.config import settings
+from backend.models.horoscope_profile import PlanetPrecision
+from backend.services.precision_calibration import PrecisionCalibration, load_calibration
+from backend.services.precision_summary_service import normalize_influence, normalize_influence_batch
+from backend.services.quantile_sketch import QuantileSketch
+
+
+def test_sketch_accuracy_and_merge():
+    rng = np.random.default_rng(0)
+    data = rng.normal(0.4, 0.1, 60000)
+    a = QuantileSketch().update(data[:30000])
+    b = QuantileSketch().update(data[30000:])
+    merged = a.merge(b)
+    assert merged.count == 60000
+    assert len(merged.means) <= 200
+    exact = np.quantile(data, [0.01, 0.25, 0.5, 0.75, 0.99])
+    assert np.allclose(merged.quantile([0.01, 0.25, 0.5, 0.75, 0.99]), exact, atol=2e-3)
+    assert merged.percentile(0.4) == pytest.approx(0.5, abs=0.01)
+    assert merged.percentile(data.min() - 1) == 0.0 and merged.percentile(data.max() + 1) == 1.0
+
+    restored = QuantileSketch.from_dict(merged.to_dict())
+    assert restored.percentile(0.5) == pytest.approx(merged.percentile(0.5))
+
+
+def test_calibration_round_trip_and_percentile_mode(tmp_path, monkeypatch):
+    cal = PrecisionCalibration()
+    rng = np.random.default_rng(1)
+    for planet, loc in (("Sun", 0.5), ("Moon", 0.3)):
+        cal.observe_many(planet, "influence", rng.normal(loc, 0.05, 5000))
+    cal.observe({"Sun": 0.5}, {"Sun": PlanetPrecision(essential=0.2)})
+    path = cal.save(tmp_path / "cal.json")
+
+    loaded = load_calibration(str(path))
+    assert loaded.has("Sun", "essential")
+    norm = loaded.normalize({"Sun": 0.5, "Moon": 0.5})
+    assert norm["Sun"] == pytest.approx(0.5, abs=0.02) and norm["Moon"] > 0.99
+
+    monkeypatch.setattr(settings, "PRECISION_CALIBRATION_PATH", str(path))
+    assert normalize_influence({"Sun": 0.5, "Moon": 0.3}, mode="percentile")["Moon"] == pytest.approx(0.5, abs=0.02)
+    # an uncalibrated planet → whole map falls back to min–max
+    assert normalize_influence({"Sun": 0.5, "Pluto": 0.1}, mode="percentile") == {"Sun": 1.0, "Pluto": 0.0}
+    with pytest.raises(ValueError):
+        normalize_influence({"Sun": 0.5}, mode="percentiles")
+    # batch form: same scale and fallback, row by row
+    raw = np.array([[0.5, 0.3], [0.45, 0.35]])
+    batch = normalize_influence_batch(raw, ["Sun", "Moon"], mode="percentile")
+    for row, out in zip(raw, batch):
+        single = normalize_influence({"Sun": row[0], "Moon": row[1]}, mode="percentile")
+        assert out == pytest.approx([single["Sun"], single["Moon"]], abs=1e-4)
+    assert normalize_influence_batch(raw, ["Sun", "Pluto"], mode="percentile").tolist() == [[1.0, 0.0], [1.0, 0.0]]
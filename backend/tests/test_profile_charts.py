@@ -0,0 +1,162 @@
+# backend/tests/test_profile_charts.py
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.main import app
+from backend.astro_engine.astro_config import CHART_ENGINE_VERSION
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.context_builder import build_motion_contexts
+from backend.astro_engine.packed_chart import PackedChart, pack_chart, unpack_charts
+from backend.core.db import Base, get_db
+from backend.models.profile import Profile
+from backend.routers.users import get_current_user
+from backend.services import profile_charts
+from backend.services.profile_charts import ensure_chart_columns, load_profile_charts, recompute_stale
+
+BIRTH = (datetime(1977, 11, 16, 0, 10), 33.8938, 35.5018, "Asia/Beirut")
+
+
+def _engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'charts.db'}")
+    Base.metadata.create_all(engine, tables=[Profile.__table__])
+    return engine
+
+
+def _rows(n, user_id=None):
+    return [
+        {"id": uuid.uuid4(), "user_id": user_id, "name": f"p{k}", "birth_datetime": datetime(1980 + k, 5, 1, 12, tzinfo=timezone.utc),
+         "lat": 48.85, "lon": 2.35, "tz_name": "Europe/Paris"}
+        for k in range(n)
+    ]
+
+
+def test_pack_round_trip_and_bulk_unpack():
+    chart = build_natal_chart(*BIRTH)
+    blob = pack_chart(chart)
+    assert len(blob) < 300
+    packed = PackedChart.from_bytes(blob)
+    assert packed.bodies == [p.name for p in chart.planets]
+    assert np.allclose(packed["lon"], [p.lon for p in chart.planets], atol=1e-4)
+    assert packed["house"].tolist() == [p.house for p in chart.planets]
+    assert np.allclose(packed["cusps"], [h.lon for h in chart.houses], atol=1e-4)
+    data = packed.to_dict()
+    assert data["sect"] == chart.sect and data["house_system"] == chart.house_system
+    retro = {p.name for p in chart.planets if p.speed < 0}
+    assert {n for n, b in data["bodies"].items() if b["retrograde"]} == retro
+
+    traditional = build_natal_chart(*BIRTH, body_set="traditional")
+    other = pack_chart(traditional)
+    charts = unpack_charts([blob, other, blob])
+    assert [len(c.bodies) for c in charts] == [10, 9, 10]
+    assert charts[1].bodies[-1] == "South Node"
+    # retrograde agrees with the precision contexts (nodes move backwards by default)
+    contexts = build_motion_contexts(traditional.planets)
+    assert {n: b["retrograde"] for n, b in charts[1].to_dict()["bodies"].items()} == \
+        {n: c["is_retrograde"] for n, c in contexts.items()}
+
+
+def test_lazy_recompute_and_backfill(tmp_path, monkeypatch):
+    engine = _engine(tmp_path)
+    rows = _rows(5)
+    with engine.begin() as conn:
+        conn.execute(insert(Profile.__table__), rows)
+
+    db = sessionmaker(bind=engine)()
+    loaded = load_profile_charts(db)
+    assert sorted(row.name for row, _ in loaded) == [r["name"] for r in rows]
+    with engine.connect() as conn:
+        versions = conn.execute(select(Profile.chart_version)).scalars().all()
+    assert versions == [CHART_ENGINE_VERSION] * 5  # written back on first read
+
+    monkeypatch.setattr(profile_charts, "CHART_ENGINE_VERSION", CHART_ENGINE_VERSION + 1)
+    assert recompute_stale(engine, batch_size=2) == (5, 0)
+    assert recompute_stale(engine, batch_size=2) == (0, 0)
+    charts = load_profile_charts(db, ids=[rows[0]["id"]])
+    assert len(charts) == 1 and charts[0][1].engine_version == CHART_ENGINE_VERSION + 1
+    db.close()
+
+
+def test_ensure_columns_and_charts_endpoint(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE profiles (id CHAR(32) PRIMARY KEY, user_id CHAR(32), name VARCHAR(100), "
+                          "birth_datetime DATETIME, city VARCHAR(120), country VARCHAR(120), lat FLOAT, lon FLOAT, "
+                          "tz_name VARCHAR(80), created_at DATETIME)"))
+    assert ensure_chart_columns(engine) == ["chart_packed", "chart_version"]
+    assert ensure_chart_columns(engine) == []
+    me, other = uuid.uuid4(), uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(insert(Profile.__table__), _rows(3, me) + _rows(2, other))
+
+    Local = sessionmaker(bind=engine)
+
+    def override():
+        db = Local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    client = TestClient(app)
+    app.dependency_overrides[get_db] = override
+    try:
+        assert client.get("/profiles/charts").status_code == 401
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=me)
+        resp = client.get("/profiles/charts", params={"limit": 2})
+        everything = client.get("/profiles/charts").json()["profiles"]
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+    assert resp.status_code == 200, resp.text
+    profiles = resp.json()["profiles"]
+    assert len(profiles) == 2 and set(profiles[0]["chart"]["bodies"]) >= {"Sun", "Moon"}
+    assert len(everything) == 3  # only the current user's profiles
+
+
+def test_polar_birth_and_failing_chart_do_not_block_insert(tmp_path, monkeypatch):
+    # Placidus is undefined at Tromsø: cusps fall back to Porphyry
+    polar = build_natal_chart(datetime(1990, 1, 1, 12), 69.65, 18.96, "Europe/Oslo")
+    assert len(polar.houses) == 12 and polar.house_system == "placidus"
+
+    profile_charts.enable_chart_precompute()
+    profile_charts.enable_chart_precompute()      # registers once
+    engine = _engine(tmp_path)
+    db = sessionmaker(bind=engine)()
+
+    def boom(profile):
+        raise RuntimeError("engine down")
+
+    monkeypatch.setattr(profile_charts, "chart_columns", boom)
+    db.add(Profile(**_rows(1)[0]))
+    db.commit()
+    row = db.execute(select(Profile.name, Profile.chart_packed, Profile.chart_version)).one()
+    assert row == ("p0", None, None)
+    db.close()
+
+
+def test_failing_chart_is_skipped_not_fatal(tmp_path, monkeypatch):
+    engine = _engine(tmp_path)
+    rows = _rows(3)
+    with engine.begin() as conn:
+        conn.execute(insert(Profile.__table__), rows)
+    real = profile_charts.chart_columns
+
+    def flaky(row):
+        if row.name == "p1":
+            raise RuntimeError("no chart")
+        return real(row)
+
+    monkeypatch.setattr(profile_charts, "chart_columns", flaky)
+    db = sessionmaker(bind=engine)()
+    loaded = {row.name: chart for row, chart in load_profile_charts(db)}
+    assert loaded["p1"] is None and loaded["p0"].bodies[0] == "Sun" and loaded["p2"] is not None
+    with engine.connect() as conn:
+        stored = dict(conn.execute(select(Profile.name, Profile.chart_version)).all())
+    assert stored == {"p0": CHART_ENGINE_VERSION, "p1": None, "p2": CHART_ENGINE_VERSION}
+    db.close()
@@ -0,0 +1,88 @@
+# backend/tests/test_profile_import.py
+import json
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, func, select
+
+from backend.core.db import Base
+from backend.models.profile import Profile
+from backend.services import profile_import
+from backend.services.profile_import import import_profiles, iter_rows
+
+CSV = """name,birth_datetime,lat,lon,tz_name,city
+Ada,1977-11-16T00:10:00,33.8938,35.5018,,Beirut
+Ben,1984-03-02T14:45:00,48.8566,2.3522,Europe/Paris,Paris
+,1990-01-01T00:00:00,10,10,,
+Cy,not-a-date,40.7128,-74.0060,,
+Di,1991-07-21T06:30:00,95,-74.0060,,
+Ed,1991-07-21T06:30:00+00:00,40.7128,-74.0060,,New York
+"""
+
+
+def _engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    Base.metadata.create_all(engine, tables=[Profile.__table__])
+    return engine
+
+
+def test_csv_import_batches_and_failed_rows(tmp_path):
+    src = tmp_path / "partner.csv"
+    src.write_text(CSV)
+    failed = tmp_path / "failed.ndjson"
+    engine = _engine(tmp_path)
+    batches = []
+
+    report = import_profiles(iter_rows(src), engine, batch_size=2, failed_path=failed,
+                             after_batch=lambda rows: batches.append(len(rows)))
+    assert (report.read, report.imported, report.failed) == (6, 3, 3)
+    assert batches == [2, 1] and report.rows_per_second > 0
+
+    bad = [json.loads(line) for line in failed.read_text().splitlines()]
+    assert [b["line"] for b in bad] == [4, 5, 6]
+    assert any(e.startswith("lat") for e in bad[2]["errors"])
+
+    with engine.connect() as conn:
+        rows = {r.name: r for r in conn.execute(select(Profile.__table__))}
+    assert rows["Ada"].tz_name == "Asia/Beirut"
+    # naive times are local: 00:10 in Beirut (UTC+2) is 22:10 UTC the day before
+    assert rows["Ada"].birth_datetime.replace(tzinfo=timezone.utc) == datetime(1977, 11, 15, 22, 10, tzinfo=timezone.utc)
+    assert rows["Ed"].birth_datetime.hour == 6
+
+
+def test_ndjson_import_reports_unparseable_lines(tmp_path):
+    src = tmp_path / "partner.ndjson"
+    src.write_text(
+        json.dumps({"name": "Ada", "birth_datetime": "1977-11-16T00:10:00", "lat": 33.89, "lon": 35.5}) + "\n"
+        "{broken\n"
+        "\n"
+        "[1, 2]\n"
+    )
+    failed = tmp_path / "failed.ndjson"
+    engine = _engine(tmp_path)
+    report = import_profiles(iter_rows(src), engine, failed_path=failed)
+    assert (report.imported, report.failed) == (1, 2)
+    assert [json.loads(line)["line"] for line in failed.read_text().splitlines()] == [2, 4]
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(Profile.__table__)).scalar() == 1
+
+
+def test_chart_failure_inserts_row_without_chart(tmp_path, monkeypatch):
+    src = tmp_path / "partner.csv"
+    src.write_text(CSV)
+    failed = tmp_path / "failed.ndjson"
+    engine = _engine(tmp_path)
+    real = profile_import.chart_columns
+
+    def flaky(profile):
+        if profile.name == "Ben":
+            raise RuntimeError("no cusps")
+        return real(profile)
+
+    monkeypatch.setattr(profile_import, "chart_columns", flaky)
+    report = import_profiles(iter_rows(src), engine, batch_size=10, failed_path=failed, store_charts=True)
+    assert (report.imported, report.failed, report.charts_missing) == (3, 3, 1)
+    assert [json.loads(line)["line"] for line in failed.read_text().splitlines()] == [4, 5, 6]
+    with engine.connect() as conn:
+        rows = {r.name: r for r in conn.execute(select(Profile.__table__))}
+    assert rows["Ben"].chart_packed is None and rows["Ben"].chart_version is None
+    assert rows["Ada"].chart_packed is not None
@@ -0,0 +1,85 @@
+# backend/tests/test_rectification.py
+from datetime import datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.astro_engine.house_batch import nutation_frame, sidereal_degrees, placidus_batch
+from backend.astro_engine.rectification import rectify_birth_time
+
+client = TestClient(app)
+
+EVENTS = [
+    {"date": "1999-09-01", "kind": "relocation"},
+    {"date": "2001-06-15", "kind": "marriage"},
+    {"date": "2005-03-01", "kind": "career"},
+]
+
+
+def test_vectorized_placidus_matches_swiss_ephemeris():
+    jd, lat, lon = 2443463.5, 33.8938, 35.5018
+    eps, eq_eq = nutation_frame(jd)
+    armc = (sidereal_degrees(np.array([jd]), eq_eq) + lon) % 360.0
+    cusps, asc, mc = placidus_batch(armc, np.array([lat]), eps)
+    ref, ascmc = swe.houses_ex(jd, lat, lon, b"P")
+    diff = np.abs((cusps[0] - np.array(ref) + 180.0) % 360.0 - 180.0)
+    assert diff.max() < 0.01
+    assert abs(asc[0] - ascmc[0]) < 0.01
+
+
+def test_rectification_ranks_and_reports_timings():
+    res = rectify_birth_time(
+        datetime(1977, 11, 15, 22, 0), datetime(1977, 11, 16, 2, 0),
+        33.8938, 35.5018, EVENTS, tz_name="Asia/Beirut", top_k=5,
+    )
+    cands = res["candidates"]
+    assert len(cands) == 5
+    assert cands == sorted(cands, key=lambda c: -c["score"])
+    assert res["stats"]["candidates"] == 241
+    assert "total" in res["stats"]["timings_ms"]
+
+
+def test_custom_scorer_plugs_in():
+    target = 2443463.5  # 1977-11-16 00:00 UT
+
+    def closest_to_target(batch, event):
+        return -np.abs(batch.jds - target)
+
+    kwargs = dict(tz_name="Asia/Beirut", scorers=[closest_to_target], top_k=1)
+    serial = rectify_birth_time(datetime(1977, 11, 15, 22), datetime(1977, 11, 16, 4), 33.8938, 35.5018, EVENTS, **kwargs)
+    assert serial["candidates"][0]["dt_utc"].startswith("1977-11-16T00:00")
+
+
+def test_rectify_endpoint():
+    payload = {
+        "window_start": "1977-11-15T23:00:00",
+        "window_end": "1977-11-16T01:00:00",
+        "lat": 33.8938,
+        "lon": 35.5018,
+        "tz_name": "Asia/Beirut",
+        "events": EVENTS,
+        "top_k": 3,
+        "workers": 2,
+    }
+    resp = client.post("/astro/rectify", json=payload)
+    assert resp.status_code == 200, resp.text
+    assert len(resp.json()["candidates"]) == 3
+
+
+def test_rectify_request_bounds():
+    base = {
+        "window_start": "1977-11-15T23:00:00",
+        "window_end": "1977-11-16T01:00:00",
+        "lat": 33.8938,
+        "lon": 35.5018,
+        "events": EVENTS,
+    }
+    for bad in ({"step_minutes": 0}, {"top_k": 0}, {"workers": 1000},
+                {"window_end": "1977-12-30T00:00:00"}, {"step_minutes": 0.001}):
+        assert client.post("/astro/rectify", json={**base, **bad}).status_code == 422, bad
+    with pytest.raises(ValueError):
+        rectify_birth_time(datetime(1977, 11, 15, 23), datetime(1977, 11, 16, 1), 33.8938, 35.5018,
+                           EVENTS, tz_name="Asia/Beirut", step_minutes=0)
@@ -0,0 +1,75 @@
+# backend/tests/test_relationship_charts.py
+from datetime import datetime
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.relationship_charts import circular_midpoints, geo_midpoints, relationship_charts
+from backend.astro_engine.time_utils import from_julian_day
+
+client = TestClient(app)
+BIRTHS = [
+    (datetime(1977, 11, 16, 0, 10), 33.8938, 35.5018, "Asia/Beirut"),
+    (datetime(1984, 3, 2, 14, 45), 48.8566, 2.3522, "Europe/Paris"),
+    (datetime(1991, 7, 21, 6, 30), 40.7128, -74.0060, "America/New_York"),
+]
+
+
+def _sep(a, b):
+    return np.abs((np.asarray(a) - np.asarray(b) + 180.0) % 360.0 - 180.0)
+
+
+def test_circular_and_geo_midpoints():
+    assert np.allclose(circular_midpoints([350.0, 10.0, 100.0], [20.0, 200.0, 120.0]), [5.0, 285.0, 110.0])
+    lat, lon = geo_midpoints([0.0, 10.0], [170.0, 20.0], [0.0, 10.0], [-170.0, 20.0])
+    assert np.allclose(lat, [0.0, 10.0]) and np.allclose(_sep(lon, [180.0, 20.0]), 0.0)
+
+
+def test_composite_matches_pairwise_midpoints():
+    table = relationship_charts(BIRTHS, include_davison=False)
+    assert table["pairs"] == [[0, 1], [0, 2], [1, 2]]
+    charts = [build_natal_chart(*b) for b in BIRTHS]
+    comp = table["composite"]
+    for row, (a, b) in enumerate(table["pairs"]):
+        la = {p.name: p.lon for p in charts[a].planets}
+        lb = {p.name: p.lon for p in charts[b].planets}
+        expected = [circular_midpoints(la[n], lb[n]) for n in table["bodies"]]
+        assert np.all(_sep(comp["lons"][row], expected) < 1e-5)
+        # cusps stay in zodiacal order from the composite ASC
+        spans = (np.array(comp["cusps"][row]) - comp["asc"][row]) % 360.0
+        assert spans[0] < 1e-5 and np.all(np.diff(spans) > 0)
+        assert all(1 <= h <= 12 for h in comp["houses"][row])
+
+
+def test_davison_matches_chart_at_midpoint():
+    table = relationship_charts(BIRTHS)
+    dav = table["davison"]
+    for row in range(len(table["pairs"])):
+        dt_utc = from_julian_day(dav["jd"][row]).replace(tzinfo=None)
+        chart = build_natal_chart(dt_utc, dav["lat"][row], dav["lon"][row], tz_name="UTC")
+        by_name = {p.name: p for p in chart.planets}
+        assert _sep(dav["asc"][row], chart.asc.lon) < 0.01
+        for name, lon, house in zip(table["bodies"], dav["lons"][row], dav["houses"][row]):
+            assert _sep(lon, by_name[name].lon) < 1e-3
+            assert house == by_name[name].house
+
+
+def test_relationships_endpoint():
+    payload = {
+        "people": [
+            {"dt_local": dt.isoformat(), "lat": lat, "lon": lon, "tz_name": tz, "name": f"p{i}"}
+            for i, (dt, lat, lon, tz) in enumerate(BIRTHS)
+        ],
+        "house_system": "koch",
+        "zodiac": "lahiri",
+    }
+    resp = client.post("/astro/relationships", json=payload)
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert len(data["composite"]["cusps"]) == 3 and len(data["davison"]["houses"][0]) == len(data["bodies"])
+    assert data["name"] == ["p0", "p1", "p2"]
+
+    resp = client.post("/astro/relationships", json={"people": payload["people"][:1]})
+    assert resp.status_code == 400
@@ -0,0 +1,48 @@
+# backend/tests/test_relocation.py
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.astro_engine.astro_config import RELOCATION_MAX_LOCATIONS
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.astro_engine.relocation import relocate_chart_batch
+
+client = TestClient(app)
+BIRTH = datetime(1977, 11, 16, 0, 10)
+CITIES = [(33.8938, 35.5018), (48.8566, 2.3522), (40.7128, -74.0060), (-33.8688, 151.2093)]
+
+
+def test_relocation_matches_full_chart_per_city():
+    table = relocate_chart_batch(BIRTH, 33.8938, 35.5018, CITIES, tz_name="Asia/Beirut")
+    assert len(table["asc"]) == len(CITIES)
+
+    for row, (lat, lon) in enumerate(CITIES):
+        # Same instant: keep the birthplace timezone
+        chart = build_natal_chart(BIRTH, lat, lon, tz_name="Asia/Beirut")
+        assert abs(((table["asc"][row] - chart.asc.lon) + 180) % 360 - 180) < 0.01
+        expected = [p.house for p in chart.planets]
+        assert table["houses"][row] == expected
+
+
+def test_relocate_endpoint_compact_table():
+    payload = {
+        "dt_local": "1977-11-16T00:10:00",
+        "lat": 33.8938,
+        "lon": 35.5018,
+        "tz_name": "Asia/Beirut",
+        "locations": [{"lat": lat, "lon": lon} for lat, lon in CITIES] + [{"lat": 78.2, "lon": 15.6, "name": "Longyearbyen"}],
+    }
+    resp = client.post("/astro/relocate", json=payload)
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert len(data["cusps"]) == 5 and len(data["cusps"][0]) == 12
+    assert len(data["houses"][4]) == len(data["bodies"])
+    assert data["name"][-1] == "Longyearbyen"
+
+
+def test_relocate_endpoint_rejects_bad_locations():
+    base = {"dt_local": "1977-11-16T00:10:00", "lat": 33.8938, "lon": 35.5018, "tz_name": "Asia/Beirut"}
+    for locations in ([{"lat": 91, "lon": 0}], [{"lat": 0, "lon": -181}],
+                      [{"lat": 0, "lon": 0}] * (RELOCATION_MAX_LOCATIONS + 1)):
+        assert client.post("/astro/relocate", json={**base, "locations": locations}).status_code == 422
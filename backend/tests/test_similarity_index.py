@@ -0,0 +1,102 @@
+# backend/tests/test_similarity_index.py
+import uuid
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.core.db import Base
+from backend.models.profile import Profile
+from backend.services import similarity_index
+from backend.services.chart_embedding import EMBEDDING_DIM, chart_embedding
+from backend.services.similarity_index import (
+    SimilarityIndex, brute_force_search, enable_profile_indexing, index_profiles,
+)
+
+
+def _clustered(n, dim, seed=0):
+    centers = np.random.default_rng(0).normal(size=(40, dim))    # same clusters for data and queries
+    rng = np.random.default_rng(seed)
+    x = centers[rng.integers(0, 40, n)] + 0.6 * rng.normal(size=(n, dim))
+    return (x / np.linalg.norm(x, axis=1, keepdims=True)).astype(np.float32)
+
+
+def test_chart_embedding_is_unit_float32():
+    chart = build_natal_chart(datetime(1990, 6, 15, 13, 0), 51.5, -0.12, "Europe/London")
+    vec = chart_embedding(chart)
+    assert vec.dtype == np.float32 and vec.shape == (EMBEDDING_DIM,)
+    assert abs(float(np.linalg.norm(vec)) - 1.0) < 1e-5
+
+
+def test_ivf_recall_incremental_insert_and_reload(tmp_path):
+    dim = 32
+    data = _clustered(6000, dim)
+    index = SimilarityIndex(tmp_path, dim=dim, nlist=16, nprobe=4)
+    index.add([f"p{k}" for k in range(5000)], data[:5000])   # crosses the training threshold
+    assert index.index.trained
+    index.add([f"p{k}" for k in range(5000, 6000)], data[5000:])
+
+    queries = _clustered(50, dim, seed=1)
+    recall = []
+    for q in queries:
+        exact, _ = brute_force_search(data, q, 10)
+        got = {pid for pid, _ in index.search(q, 10)}
+        recall.append(len(got & {f"p{r}" for r in exact}) / 10)
+    assert np.mean(recall) >= 0.9
+
+    # a row added after training is found as its own nearest neighbour
+    assert index.search(data[5999], 1)[0][0] == "p5999"
+    assert "p5999" not in {pid for pid, _ in index.search(data[5999], 5, exclude=["p5999"])}
+
+    index.save()
+    reopened = SimilarityIndex(tmp_path, dim=dim, nlist=16, nprobe=4)
+    assert len(reopened) == 6000 and reopened.index.trained
+    assert reopened.search(data[123], 1)[0][0] == "p123"
+
+
+def test_index_profiles(tmp_path):
+    index = SimilarityIndex(tmp_path)
+    profile = Profile(id=uuid.uuid4(), name="A", birth_datetime=datetime(1990, 6, 15, 13, 0),
+                      lat=51.5, lon=-0.12, tz_name="Europe/London")
+    assert index_profiles([profile, Profile(id=uuid.uuid4(), name="B")], index) == 1
+    chart = build_natal_chart(datetime(1990, 6, 15, 13, 0), 51.5, -0.12, "Europe/London")
+    pid, score = index.search(chart_embedding(chart), 1)[0]
+    assert pid == str(profile.id) and score > 0.999
+
+
+def test_rows_survive_reopen_without_save(tmp_path):
+    dim = 32
+    data = _clustered(700, dim)
+    index = SimilarityIndex(tmp_path, dim=dim, nlist=16, nprobe=4)
+    index.add([f"p{k}" for k in range(650)], data[:650])      # trains and saves the quantizer
+    index.add(["late"], data[650:651])                          # as the after-commit hook does
+    reopened = SimilarityIndex(tmp_path, dim=dim, nlist=16, nprobe=4)
+    assert len(reopened) == 651 and reopened.index.trained
+    assert reopened.search(data[650], 1)[0][0] == "late"
+
+
+def test_indexing_failure_does_not_break_commit(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profiles.db'}")
+    Base.metadata.create_all(engine, tables=[Profile.__table__])
+    calls = []
+
+    def boom(profiles, index=None):
+        calls.append(len(profiles))
+        raise RuntimeError("index unavailable")
+
+    monkeypatch.setattr(similarity_index, "index_profiles", boom)
+    enable_profile_indexing(SimilarityIndex(tmp_path / "index"))
+    enable_profile_indexing(SimilarityIndex(tmp_path / "index"))      # registers once
+    try:
+        db = sessionmaker(bind=engine)()
+        db.add(Profile(id=uuid.uuid4(), name="A", birth_datetime=datetime(1990, 6, 15, 13, 0),
+                       lat=51.5, lon=-0.12, tz_name="Europe/London"))
+        db.commit()
+        assert calls == [1]
+        assert db.execute(select(Profile.name)).scalar_one() == "A"
+        db.close()
+    finally:
+        event.remove(Profile, "after_insert", similarity_index._collect_new_profile)
+        event.remove(Session, "after_commit", similarity_index._index_new_profiles)
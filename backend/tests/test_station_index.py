@@ -0,0 +1,29 @@
+# backend/tests/test_station_index.py
+from datetime import datetime
+
+from backend.astro_engine.station_index import station_index_for_year, STATION_RETROGRADE
+from backend.astro_engine.time_utils import to_julian_day
+
+
+def test_mercury_retrograde_2023():
+    idx = station_index_for_year(2023)
+    assert idx.is_retrograde("Mercury", to_julian_day(datetime(2023, 5, 1)))
+    assert not idx.is_retrograde("Mercury", to_julian_day(datetime(2023, 6, 1)))
+
+    # Station retrograde on 2023-04-21 (~08:35 UT)
+    jd, kind = idx.next_station("Mercury", to_julian_day(datetime(2023, 4, 1)))
+    assert kind == STATION_RETROGRADE
+    assert abs(jd - to_julian_day(datetime(2023, 4, 21, 8, 35))) < 0.05
+
+    periods = idx.retrograde_periods("Mercury")
+    assert all(p["shadow_start"] <= p["station_retrograde"] for p in periods)
+    assert idx.in_shadow("Mercury", to_julian_day(datetime(2023, 4, 10)))
+
+
+def test_sun_ingress_into_aries():
+    idx = station_index_for_year(2023)
+    jd, sign = idx.next_ingress("Sun", to_julian_day(datetime(2023, 3, 1)))
+    assert sign == "Aries"
+    # March equinox 2023-03-20 21:24 UT
+    assert abs(jd - to_julian_day(datetime(2023, 3, 20, 21, 24))) < 0.01
+    assert not any(idx.retrograde_flags(jd)[b] for b in ("Sun", "Moon"))
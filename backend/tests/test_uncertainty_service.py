@@ -0,0 +1,67 @@
+# backend/tests/test_uncertainty_service.py
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.astro_engine.chart_generator import build_natal_chart
+from backend.services.uncertainty_service import analyze_birth_time_uncertainty
+
+client = TestClient(app)
+LAT, LON = 33.8938, 35.5018
+
+
+def test_uncertainty_batch_shape_and_latency():
+    chart = build_natal_chart(datetime(1977, 11, 16, 0, 10), LAT, LON, "Asia/Beirut")
+    res = analyze_birth_time_uncertainty(chart, LAT, LON, 30.0, samples=500)
+
+    assert res["samples"] == 500
+    assert set(res["stable"]) | set(res["unstable"]) >= {"Sun", "Moon", "Ascendant", "MC"}
+    lo, mid, hi = res["precision_norm_ci"]["Sun"]
+    assert 0.0 <= lo <= mid <= hi <= 1.0
+    assert "house" in res["precision_axes_ci"]["Mars"]
+    # Interactive budget: 500 samples within 200 ms
+    assert res["elapsed_ms"] < 200
+
+
+def test_narrow_window_keeps_slow_planets_stable():
+    chart = build_natal_chart(datetime(1977, 11, 16, 0, 10), LAT, LON, "Asia/Beirut")
+    res = analyze_birth_time_uncertainty(chart, LAT, LON, 1.0, samples=100)
+    assert "Pluto" in res["stable"]
+    assert res["placements"]["Pluto"]["sign_probabilities"] == {"Libra": 1.0}
+
+
+def test_compute_endpoint_uncertainty_mode():
+    payload = {
+        "dt_local": "1977-11-16T00:10:00",
+        "lat": LAT,
+        "lon": LON,
+        "tz_name": "Asia/Beirut",
+        "birth_time_uncertainty_minutes": 45,
+        "uncertainty_samples": 200,
+    }
+    resp = client.post("/astro/compute", json=payload)
+    assert resp.status_code == 200, resp.text
+    unc = resp.json()["uncertainty"]
+    assert unc["samples"] == 200
+    assert "Ascendant" in unc["angles"]
+    for bad in ({"uncertainty_samples": 10**7}, {"uncertainty_samples": 1},
+                {"birth_time_uncertainty_minutes": 10**6}, {"birth_time_uncertainty_minutes": -5}):
+        assert client.post("/astro/compute", json={**payload, **bad}).status_code == 422, bad
+
+
+def test_sign_changes_reach_dignity_and_contexts():
+    # ±12 h: the Moon moves from Aquarius into Pisces, the Sun crosses the horizon
+    chart = build_natal_chart(datetime(1990, 5, 17, 14, 30), 40.71, -74.0, "America/New_York")
+    res = analyze_birth_time_uncertainty(chart, 40.71, -74.0, 720.0, samples=400)
+    assert set(res["placements"]["Moon"]["sign_probabilities"]) == {"Aquarius", "Pisces"}
+    lo, _, hi = res["precision_axes_ci"]["Moon"]["essential"]
+    assert hi > lo
+
+
+def test_extended_body_set_is_sampled():
+    chart = build_natal_chart(datetime(1977, 11, 16, 0, 10), LAT, LON, "Asia/Beirut", body_set="extended")
+    res = analyze_birth_time_uncertainty(chart, LAT, LON, 30.0, samples=200)
+    names = {p.name for p in chart.planets}
+    assert set(res["placements"]) | set(res["skipped_bodies"]) == names
+    assert {"North Node", "South Node"} <= set(res["precision_norm_ci"])
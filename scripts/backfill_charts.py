@@ -0,0 +1,43 @@
+"""
+Stored chart backfill
+---------------------
+Packs the natal chart of every profile whose stored chart is missing or
+was computed by an older engine version (CHART_ENGINE_VERSION), in
+batched transactions. Adds the chart columns to an existing table first.
+
+    python scripts/backfill_charts.py --batch 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.astro_engine.astro_config import CHART_ENGINE_VERSION  # noqa: E402
+from backend.core.db import Base, engine  # noqa: E402
+from backend.models.profile import Profile  # noqa: E402
+from backend.services.profile_charts import ensure_chart_columns, recompute_stale  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(engine, tables=[Profile.__table__])
+    added = ensure_chart_columns(engine)
+    if added:
+        print(f"Added columns: {', '.join(added)}")
+
+    t0 = time.perf_counter()
+    updated, failed = recompute_stale(engine, batch_size=args.batch, limit=args.limit)
+    seconds = time.perf_counter() - t0
+    print(f"Recomputed {updated} charts (engine v{CHART_ENGINE_VERSION}) in {seconds:.1f}s"
+          f" ({updated / seconds if seconds else 0:.0f}/s); {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
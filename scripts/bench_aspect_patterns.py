@@ -0,0 +1,67 @@
+"""
+Aspect pattern benchmark
+------------------------
+Times bitset motif search against brute-force enumeration of every triple
+and quadruple of points, on random charts with 30+ points (planets,
+asteroids, angles, lots ...).
+
+    python scripts/bench_aspect_patterns.py --points 34 --charts 200
+"""
+
+import argparse
+import sys
+import time
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.astro_engine.aspect_patterns import AspectGraph, detect_aspect_patterns  # noqa: E402
+from backend.astro_engine.aspects_detector import detect_aspects  # noqa: E402
+
+
+def brute_force(graph: AspectGraph) -> int:
+    """Grand trines, T-squares, yods (triples) and grand crosses (quadruples) by enumeration."""
+    n = len(graph.names)
+    has = lambda a, b, asp: bool(graph.mask(asp, a) >> b & 1)
+    found = 0
+    for t in combinations(range(n), 3):
+        for a, b, c in ((t[0], t[1], t[2]), (t[0], t[2], t[1]), (t[1], t[2], t[0])):
+            found += has(a, b, "opposition") and has(a, c, "square") and has(b, c, "square")
+            found += has(a, b, "sextile") and has(a, c, "quincunx") and has(b, c, "quincunx")
+        found += has(t[0], t[1], "trine") and has(t[0], t[2], "trine") and has(t[1], t[2], "trine")
+    for q in combinations(range(n), 4):
+        for (a, b), (c, d) in (((q[0], q[1]), (q[2], q[3])), ((q[0], q[2]), (q[1], q[3])), ((q[0], q[3]), (q[1], q[2]))):
+            found += (has(a, b, "opposition") and has(c, d, "opposition")
+                      and all(has(x, y, "square") for x in (a, b) for y in (c, d)))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--points", type=int, default=34)
+    parser.add_argument("--charts", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    charts = [{f"P{k}": float(x) for k, x in enumerate(rng.uniform(0, 360, args.points))}
+              for _ in range(args.charts)]
+    aspects = [detect_aspects(c) for c in charts]
+    kinds = ("grand_trine", "t_square", "grand_cross", "yod")
+
+    t0 = time.perf_counter()
+    fast = sum(len(detect_aspect_patterns(a, names=list(c), kinds=kinds)) for a, c in zip(aspects, charts))
+    t1 = time.perf_counter()
+    slow = sum(brute_force(AspectGraph(a, names=list(c))) for a, c in zip(aspects, charts))
+    t2 = time.perf_counter()
+
+    print(f"{args.charts} charts × {args.points} points, {fast} patterns (brute force: {slow})")
+    print(f"  bitset search : {1000 * (t1 - t0) / args.charts:8.3f} ms/chart")
+    print(f"  brute force   : {1000 * (t2 - t1) / args.charts:8.3f} ms/chart")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Similar-chart search benchmark
+------------------------------
+Recall@K and query latency of the IVF index against exact brute force,
+on embeddings of random natal charts (births 1930–2010, UTC).
+
+    python scripts/bench_similarity.py --charts 50000 --queries 200 --nprobe 4 8 16 32
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.astro_engine.chart_generator import build_natal_chart  # noqa: E402
+from backend.services.chart_embedding import chart_embedding  # noqa: E402
+from backend.services.similarity_index import SimilarityIndex, brute_force_search  # noqa: E402
+
+EPOCH = datetime(1930, 1, 1)
+
+
+def random_embeddings(n: int, rng) -> np.ndarray:
+    days = rng.uniform(0, 80 * 365.25, n)
+    lats = rng.uniform(-55.0, 65.0, n)
+    lons = rng.uniform(-180.0, 180.0, n)
+    return np.stack([
+        chart_embedding(build_natal_chart(EPOCH + timedelta(days=float(d)), float(la), float(lo), "UTC"))
+        for d, la, lo in zip(days, lats, lons)
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--charts", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=256)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    t0 = time.perf_counter()
+    data = random_embeddings(args.charts, rng)
+    queries = random_embeddings(args.queries, rng)
+    print(f"Embedded {args.charts + args.queries} charts in {time.perf_counter() - t0:.1f}s (dim {data.shape[1]})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SimilarityIndex(tmp, dim=data.shape[1], nlist=args.nlist)
+        t0 = time.perf_counter()
+        index.add([str(k) for k in range(len(data))], data)
+        if not index.index.trained:
+            index.index.train()
+        print(f"Indexed in {time.perf_counter() - t0:.2f}s (nlist {index.index.nlist})")
+
+        t0 = time.perf_counter()
+        exact = [set(brute_force_search(index.store.vectors, q, args.k)[0].tolist()) for q in queries]
+        brute_ms = 1000 * (time.perf_counter() - t0) / len(queries)
+        print(f"  brute force      : {brute_ms:7.3f} ms/query, recall 1.000")
+
+        for nprobe in args.nprobe:
+            t0 = time.perf_counter()
+            found = [set(index.index.search(q, args.k, nprobe=nprobe)[0].tolist()) for q in queries]
+            ms = 1000 * (time.perf_counter() - t0) / len(queries)
+            recall = np.mean([len(f & e) / args.k for f, e in zip(found, exact)])
+            print(f"  IVF nprobe {nprobe:<5} : {ms:7.3f} ms/query, recall {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
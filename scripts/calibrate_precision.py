@@ -0,0 +1,66 @@
+"""
+Precision calibration
+---------------------
+Streams precision scores from a synthetic birth sample into per-planet /
+per-axis quantile sketches and saves them for percentile normalization
+(settings.PRECISION_NORMALIZATION = "percentile").
+
+    python scripts/calibrate_precision.py --samples 20000
+    python scripts/calibrate_precision.py --samples 0 --merge a.json b.json --out merged.json
+
+Births are uniform over 1930–2010 and over inhabited latitudes; times are
+taken as UTC, so no timezone lookup is needed.
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.astro_engine.chart_generator import build_natal_chart  # noqa: E402
+from backend.core.config import settings  # noqa: E402
+from backend.services.horoscope_service import compute_contextual_weights  # noqa: E402
+from backend.services.precision_calibration import PrecisionCalibration  # noqa: E402
+from backend.services.precision_summary_service import influence_score  # noqa: E402
+
+EPOCH = datetime(1930, 1, 1)
+SPAN_DAYS = (datetime(2010, 1, 1) - EPOCH).days
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compression", type=int, default=200)
+    parser.add_argument("--merge", nargs="*", default=[], help="existing sketch files to merge in")
+    parser.add_argument("--out", default=settings.PRECISION_CALIBRATION_PATH)
+    args = parser.parse_args()
+
+    calibration = PrecisionCalibration(args.compression)
+    for path in args.merge:
+        calibration.merge(PrecisionCalibration.load(path))
+
+    rng = np.random.default_rng(args.seed)
+    days = rng.uniform(0, SPAN_DAYS, args.samples)
+    lats = rng.uniform(-55.0, 65.0, args.samples)
+    lons = rng.uniform(-180.0, 180.0, args.samples)
+
+    t0 = time.perf_counter()
+    for k in range(args.samples):
+        chart = build_natal_chart(EPOCH + timedelta(days=float(days[k])), float(lats[k]), float(lons[k]), "UTC")
+        weights = compute_contextual_weights(chart)
+        calibration.observe({name: influence_score(w) for name, w in weights.items()}, weights)
+        if (k + 1) % 1000 == 0:
+            print(f"  {k + 1}/{args.samples} charts ({time.perf_counter() - t0:.1f}s)")
+
+    path = calibration.save(args.out)
+    print(f"Saved {len(calibration.sketches)} sketches → {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Chart export
+------------
+Streams natal charts and precision outputs into hive-partitioned Parquet
+(see backend/services/chart_export.py for the schema). Needs pyarrow (requirements/worker.txt).
+
+    python scripts/export_charts.py --out data/export/charts
+    python scripts/export_charts.py --synthetic 20000 --out /tmp/charts --partition-by birth_decade sect
+
+Stored profiles are read from the database in batches; `--synthetic N`
+exports N random UTC births instead (1930–2010, inhabited latitudes).
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.astro_engine.chart_generator import build_natal_chart  # noqa: E402
+from backend.core.db import SessionLocal  # noqa: E402
+from backend.models.profile import Profile  # noqa: E402
+from backend.services.chart_export import (  # noqa: E402
+    DEFAULT_PARTITIONING, EXPORT_BATCH_ROWS, MAX_ROWS_PER_FILE,
+    chart_record_batches, export_schema, profile_chart_rows, write_parquet_dataset,
+)
+
+EPOCH = datetime(1930, 1, 1)
+SPAN_DAYS = (datetime(2010, 1, 1) - EPOCH).days
+
+
+def synthetic_rows(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    for k in range(n):
+        lat, lon = float(rng.uniform(-55.0, 65.0)), float(rng.uniform(-180.0, 180.0))
+        dt = EPOCH + timedelta(days=float(rng.uniform(0, SPAN_DAYS)))
+        yield f"synthetic-{k}", build_natal_chart(dt, lat, lon, "UTC"), lat, lon
+
+
+def progress(batches):
+    rows, t0 = 0, time.perf_counter()
+    for batch in batches:
+        rows += batch.num_rows
+        print(f"  {rows} charts ({time.perf_counter() - t0:.1f}s)")
+        yield batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--out", default="data/export/charts")
+    parser.add_argument("--synthetic", type=int, default=0, help="export N random births instead of profiles")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--batch-rows", type=int, default=EXPORT_BATCH_ROWS)
+    parser.add_argument("--max-rows-per-file", type=int, default=MAX_ROWS_PER_FILE)
+    parser.add_argument("--partition-by", nargs="*", default=list(DEFAULT_PARTITIONING))
+    parser.add_argument("--no-precision", action="store_true", help="skip the precision columns")
+    args = parser.parse_args()
+
+    schema = export_schema(with_precision=not args.no_precision)
+    failed = []
+    with SessionLocal() as db:
+        if args.synthetic:
+            rows = synthetic_rows(args.synthetic, args.seed)
+        else:
+            rows = profile_chart_rows(db.query(Profile).yield_per(args.batch_rows), failed)
+        batches = chart_record_batches(islice(rows, args.limit), batch_rows=args.batch_rows,
+                                       with_precision=not args.no_precision)
+        out = write_parquet_dataset(progress(batches), args.out, schema, partition_by=args.partition_by,
+                                    max_rows_per_file=args.max_rows_per_file)
+    print(f"Wrote {out}")
+    if failed:
+        print(f"Skipped {len(failed)} profiles whose chart failed (see log)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Bulk profile import
+-------------------
+Streams birth records from a CSV (header row) or NDJSON file into
+`profiles` in batched transactions. Rows that fail validation or insert
+are written, with their errors, to a side file.
+
+    python scripts/import_profiles.py partner.csv --batch-size 2000
+    python scripts/import_profiles.py partner.ndjson --user-id <uuid> --index-similar
+    python scripts/import_profiles.py partner.csv --no-charts   # then scripts/backfill_charts.py
+
+Columns: name, birth_datetime (ISO 8601; naive = local time), lat, lon,
+and optionally tz_name, city, country, user_id.
+"""
+
+import argparse
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.core.db import Base, engine  # noqa: E402
+from backend.models.profile import Profile  # noqa: E402
+from backend.services.profile_charts import ensure_chart_columns  # noqa: E402
+from backend.services.profile_import import DEFAULT_BATCH_SIZE, import_profiles, iter_rows  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=("csv", "ndjson"), default=None, help="default: from the file suffix")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--failed", default=None, help="failed-rows file (default: <path>.failed.ndjson)")
+    parser.add_argument("--user-id", type=uuid.UUID, default=None, help="owner for rows without user_id")
+    parser.add_argument("--index-similar", action="store_true", help="add imported charts to the similarity index")
+    parser.add_argument("--no-charts", action="store_true", help="skip packing charts (backfill them later)")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(engine, tables=[Profile.__table__])
+    ensure_chart_columns(engine)
+    after_batch, index = None, None
+    if args.index_similar:
+        from backend.services.similarity_index import get_similarity_index, index_profiles
+
+        index = get_similarity_index()
+
+        def after_batch(rows):
+            index_profiles([Profile(**row) for row in rows], index)
+
+    failed = args.failed or f"{args.path}.failed.ndjson"
+    report = import_profiles(
+        iter_rows(args.path, args.format),
+        engine,
+        batch_size=args.batch_size,
+        failed_path=failed,
+        default_user_id=args.user_id,
+        after_batch=after_batch,
+        store_charts=not args.no_charts,
+        progress=lambda r: print(f"  {r.read} rows, {r.imported} imported, {r.failed} failed "
+                                 f"({r.rows_per_second:.0f} rows/s)"),
+    )
+    if index is not None:
+        index.save()
+    stats = report.to_dict()
+    print(f"Imported {stats['imported']} of {stats['read']} rows in {stats['seconds']}s "
+          f"({stats['rows_per_second']} rows/s); {stats['failed']} failed → {failed}")
+    if stats["charts_missing"]:
+        print(f"{stats['charts_missing']} rows stored without a chart; run scripts/backfill_charts.py")
+
+
+if __name__ == "__main__":
+    main()
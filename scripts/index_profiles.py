@@ -0,0 +1,45 @@
+"""
+Similar-chart index backfill
+----------------------------
+Embeds every stored Profile that is not yet in the similarity index and
+appends it, streaming rows from the database in batches.
+
+    python scripts/index_profiles.py --batch 500
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.core.db import SessionLocal  # noqa: E402
+from backend.models.profile import Profile  # noqa: E402
+from backend.services.similarity_index import get_similarity_index, index_profiles  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    index = get_similarity_index()
+    known = set(index.store.ids)
+    added = 0
+    with SessionLocal() as db:
+        batch = []
+        for profile in db.query(Profile).yield_per(args.batch):
+            if str(profile.id) in known:
+                continue
+            batch.append(profile)
+            if len(batch) >= args.batch:
+                added += index_profiles(batch, index)
+                batch = []
+                print(f"  indexed {added}")
+        added += index_profiles(batch, index)
+    index.save()
+    print(f"Indexed {added} new profiles ({len(index)} total)")
+
+
+if __name__ == "__main__":
+    main()